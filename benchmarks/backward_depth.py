@@ -0,0 +1,68 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import time
+import argparse
+import numpy as np
+from datetime import datetime
+from leaf import Tensor
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+parser = argparse.ArgumentParser(
+    prog='backward_depth',
+    description='Backwards pass cost as a function of graph depth'
+)
+parser.add_argument('-d', action='store', nargs='+', type=int,
+    default=[100, 1000, 10000, 100000])
+parser.add_argument('-s', action='store', nargs=2, type=int, default=[16, 16])
+parser.add_argument('-r', action='store', type=int, default=3)
+args = parser.parse_args()
+
+info(f'Running backwards pass benchmark with tensor shape {tuple(args.s)}\n')
+for depth in args.d:
+    timings = []
+    for _ in range(args.r):
+        x = Tensor(np.random.uniform(0.5, 1.0, size=args.s), requires_grad=True)
+        y = x
+        for _ in range(depth):
+            y = y.relu()
+        y = y.sum()
+
+        t_start = time.perf_counter()
+        y.backward()
+        timings.append(time.perf_counter() - t_start)
+
+    t_best = min(timings)
+    info(f'depth {depth:>8d}: {t_best * 1000.0:10.3f} ms, '
+         f'{t_best * 1e6 / depth:8.3f} us/node\n')
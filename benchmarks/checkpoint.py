@@ -0,0 +1,81 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import time
+import math
+import argparse
+import tracemalloc
+import numpy as np
+from datetime import datetime
+from leaf import Tensor, nn
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+def measure(model, x, repeats):
+    timings = []
+    for _ in range(repeats):
+        t_start = time.perf_counter()
+        model(x).sum().backward()
+        timings.append(time.perf_counter() - t_start)
+
+    tracemalloc.start()
+    y = model(x).sum()
+    activations, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    y.backward()
+    return min(timings), activations
+
+parser = argparse.ArgumentParser(
+    prog='checkpoint',
+    description='leaf training step time and activation memory with activation checkpointing'
+)
+parser.add_argument('-d', action='store', type=int, default=64)
+parser.add_argument('-w', action='store', type=int, default=512)
+parser.add_argument('-b', action='store', type=int, default=256)
+parser.add_argument('-k', action='store', nargs='+', type=int, default=None)
+parser.add_argument('-r', action='store', type=int, default=3)
+args = parser.parse_args()
+
+layers = []
+for _ in range(args.d):
+    layers += [nn.Linear(args.w, args.w), nn.ReLU()]
+x = Tensor(np.random.uniform(-1.0, 1.0, size=(args.b, args.w)).astype(np.float32))
+segments = args.k or [int(math.sqrt(len(layers)))]
+
+info(f'Running checkpoint benchmark, {len(layers)} modules of width {args.w} batch {args.b}\n')
+t_plain, m_plain = measure(nn.Sequential(*layers), x, args.r)
+info(f'{"plain":>16s}: {t_plain * 1000.0:9.3f} ms {m_plain / 2**20:9.2f} MiB\n')
+for k in segments:
+    t, m = measure(nn.Sequential(*layers, checkpoint_every=k), x, args.r)
+    info(f'{f"every {k}":>16s}: {t * 1000.0:9.3f} ms {m / 2**20:9.2f} MiB ' \
+         f'({t / t_plain - 1.0:+.0%} time, {m / m_plain:.0%} memory)\n')
@@ -0,0 +1,76 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+from datetime import datetime
+from leaf import Tensor
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+def best_time(func, repeats):
+    timings = []
+    for _ in range(repeats):
+        t_start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - t_start)
+    return min(timings)
+
+parser = argparse.ArgumentParser(
+    prog='construction',
+    description='Tensor construction overhead, copying versus wrapping'
+)
+parser.add_argument('-n', action='store', nargs='+', type=int,
+    default=[1 << 10, 1 << 16, 1 << 20, 1 << 24])
+parser.add_argument('-r', action='store', type=int, default=5)
+args = parser.parse_args()
+
+info(f'Running Tensor construction benchmark on float32 arrays\n')
+with tempfile.TemporaryDirectory() as directory:
+    for n in args.n:
+        data = np.random.uniform(size=n).astype(np.float32)
+        path = os.path.join(directory, f'{n}.npy')
+        np.save(path, data)
+        mapped = np.load(path, mmap_mode='r')
+
+        t_copy = best_time(lambda: Tensor(data), args.r)
+        t_wrap = best_time(lambda: Tensor(data, copy=False), args.r)
+        t_mmap_copy = best_time(lambda: Tensor(mapped), args.r)
+        t_mmap_wrap = best_time(lambda: Tensor.from_numpy(mapped), args.r)
+        info(f'{n:>10d} elements, ndarray copy: {t_copy * 1e6:10.2f} us '
+             f'wrap: {t_wrap * 1e6:8.2f} us, memmap copy: {t_mmap_copy * 1e6:10.2f} us '
+             f'wrap: {t_mmap_wrap * 1e6:8.2f} us\n')
+        del mapped
@@ -0,0 +1,89 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import time
+import argparse
+import numpy as np
+import torch
+import torch.nn.functional as F
+from datetime import datetime
+from leaf import Tensor
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+def measure(func, x, w, backward, repeats):
+    timings = []
+    for _ in range(repeats):
+        x.grad = w.grad = None
+        t_start = time.perf_counter()
+        result = func(x, w)
+        if backward:
+            result.sum().backward()
+        timings.append(time.perf_counter() - t_start)
+    return min(timings)
+
+parser = argparse.ArgumentParser(
+    prog='conv2d',
+    description='leaf vs torch 2D convolution, forward and backward'
+)
+parser.add_argument('-n', action='store', type=int, default=32)
+parser.add_argument('-c', action='store', nargs=2, type=int, default=[32, 64])
+parser.add_argument('-s', action='store', type=int, default=32)
+parser.add_argument('-k', action='store', type=int, default=3)
+parser.add_argument('--stride', action='store', type=int, default=1)
+parser.add_argument('--device', action='store', type=str, default='cpu')
+parser.add_argument('-r', action='store', type=int, default=5)
+args = parser.parse_args()
+
+(c_in, c_out), padding = args.c, args.k // 2
+x = np.random.uniform(-1.0, 1.0, size=(args.n, c_in, args.s, args.s)).astype(np.float32)
+w = np.random.uniform(-1.0, 1.0, size=(c_out, c_in, args.k, args.k)).astype(np.float32)
+
+leaf_x = Tensor(x, requires_grad=True, device=args.device)
+leaf_w = Tensor(w, requires_grad=True, device=args.device)
+torch_x = torch.tensor(x, requires_grad=True)
+torch_w = torch.tensor(w, requires_grad=True)
+
+def leaf_conv(x, w):
+    return x.conv2d(w, stride=args.stride, padding=padding)
+
+def torch_conv(x, w):
+    return F.conv2d(x, w, stride=args.stride, padding=padding)
+
+info(f'Running conv2d benchmark, input {x.shape} kernel {w.shape} stride {args.stride} ' \
+     f'on {args.device} with {torch.get_num_threads()} torch threads\n')
+for backward in (False, True):
+    pass_ = 'forward+backward' if backward else 'forward'
+    t_leaf = measure(leaf_conv, leaf_x, leaf_w, backward, args.r)
+    t_torch = measure(torch_conv, torch_x, torch_w, backward, args.r)
+    info(f'{pass_:>16s} leaf: {t_leaf * 1000.0:9.3f} ms torch: {t_torch * 1000.0:9.3f} ms\n')
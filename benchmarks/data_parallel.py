@@ -0,0 +1,85 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import time
+import argparse
+import functools
+import numpy as np
+from datetime import datetime
+from leaf import Tensor, nn, optim
+from leaf.criterion import CrossEntropyLoss
+from leaf.parallel import DataParallel
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+parser = argparse.ArgumentParser(
+    prog='data_parallel',
+    description='leaf training throughput versus the number of data parallel workers'
+)
+parser.add_argument('-w', action='store', nargs='+', type=int, default=[1, 2, 4, 8])
+parser.add_argument('-b', action='store', type=int, default=512)
+parser.add_argument('--hidden', action='store', type=int, default=1024)
+parser.add_argument('-s', action='store', type=int, default=20)
+args = parser.parse_args()
+
+x = np.random.uniform(-1.0, 1.0, size=(args.b, 784)).astype(np.float32)
+y = np.random.randint(0, 10, size=args.b)
+criterion = CrossEntropyLoss()
+make_optimizer = functools.partial(optim.SGD, lr=0.01, momentum=0.9)
+
+def model():
+    return nn.Sequential(nn.Linear(784, args.hidden), nn.ReLU(),
+        nn.Linear(args.hidden, args.hidden), nn.ReLU(), nn.Linear(args.hidden, 10), flat=True)
+
+def throughput(step):
+    step()
+    t_start = time.perf_counter()
+    for _ in range(args.s):
+        step()
+    return args.s * args.b / (time.perf_counter() - t_start)
+
+info(f'Running data parallel benchmark, batch {args.b} hidden {args.hidden} ' \
+     f'{args.s} steps\n')
+
+module = model()
+optimizer = make_optimizer(module.parameters())
+def step():
+    optimizer.zero_grad()
+    criterion(module(Tensor(x)), y).backward()
+    optimizer.step()
+info(f'{"single process":>16s}: {throughput(step):10.1f} samples/s\n')
+
+for workers in args.w:
+    with DataParallel(model(), criterion, make_optimizer, workers=workers) as parallel:
+        samples = throughput(lambda: parallel.step(x, y))
+    info(f'{workers:>8d} workers: {samples:10.1f} samples/s\n')
@@ -0,0 +1,79 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+import leaf
+from datetime import datetime
+from leaf import Tensor
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+def chain(x, y):
+    return x.sub(y).exp().relu().mul(y).log()
+
+def measure(func, x, y, backward, repeats):
+    timings = []
+    for _ in range(repeats):
+        tracemalloc.start()
+        t_start = time.perf_counter()
+        result = func(x, y)
+        if backward:
+            result.sum().backward()
+        timings.append(time.perf_counter() - t_start)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+    return min(timings), peak
+
+parser = argparse.ArgumentParser(
+    prog='fusion',
+    description='Eager vs fused elementwise op chains'
+)
+parser.add_argument('-s', action='store', nargs='+', type=int, default=[2048, 2048])
+parser.add_argument('-r', action='store', type=int, default=3)
+args = parser.parse_args()
+
+x = Tensor(np.random.uniform(0.0, 1.0, size=args.s), requires_grad=True)
+y = Tensor(np.random.uniform(0.5, 1.0, size=args.s), requires_grad=True)
+fused = leaf.fuse(chain)
+
+info(f'Running fusion benchmark, x.sub(y).exp().relu().mul(y).log() on {tuple(args.s)}\n')
+for backward in (False, True):
+    pass_ = 'forward+backward' if backward else 'forward'
+    t_eager, m_eager = measure(chain, x, y, backward, args.r)
+    t_fused, m_fused = measure(fused, x, y, backward, args.r)
+    info(f'{pass_:>16s} eager: {t_eager * 1000.0:9.3f} ms {m_eager / 2**20:8.2f} MiB peak\n')
+    info(f'{pass_:>16s} fused: {t_fused * 1000.0:9.3f} ms {m_fused / 2**20:8.2f} MiB peak\n')
@@ -0,0 +1,78 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import gc
+import sys
+import time
+import argparse
+import tracemalloc
+import numpy as np
+from datetime import datetime
+from leaf import Tensor
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+def build(x, n):
+    y = x
+    for _ in range(n):
+        y = y.relu()
+    return y
+
+parser = argparse.ArgumentParser(
+    prog='graph_construction',
+    description='Per-node time and memory of building a graph of many small ops'
+)
+parser.add_argument('-n', action='store', type=int, default=100000)
+parser.add_argument('-r', action='store', type=int, default=5)
+args = parser.parse_args()
+
+x = Tensor(np.ones(1), requires_grad=True)
+info(f'Building a graph of {args.n} ops on a single element tensor\n')
+
+timings = []
+for _ in range(args.r):
+    gc.collect()
+    t_start = time.perf_counter()
+    y = build(x, args.n)
+    timings.append(time.perf_counter() - t_start)
+    del y
+
+gc.collect()
+tracemalloc.start()
+before, _ = tracemalloc.get_traced_memory()
+y = build(x, args.n)
+after, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+# Includes the single element result arrays, which are the same for any node representation.
+info(f'apply: {min(timings) * 1e6 / args.n:8.3f} us/node, '
+     f'memory: {(after - before) / args.n:8.1f} bytes/node\n')
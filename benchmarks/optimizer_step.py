@@ -0,0 +1,93 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import time
+import argparse
+import numpy as np
+import torch
+from datetime import datetime
+from leaf import Tensor, memory, optim
+
+strformat = '%Y-%m-%d %H:%M:%S'
+def info(s, strftime=True):
+    strf = f'[{datetime.now().strftime(strformat)}] '
+    strf = strf + s if strftime else s
+    sys.stdout.write(strf)
+    sys.stdout.flush()
+
+def measure(optimizer, repeats):
+    timings = []
+    for _ in range(repeats):
+        t_start = time.perf_counter()
+        optimizer.step()
+        timings.append(time.perf_counter() - t_start)
+    return min(timings)
+
+parser = argparse.ArgumentParser(
+    prog='optimizer_step',
+    description='leaf vs torch optimizer step time versus the number of parameters'
+)
+parser.add_argument('-n', action='store', nargs='+', type=int, default=[10, 100, 1000])
+parser.add_argument('-s', action='store', type=int, default=1024)
+parser.add_argument('-r', action='store', type=int, default=20)
+args = parser.parse_args()
+
+configs = (
+    ('sgd', optim.SGD, torch.optim.SGD, dict(lr=0.1)),
+    ('momentum', optim.SGD, torch.optim.SGD, dict(lr=0.1, momentum=0.9)),
+    ('adam', optim.Adam, torch.optim.Adam, dict(lr=0.001)),
+)
+
+info(f'Running optimizer step benchmark, parameters of {args.s} elements ' \
+     f'with {torch.get_num_threads()} torch threads\n')
+for n in args.n:
+    arrays = [np.random.uniform(-1.0, 1.0, size=args.s).astype(np.float32) for _ in range(n)]
+    for name, leaf_cls, torch_cls, kwargs in configs:
+        timings = []
+        for multi_tensor in (False, True):
+            params = [Tensor(a, requires_grad=True) for a in arrays]
+            for p in params:
+                p.grad = np.ones_like(p.data)
+            timings.append(measure(leaf_cls(params, multi_tensor=multi_tensor, **kwargs), args.r))
+
+        # Gradients that are views of one buffer, as after Module.flatten_parameters.
+        params = [Tensor(a, requires_grad=True) for a in arrays]
+        _, grads = memory.flatten([np.ones_like(a) for a in arrays])
+        for p, grad in zip(params, grads):
+            p.grad = grad
+        timings.append(measure(leaf_cls(params, **kwargs), args.r))
+
+        params = [torch.tensor(a, requires_grad=True) for a in arrays]
+        for p in params:
+            p.grad = torch.ones_like(p)
+        t_torch = measure(torch_cls(params, foreach=True, **kwargs), args.r)
+
+        t_loop, t_multi, t_flat = timings
+        info(f'{n:>6d} params {name:>9s} leaf loop: {t_loop * 1000.0:8.3f} ms ' \
+             f'multi-tensor: {t_multi * 1000.0:8.3f} ms flat: {t_flat * 1000.0:8.3f} ms ' \
+             f'torch: {t_torch * 1000.0:8.3f} ms\n')
@@ -22,12 +22,60 @@
 # SOFTWARE.
 #
 # File created: 2022-11-01
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
-from leaf.tensor import Tensor
-from leaf import nn
-from leaf.types import *
+""" Only the names listed below are bound when ``leaf`` is imported, the
+modules defining them, and NumPy with them, are imported on first access.
+This keeps ``import leaf`` cheap for tools that never touch a tensor. """
+
+from __future__ import annotations
+import importlib
+
+# Imported eagerly, as importing the ``leaf.lazy`` module later on would bind
+# it over the ``lazy`` context manager of the same name.
+from leaf.lazy import lazy, LazyGraph
+
+_ATTRIBUTES = {
+    'Tensor': 'leaf.tensor',
+    'no_grad': 'leaf.autograd',
+    'inference_mode': 'leaf.autograd',
+    'is_grad_enabled': 'leaf.autograd',
+    'set_num_threads': 'leaf.backend',
+    'get_num_threads': 'leaf.backend',
+    'fuse': 'leaf.fusion',
+    'einsum': 'leaf.functions._processing_ops',
+    'checkpoint': 'leaf.functions._checkpoint',
+    'save': 'leaf.serialization',
+    'load': 'leaf.serialization',
+    'Integer': 'leaf.types',
+    'Float': 'leaf.types',
+    'String': 'leaf.types',
+    'Boolean': 'leaf.types',
+    'Array': 'leaf.types',
+    'Datatype': 'leaf.types',
+    'Data': 'leaf.types',
+}
+
+_SUBMODULES = (
+    'amp', 'autograd', 'backend', 'criterion', 'data', 'functions', 'fusion',
+    'lazy', 'memory', 'nn', 'optim', 'parallel', 'serialization',
+    'tensor', 'types',
+)
+
+def __getattr__(name):
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module('leaf.' + name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTES) | set(_SUBMODULES))
 
 def is_tensor(obj) -> Boolean:
     """ Returns True if `obj` is a tensor.
@@ -38,6 +86,7 @@ def is_tensor(obj) -> Boolean:
         The object to test.
 
     """
+    from leaf.tensor import Tensor
     return isinstance(obj, Tensor)
 
 def are_tensors(objs) -> Boolean:
@@ -50,21 +99,3 @@ def are_tensors(objs) -> Boolean:
 
     """
     return all(map(is_tensor, objs))
-
-# Register all standard CPU ops for tensor.
-import os
-import inspect
-import importlib
-from functools import partialmethod
-
-def _register_from_import(namespace) -> None:
-    for name, func in inspect.getmembers(namespace, inspect.isclass):
-        setattr(Tensor, name.lower(), partialmethod(func.apply))
-
-opfiles = os.listdir(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'functions'))
-opfiles = [f.split('.')[0] for f in opfiles if f.endswith('_ops.py')]
-for optype in opfiles:
-    try:
-        _register_from_import(importlib.import_module('leaf.functions.' + optype))
-    except ImportError as error:
-        print(f'Could not import module {optype}, {error=}')
@@ -0,0 +1,183 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import weakref
+import threading
+import numpy as np
+from contextlib import contextmanager
+
+# Ops computed in the reduced precision of the autocast region, these are bound
+# by memory bandwidth or, like matmul, accumulate in a safe manner.
+HALF_OPS = frozenset(('Matmul', 'Conv2d', 'Add', 'Sub', 'Mul', 'Div', 'ReLU', 'Clamp', 'FusedElementwise'))
+
+# Ops always computed in float32, as their range or accumulation overflows,
+# or loses too much precision, in float16.
+FULL_OPS = frozenset(('Exp', 'Log', 'Pow', 'Sum', 'Mean', 'NLL', 'CrossEntropy', 'MSE'))
+
+class _State(threading.local):
+    dtype = None
+    cache = None
+
+_state = _State()
+
+def autocast_dtype(op) -> np.dtype:
+    """ Return the datatype the inputs of the op are cast to, or None. """
+    dtype = _state.dtype
+    if dtype is None:
+        return None
+
+    name = op.__name__
+    if name in HALF_OPS:
+        return dtype
+    if name in FULL_OPS:
+        return np.dtype(np.float32)
+    return None
+
+def cast(tensors, dtype) -> tuple:
+    """ Cast the floating point tensors to the datatype through the differentiable
+    ``Cast`` op, such that gradients flow back in the datatype of the originals.
+    Casts of leaf tensors, i.e. parameters, are computed once per autocast region.
+
+    """
+    from leaf.tensor import Tensor
+    from leaf.functions._unary_ops import Cast
+
+    cache = _state.cache
+    casted = []
+    for t in tensors:
+        if not isinstance(t, Tensor):
+            casted.append(t)
+            continue
+
+        # The datatype of an unrealized lazy tensor is unknown without executing
+        # it, cast it anyway, which is free if it already is of the datatype.
+        if t._data is not None and (t._data.dtype == dtype or t._data.dtype.kind != 'f'):
+            casted.append(t)
+            continue
+
+        if t._ctx is not None or t._data is None:
+            casted.append(Cast.apply(t, dtype=dtype))
+            continue
+
+        key = (id(t), dtype)
+        entry = cache.get(key)
+        if entry is None or entry[0]() is not t or entry[1] != t._version \
+                or (entry[2]._ctx is not None and entry[2]._ctx.saved_tensors is None):
+            entry = cache[key] = (weakref.ref(t), t._version, Cast.apply(t, dtype=dtype))
+        casted.append(entry[2])
+    return tuple(casted)
+
+@contextmanager
+def autocast(enabled=True, dtype=np.float16):
+    """ Context manager enabling mixed precision. Inside of it, matmul and the
+    elementwise ops listed in ``HALF_OPS`` compute in ``dtype``, halving the
+    memory and bandwidth of their activations, while the ops in ``FULL_OPS``
+    compute in float32. Parameters stay float32 master weights, they are
+    cast on use and receive float32 gradients. Use together with a
+    ``LossScaler`` to keep small gradients from underflowing.
+
+    Casts of parameters are cached for the duration of the region, which
+    should therefore wrap the forward pass only, not the parameter update.
+
+    Parameters
+    ----------
+    enabled: bool
+        Specify whether autocasting should be enabled, allowing regions to
+        opt out of an enclosing autocast region.
+    dtype: np.dtype
+        The reduced precision datatype, defaults to float16.
+
+    """
+    previous = _state.dtype, _state.cache
+    _state.dtype = np.dtype(dtype) if enabled else None
+    _state.cache = {}
+    try:
+        yield
+    finally:
+        _state.dtype, _state.cache = previous
+
+class LossScaler(object):
+    """ Dynamic loss scaling for mixed precision training. The loss is multiplied
+    by the scale before the backwards pass, moving small gradients out of the
+    range where they underflow in float16. Before the parameters are updated
+    the gradients are unscaled again. If any of them overflowed, the update
+    should be skipped and the scale is reduced, after ``growth_interval``
+    consecutive finite steps it is increased again.
+
+    Parameters
+    ----------
+    init_scale: float
+        The initial scale.
+    growth_factor: float
+        Factor the scale is multiplied by after ``growth_interval`` finite steps.
+    backoff_factor: float
+        Factor the scale is multiplied by after a step with non-finite gradients.
+    growth_interval: int
+        Number of consecutive finite steps before the scale is grown.
+
+    """
+    def __init__(self, init_scale=2.0 ** 16, growth_factor=2.0,
+                 backoff_factor=0.5, growth_interval=2000) -> None:
+        self.scale_factor = float(init_scale)
+        self.growth_factor = growth_factor
+        self.backoff_factor = backoff_factor
+        self.growth_interval = growth_interval
+        self._growth_tracker = 0
+        self._found_inf = False
+
+    def scale(self, loss):
+        """ Return the loss multiplied by the scale, computed in float32. """
+        from leaf.tensor import Tensor
+        with autocast(enabled=False):
+            if loss.dtype != np.float32:
+                loss = loss.cast(dtype=np.float32)
+            return loss.mul(Tensor(self.scale_factor))
+
+    def unscale(self, parameters) -> bool:
+        """ Divide the gradients of the parameters by the scale in-place. Returns
+        True if all of them are finite, i.e. the parameters can be updated. """
+        inverse = 1.0 / self.scale_factor
+        finite = True
+        for p in parameters:
+            if p.grad is None:
+                continue
+            p.grad *= inverse
+            finite = finite and bool(np.isfinite(p.grad).all())
+
+        self._found_inf = not finite
+        return finite
+
+    def update(self) -> None:
+        """ Adjust the scale based on the outcome of the last ``unscale``. """
+        if self._found_inf:
+            self.scale_factor *= self.backoff_factor
+            self._growth_tracker = 0
+        else:
+            self._growth_tracker += 1
+            if self._growth_tracker == self.growth_interval:
+                self.scale_factor *= self.growth_factor
+                self._growth_tracker = 0
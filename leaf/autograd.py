@@ -0,0 +1,293 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import weakref
+import threading
+import numpy as np
+from leaf import memory
+from contextlib import contextmanager
+
+class _State(threading.local):
+    """ Per thread autograd state. Defaults are class attributes, as looking up
+    a missing attribute of a thread local is slow and this is done per op. """
+    grad_enabled = True
+    tape = None
+
+_state = _State()
+
+class Tape(object):
+    """ Record of every Function context created by ``Function.apply``, kept
+    in the order the ops were executed. Since a context can only be created
+    after all of its parents, the tape is already a topological ordering
+    of the DAG and backward becomes a single reversed walk over it.
+
+    The tape only holds weak references, contexts are kept alive by the
+    tensors that were produced by them. Dead references are compacted away
+    once the tape has doubled in size since the last compaction, which
+    keeps recording amortized O(1) per op.
+
+    Parameters
+    ----------
+    capacity: int
+        Number of recorded contexts before the first compaction.
+
+    """
+    def __init__(self, capacity=1024) -> None:
+        self._nodes = []
+        self._capacity = capacity
+        self._min_capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def record(self, ctx) -> None:
+        """ Append the context to the tape and store its position on it. """
+        nodes = self._nodes
+        if len(nodes) >= self._capacity:
+            nodes = self._compact()
+
+        ctx._tape = self
+        ctx._index = len(nodes)
+        nodes.append(weakref.ref(ctx))
+
+    def _compact(self) -> list:
+        """ Drop references to dead contexts and re-index the living ones. """
+        nodes = []
+        for ref in self._nodes:
+            ctx = ref()
+            if ctx is not None:
+                ctx._index = len(nodes)
+                nodes.append(ref)
+
+        self._nodes = nodes
+        self._capacity = max(self._min_capacity, 2 * len(nodes))
+        return nodes
+
+def current_tape() -> Tape:
+    """ Return the tape that ops executed on the calling thread record onto. """
+    tape = _state.tape
+    if tape is None:
+        tape = _state.tape = Tape()
+    return tape
+
+def is_grad_enabled() -> bool:
+    """ Returns True if ops on the calling thread currently build the DAG. """
+    return _state.grad_enabled
+
+@contextmanager
+def no_grad():
+    """ Context manager, or function decorator, disabling DAG construction.
+    Ops executed inside of it create no contexts, save nothing for the
+    backwards pass and return tensors that do not require grad. As such,
+    all intermediate arrays are freed as soon as they go out of scope.
+
+    """
+    previous = is_grad_enabled()
+    _state.grad_enabled = False
+    try:
+        yield
+    finally:
+        _state.grad_enabled = previous
+
+@contextmanager
+def inference_mode(mode=True):
+    """ Same as ``no_grad`` but meant for serving, where no tensor created
+    inside of it is ever going to be part of a backwards pass.
+
+    Parameters
+    ----------
+    mode: bool
+        Specify whether inference mode should be enabled, allowing the
+        context to be toggled without restructuring the calling code.
+
+    """
+    previous = is_grad_enabled()
+    _state.grad_enabled = previous and not mode
+    try:
+        yield
+    finally:
+        _state.grad_enabled = previous
+
+@contextmanager
+def _recompute():
+    """ Enable DAG construction and record onto a new tape, used to rebuild part of
+    the DAG while the backwards pass is walking the tape of the calling thread. """
+    previous = _state.grad_enabled, _state.tape
+    _state.grad_enabled, _state.tape = True, Tape()
+    try:
+        yield
+    finally:
+        _state.grad_enabled, _state.tape = previous
+
+def _propagate(ctx, pending, retain_graph) -> bool:
+    """ Run the backwards pass of the context on its pending gradient and route
+    the gradients on to its parents, accumulating them in ``pending`` for the
+    parents produced by a context and in ``grad`` for the leaf tensors. Returns
+    True if a parent context recorded on a tape other than that of ``ctx`` got
+    a gradient, which the reversed walk over the tape of ``ctx`` never reaches. """
+    if ctx.saved_tensors is None:
+        raise RuntimeError(
+            f'Trying to backward through {type(ctx).__name__} a second time, but its ' \
+            f'saved tensors have already been freed. Specify ``retain_graph=True`` ' \
+            f'when calling backward the first time to keep the graph intact.'
+        )
+    ctx._check_saved_versions()
+
+    foreign = False
+    grad = pending.pop(ctx)
+    gradients = ctx.backward(grad)
+    gradients = [gradients] if isinstance(gradients, np.ndarray) else list(gradients)
+    parents, parent_ctxs = ctx.parents, ctx._parent_ctxs
+
+    # Indexed rather than zipped, as the tuples zip reuses would keep extra
+    # references to the gradients and stop the pool from taking them back.
+    for i in range(min(len(gradients), len(parents))):
+        gradient, parent, parent_ctx = gradients[i], parents[i], parent_ctxs[i]
+        if gradient is None or not parent.requires_grad:
+            continue
+
+        # Gradients take the datatype of the tensor they are the gradient of,
+        # e.g. float16 activations feeding into float32 parameters.
+        dtype = parent._data.dtype
+        if np.result_type(gradient) != dtype:
+            gradient = np.asarray(gradient, dtype=dtype)
+
+        if parent_ctx is not None:
+            foreign = foreign or parent_ctx._tape is not ctx._tape
+            accumulated = pending.get(parent_ctx)
+            if accumulated is None:
+                pending[parent_ctx] = gradient
+            else:
+                total = memory.empty(
+                    np.broadcast_shapes(np.shape(accumulated), np.shape(gradient)),
+                    np.result_type(accumulated, gradient),
+                )
+                pending[parent_ctx] = np.add(accumulated, gradient, out=total)
+                memory.release(accumulated)
+                accumulated = total = None
+        else:
+            if parent.grad is None:
+                parent.grad = memory.empty(np.shape(gradient), dtype)
+                parent.grad[...] = gradient
+            else:
+                parent.grad += gradient
+            gradients[i] = None
+            memory.release(gradient)
+
+    if not retain_graph:
+        ctx.release()
+
+    # The consumed gradient goes back to the pool, unless it has been routed
+    # on to a parent unchanged, which the pool detects from its references.
+    gradients = gradient = None
+    memory.release(grad)
+    return foreign
+
+def _backward_graph(pending, retain_graph) -> None:
+    """ Propagate the pending gradients by walking the DAG itself instead of a
+    tape, used once the gradients reach contexts recorded on different tapes,
+    e.g. by ops executed on other threads. Every context is run once all the
+    contexts consuming its result have been, which is tracked by counting the
+    consumers of every context reachable from the pending ones. """
+    consumers = {}
+    stack = list(pending)
+    for ctx in stack:
+        consumers.setdefault(ctx, 0)
+    while stack:
+        ctx = stack.pop()
+        for parent, parent_ctx in zip(ctx.parents, ctx._parent_ctxs):
+            if parent_ctx is None or not parent.requires_grad:
+                continue
+            if parent_ctx not in consumers:
+                consumers[parent_ctx] = 0
+                stack.append(parent_ctx)
+            consumers[parent_ctx] += 1
+
+    ready = [ctx for ctx, count in consumers.items() if count == 0]
+    while ready:
+        ctx = ready.pop()
+        edges = [c for t, c in zip(ctx.parents, ctx._parent_ctxs) if c is not None and t.requires_grad]
+        if ctx in pending:
+            _propagate(ctx, pending, retain_graph)
+
+        # Contexts that got no gradient still count as consumed, such that the
+        # contexts they depend on do not wait on them forever.
+        for parent_ctx in edges:
+            consumers[parent_ctx] -= 1
+            if consumers[parent_ctx] == 0:
+                ready.append(parent_ctx)
+
+def backward(tensor, grad, retain_graph=False) -> None:
+    """ Propagate ``grad`` from ``tensor`` back to all leaf tensors requiring grad.
+
+    The tape is walked in reverse starting at the context that produced
+    ``tensor``. Gradients for intermediate tensors are accumulated in a
+    dictionary keyed on their producing context and consumed exactly once,
+    when the walk reaches that context. All consumers of a tensor were
+    recorded after it, so by then its gradient is complete. The walk stops
+    as soon as there are no pending gradients left, which makes the pass
+    linear in the number of nodes and free of recursion.
+
+    Tapes are per thread, so the DAG of a tensor computed from tensors of
+    another thread spans several tapes. Once the gradients reach a context
+    recorded on another tape, the rest of the pass walks the DAG itself in
+    an order given by counting the consumers of every context.
+
+    Unless the graph is retained, every context is released right after its
+    gradients have been propagated, freeing the saved arrays and the parent
+    tensors, and with them the intermediate activations, during the pass.
+
+    Parameters
+    ----------
+    tensor: Tensor
+        The non-leaf tensor to start backpropagation from.
+    grad: np.ndarray
+        Gradient of the target with respect to ``tensor``.
+    retain_graph: bool
+        Specify whether the DAG should be kept intact, allowing another
+        backwards pass through it. Defaults to False.
+
+    """
+    ctx = tensor._ctx
+    if ctx is None or not ctx.requires_grad:
+        return
+
+    nodes = ctx._tape._nodes
+    pending = {ctx: grad}
+    grad = None
+
+    for index in range(ctx._index, -1, -1):
+        ctx = nodes[index]()
+        if ctx is None or ctx not in pending:
+            continue
+
+        if _propagate(ctx, pending, retain_graph):
+            _backward_graph(pending, retain_graph)
+            return
+
+        if not pending:
+            break
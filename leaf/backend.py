@@ -0,0 +1,324 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import os
+import sys
+import time
+import numpy as np
+
+DEFAULT_THRESHOLD = 1 << 16
+CACHE_PATH = os.path.join(
+    os.environ.get('LEAF_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'leaf')),
+    'thresholds.json',
+)
+
+_kernels = {}
+_thresholds = {}
+_resolved = {}
+_rust = None
+_loaded = False
+_num_threads = int(os.environ.get('LEAF_NUM_THREADS', 0))
+
+def register_kernel(op, device, dtype=None):
+    """ Decorator registering the function as the kernel of ``op`` on ``device``
+    for arrays of datatype ``dtype``. A kernel registered without a datatype
+    is used for every datatype that has no kernel of its own.
+
+    Parameters
+    ----------
+    op: str
+        Name of the op, e.g. 'add'.
+    device: str
+        The device the kernel runs on, one of ('cpu', 'rust').
+    dtype: np.dtype | None
+        Datatype of the arrays the kernel is specialized for.
+
+    """
+    def decorator(func):
+        _kernels[(op, device, None if dtype is None else np.dtype(dtype))] = func
+        _resolved.clear()
+        return func
+    return decorator
+
+def _lookup(op, device, dtype):
+    kernel = _kernels.get((op, device, dtype))
+    return _kernels.get((op, device, None)) if kernel is None else kernel
+
+def _load() -> None:
+    """ Import the leafrs extension, if built, and register its kernels together
+    with the calibrated thresholds. Done on first dispatch only, such that
+    importing leaf does not pay for it. """
+    global _rust, _loaded
+    if _loaded:
+        return
+    _loaded = True
+
+    if os.path.exists(CACHE_PATH):
+        load_thresholds(CACHE_PATH)
+
+    try:
+        import leafrs
+    except ImportError:
+        return
+
+    # The leafrs source directory is importable as an empty namespace package
+    # from the repository root, only count the extension as built if it
+    # actually exposes kernels.
+    if not hasattr(leafrs, 'add'):
+        return
+    _rust = leafrs
+    if _num_threads and hasattr(leafrs, 'set_num_threads'):
+        leafrs.set_num_threads(_num_threads)
+
+    for op in ('add', 'sub', 'mul', 'div', 'exp', 'log', 'relu',
+               'conv2d', 'conv2d_input_grad', 'conv2d_weight_grad'):
+        if hasattr(leafrs, op):
+            register_kernel(op, 'rust', np.float32)(getattr(leafrs, op))
+
+    if hasattr(leafrs, 'matmul'):
+        @register_kernel('matmul', 'rust', np.float32)
+        def _matmul(x, y, out=None):
+            # Batched operands, and an output overlapping the operands which
+            # NumPy buffers internally, are left to NumPy.
+            if x.ndim != 2 or y.ndim != 2 or (out is not None and (
+                    np.shares_memory(out, x) or np.shares_memory(out, y))):
+                return np.matmul(x, y, out=out)
+            return leafrs.matmul(x, y, out)
+
+def rust():
+    """ Return the leafrs extension module, or None if it has not been built. """
+    _load()
+    return _rust
+
+def set_num_threads(n) -> None:
+    """ Set the number of threads the leafrs kernels split large arrays across.
+    The kernels release the GIL while running, so several Python threads can
+    execute ops at the same time. Defaults to the ``LEAF_NUM_THREADS``
+    environment variable, or one thread per core if it is not set.
+
+    Parameters
+    ----------
+    n: int
+        Number of threads in the pool, 0 selects one thread per core.
+
+    """
+    global _num_threads
+    if not isinstance(n, int) or n < 0:
+        raise ValueError(f'Number of threads has to be a non-negative integer, got {n}.')
+
+    _num_threads = n
+    if _rust is not None and hasattr(_rust, 'set_num_threads'):
+        _rust.set_num_threads(n)
+
+def get_num_threads() -> int:
+    """ Return the number of threads the leafrs kernels run on. """
+    _load()
+    if _rust is not None and hasattr(_rust, 'get_num_threads'):
+        return _rust.get_num_threads()
+    return _num_threads or os.cpu_count()
+
+def threshold(op, dtype) -> int:
+    """ Return the array size from which the Rust kernel of the op is used. """
+    return _thresholds.get((op, np.dtype(dtype)), DEFAULT_THRESHOLD)
+
+def _resolve(op, device, dtype) -> tuple:
+    """ Return the Rust kernel, its size threshold and the NumPy kernel to run
+    ``op`` with on ``device`` for arrays of the datatype. Cached, as this is
+    on the path of every op. """
+    key = (op, device, dtype)
+    entry = _resolved.get(key)
+    if entry is not None:
+        return entry
+
+    _load()
+    name = device.lower()
+    if name == 'gpu':
+        raise NotImplementedError('GPU devices are currently not supported.')
+
+    if name == 'rust' and _rust is None:
+        raise RuntimeError(
+            'Tensor is on the Rust device but the leafrs extension has not been built, ' \
+            'see the README for how to build it.'
+        )
+
+    if name not in ('cpu', 'rust'):
+        raise ValueError(f'Unknown device {device}, expected one of cpu, gpu, rust.')
+
+    kernel = _lookup(op, 'cpu', dtype)
+    rust_kernel = _lookup(op, 'rust', dtype)
+    if rust_kernel is None and kernel is None:
+        raise NotImplementedError(f'No kernel registered for op {op} with dtype {dtype}.')
+
+    limit = 0 if name == 'rust' or kernel is None else threshold(op, dtype)
+    entry = _resolved[key] = (rust_kernel, limit, kernel)
+    return entry
+
+def get_kernel(op, device, dtype, size=0):
+    """ Return the kernel to run ``op`` with on ``device`` for arrays of the
+    given datatype and size. On 'cpu' the Rust kernel is picked over the
+    NumPy one from the calibrated size threshold onwards, as the overhead
+    of calling into Rust does not pay off for small arrays. On 'rust' the
+    Rust kernel is always used when there is one.
+
+    """
+    rust_kernel, limit, kernel = _resolve(op, device, None if dtype is None else np.dtype(dtype))
+    if rust_kernel is not None and size >= limit:
+        return rust_kernel
+    return kernel
+
+def dispatch(op, device, *arrays, out=None, **kwargs) -> np.ndarray:
+    """ Run the op on the arrays using the kernel picked by ``get_kernel``. If
+    ``out`` is provided the kernel writes its result into it and returns it,
+    instead of allocating a new array.
+
+    """
+    x = arrays[0]
+    dtype, size = x.dtype, x.size
+    for y in arrays[1:]:
+        if y.dtype != dtype:
+            dtype = None
+        if y.size > size:
+            size = y.size
+    if out is not None and out.dtype != dtype:
+        dtype = None
+
+    rust_kernel, limit, kernel = _resolve(op, device, dtype)
+    if rust_kernel is not None and size >= limit:
+        kernel = rust_kernel
+
+    if out is None:
+        return kernel(*arrays, **kwargs)
+    return kernel(*arrays, out=out, **kwargs)
+
+def load_thresholds(path=CACHE_PATH) -> None:
+    """ Load thresholds previously persisted by ``calibrate``. """
+    import json
+    with open(path, 'r') as f:
+        for key, value in json.load(f).items():
+            op, dtype = key.split('/')
+            _thresholds[(op, np.dtype(dtype))] = value
+    _resolved.clear()
+
+def _calibration_inputs(op, size, dtype) -> tuple:
+    """ Return the arguments and keyword arguments to time the op with, the
+    largest argument being of about ``size`` elements. """
+    def uniform(*shape):
+        return np.random.uniform(0.5, 1.5, size=shape).astype(dtype)
+
+    if op == 'matmul':
+        n = max(1, int(np.sqrt(size)))
+        return (uniform(n, n), uniform(n, n)), {}
+    if op.startswith('conv2d'):
+        # Batches of 8 channel 16x16 images with a 3x3 kernel keeping their size.
+        x, w = uniform(max(1, size // 2048), 8, 16, 16), uniform(8, 8, 3, 3)
+        kwargs = {'stride': (1, 1), 'padding': (1, 1), 'dilation': (1, 1)}
+        if op == 'conv2d_input_grad':
+            return (x, w), dict(kwargs, shape=x.shape)
+        if op == 'conv2d_weight_grad':
+            return (x, x), dict(kwargs, shape=w.shape)
+        return (x, w), kwargs
+    arity = 2 if op in ('add', 'sub', 'mul', 'div', 'pow') else 1
+    return tuple(uniform(size) for _ in range(arity)), {}
+
+def _best_time(kernel, inputs, kwargs, repeats) -> float:
+    timings = []
+    for _ in range(repeats):
+        t_start = time.perf_counter()
+        kernel(*inputs, **kwargs)
+        timings.append(time.perf_counter() - t_start)
+    return min(timings)
+
+def calibrate(sizes=None, repeats=5, path=CACHE_PATH, save=True) -> dict:
+    """ Time the NumPy and Rust kernel of every op with both for increasing array
+    sizes, and set the threshold of the op to the smallest size from which the
+    Rust kernel is faster for all larger sizes. Meant to be run once on a new
+    machine, e.g. at startup of a long-running job, with the thresholds
+    persisted to a cache file that is picked up by later processes.
+
+    Parameters
+    ----------
+    sizes: list | tuple
+        The array sizes to time, powers of two from 2^4 to 2^22 by default.
+    repeats: int
+        Number of timings per kernel and size, the fastest one is used.
+    path: str
+        File to persist the thresholds to, defaults to ``CACHE_PATH``.
+    save: bool
+        Specify whether to persist the thresholds.
+
+    """
+    _load()
+    sizes = sorted(sizes or [1 << p for p in range(4, 23, 2)])
+    calibrated = {}
+    for (op, device, dtype), rust_kernel in list(_kernels.items()):
+        cpu_kernel = _lookup(op, 'cpu', dtype)
+        if device != 'rust' or dtype is None or cpu_kernel is None:
+            continue
+
+        faster = []
+        for size in sizes:
+            inputs, kwargs = _calibration_inputs(op, size, dtype)
+            faster.append(_best_time(rust_kernel, inputs, kwargs, repeats) <
+                          _best_time(cpu_kernel, inputs, kwargs, repeats))
+
+        value = sys.maxsize
+        for size, rust_is_faster in zip(reversed(sizes), reversed(faster)):
+            if not rust_is_faster:
+                break
+            value = size
+
+        _thresholds[(op, dtype)] = value
+        calibrated[f'{op}/{dtype.name}'] = value
+    _resolved.clear()
+
+    if save and calibrated:
+        import json
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(calibrated, f, indent=2)
+    return calibrated
+
+register_kernel('add', 'cpu')(np.add)
+register_kernel('sub', 'cpu')(np.subtract)
+register_kernel('mul', 'cpu')(np.multiply)
+register_kernel('div', 'cpu')(np.true_divide)
+register_kernel('pow', 'cpu')(np.power)
+register_kernel('log', 'cpu')(np.log)
+register_kernel('matmul', 'cpu')(np.matmul)
+register_kernel('sum', 'cpu')(np.sum)
+
+@register_kernel('einsum', 'cpu')
+def _einsum(*operands, subscripts, path, out=None):
+    return np.einsum(subscripts, *operands, out=out, optimize=path)
+
+@register_kernel('exp', 'cpu')
+def _exp(x, out=None):
+    return np.exp(np.clip(x, -50, 50, out=out), out=out)
+
+@register_kernel('relu', 'cpu')
+def _relu(x, out=None):
+    return np.maximum(x, 0.0, out=out)
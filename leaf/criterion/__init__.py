@@ -22,15 +22,17 @@
 # SOFTWARE.
 #
 # File created: 2022-11-23
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 from leaf.criterion.base import Criterion
 from leaf.criterion.nllloss import NLLLoss
 from leaf.criterion.mseloss import MSELoss
+from leaf.criterion.crossentropyloss import CrossEntropyLoss
 
 __all__ = (
     'Criterion',
     'NLLLoss',
     'MSELoss',
+    'CrossEntropyLoss',
 )
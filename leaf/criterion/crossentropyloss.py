@@ -0,0 +1,40 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import Tensor
+from leaf.criterion import Criterion
+
+class CrossEntropyLoss(Criterion):
+    """ Mean cross entropy between unnormalized logits of shape (batch, classes)
+    and class index targets of shape (batch, ), computed as a single op with
+    a numerically stable log-softmax, see ``Tensor.crossentropy``. """
+    def apply(self, logits, targets):
+        if not isinstance(targets, Tensor):
+            targets = Tensor(targets, dtype=np.int64)
+        return logits.crossentropy(targets)
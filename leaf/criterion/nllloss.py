@@ -22,7 +22,7 @@
 # SOFTWARE.
 #
 # File created: 2022-11-23
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 import numpy as np
@@ -30,8 +30,10 @@ from leaf import Tensor
 from leaf.criterion import Criterion
 
 class NLLLoss(Criterion):
+    """ Mean negative log likelihood of class index targets of shape (batch, ),
+    given log probabilities of shape (batch, classes). The target entries are
+    gathered by index in a single op, see ``Tensor.nll``. """
     def apply(self, logits, targets):
-        n_classes = logits.shape[-1]
-        y = np.zeros((targets.shape[0], n_classes)).astype(np.float32)
-        y[range(y.shape[0]), targets.data.astype(int)] = -1.0 * n_classes
-        return logits.multiply(Tensor(y)).mean()
+        if not isinstance(targets, Tensor):
+            targets = Tensor(targets, dtype=np.int64)
+        return logits.nll(targets)
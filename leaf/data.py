@@ -0,0 +1,227 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import math
+import numpy as np
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from leaf.tensor import Tensor
+
+def collate(samples):
+    """ Stack a list of samples into a batch, a sample being an array, a number
+    or a tuple of those, in which case a tuple of batches is returned.
+
+    Parameters
+    ----------
+    samples: list
+        The samples to stack along a new first axis.
+
+    """
+    if isinstance(samples[0], (tuple, list)):
+        return tuple(collate([s[i] for s in samples]) for i in range(len(samples[0])))
+    return np.stack(samples)
+
+class Dataset(object):
+    """ Parent class for datasets, indexable collections of samples. Each dataset
+    implements ``__len__`` and ``__getitem__``, which returns a single sample,
+    and may override ``batch`` if it can gather a batch faster than sample
+    by sample, e.g. with a single indexing operation.
+
+    """
+    def __len__(self) -> int:
+        raise NotImplementedError(
+            f'User defined dataset {self} has not implemented __len__.'
+        )
+
+    def __getitem__(self, index):
+        raise NotImplementedError(
+            f'User defined dataset {self} has not implemented __getitem__.'
+        )
+
+    def batch(self, indices):
+        """ Return the samples at the indices, a slice or an array, as a batch. """
+        if isinstance(indices, slice):
+            indices = range(*indices.indices(len(self)))
+        return collate([self[i] for i in indices])
+
+class ArrayDataset(Dataset):
+    """ Dataset of arrays of equal length, the samples being the tuples of their
+    rows. Batches are gathered with one indexing operation per array, and
+    batches of consecutive samples are views of the arrays, i.e. not copied.
+
+    Parameters
+    ----------
+    *arrays: np.ndarray
+        The arrays, e.g. inputs and targets, indexed along their first axis.
+
+    """
+    def __init__(self, *arrays) -> None:
+        if not arrays or len({len(a) for a in arrays}) != 1:
+            raise ValueError(
+                f'Expected one or more arrays of equal length, got lengths {[len(a) for a in arrays]}.'
+            )
+        self.arrays = arrays
+
+    def __len__(self) -> int:
+        return len(self.arrays[0])
+
+    def __getitem__(self, index) -> tuple:
+        return tuple(a[index] for a in self.arrays)
+
+    def batch(self, indices) -> tuple:
+        return tuple(a[indices] for a in self.arrays)
+
+class MemmapDataset(ArrayDataset):
+    """ Array dataset backed by ``.npy`` files that are memory-mapped rather than
+    read, for data that does not fit into memory, see ``np.save``. Only the
+    pages of the samples of a batch are read from disk, into a new array,
+    with the indices of shuffled batches sorted to read the pages in order.
+
+    Parameters
+    ----------
+    *paths: str
+        The ``.npy`` files of the arrays, e.g. inputs and targets.
+
+    """
+    def __init__(self, *paths) -> None:
+        super(MemmapDataset, self).__init__(*(np.load(p, mmap_mode='r') for p in paths))
+
+    def batch(self, indices) -> tuple:
+        if isinstance(indices, slice):
+            return tuple(np.array(a[indices]) for a in self.arrays)
+        indices = np.sort(indices)
+        return tuple(np.asarray(a[indices]) for a in self.arrays)
+
+# Dataset of the forked worker processes, set by their initializer such that
+# it is inherited from the parent instead of pickled along with every batch.
+_dataset = None
+
+def _init_worker(dataset) -> None:
+    global _dataset
+    _dataset = dataset
+
+def _load_batch(indices):
+    return _dataset.batch(indices)
+
+def _to_tensors(batch):
+    if isinstance(batch, (tuple, list)):
+        return tuple(_to_tensors(b) for b in batch)
+    batch = np.asarray(batch)
+    return Tensor(batch, dtype=batch.dtype, copy=False)
+
+class DataLoader(object):
+    """ Iterable over a dataset in batches of tensors, optionally shuffled every
+    epoch. With workers, batches are loaded by a pool of threads, or forked
+    processes, while the calling thread consumes the ones before them. Up to
+    ``prefetch`` batches are in flight at any time, bounding the memory used
+    by batches that have been loaded ahead. Batches are yielded in order.
+
+    The tensors wrap the arrays returned by ``Dataset.batch`` without copying
+    them, so loading a batch costs at most the single copy that gathers its
+    samples. Processes return batches through a pipe, which adds a copy, but
+    can run datasets that hold the GIL while loading in parallel.
+
+    Parameters
+    ----------
+    dataset: Dataset
+        The dataset to load the batches from.
+    batch_size: int
+        Number of samples per batch.
+    shuffle: bool
+        Specify whether to visit the samples in a new random order every epoch.
+    drop_last: bool
+        Specify whether to drop the last batch if it is smaller than ``batch_size``.
+    workers: int
+        Number of threads or processes loading batches, if zero they are loaded
+        on the calling thread once requested.
+    processes: bool
+        Specify whether the workers are forked processes rather than threads.
+    prefetch: int
+        Number of batches loaded ahead, twice the number of workers if not given.
+    seed: int
+        Seed of the generator shuffling the samples.
+
+    """
+    def __init__(self, dataset, batch_size=1, shuffle=False, drop_last=False,
+        workers=0, processes=False, prefetch=None, seed=None) -> None:
+        if batch_size < 1 or workers < 0 or (prefetch is not None and prefetch < 1):
+            raise ValueError(
+                f'Invalid DataLoader arguments, batch_size={batch_size} ' \
+                f'workers={workers} prefetch={prefetch}.'
+            )
+
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.workers = workers
+        self.processes = processes
+        self.prefetch = max(2 * workers, 1) if prefetch is None else prefetch
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return len(self.dataset) // self.batch_size
+        return math.ceil(len(self.dataset) / self.batch_size)
+
+    def _indices(self):
+        """ Yield the indices of every batch of the epoch, slices if not shuffled. """
+        n = len(self.dataset)
+        order = self._rng.permutation(n) if self.shuffle else None
+        for lo in range(0, len(self) * self.batch_size, self.batch_size):
+            hi = min(lo + self.batch_size, n)
+            yield slice(lo, hi) if order is None else order[lo:hi]
+
+    def _executor(self):
+        if self.processes:
+            return ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('fork'),
+                initializer=_init_worker, initargs=(self.dataset, ))
+        return ThreadPoolExecutor(self.workers)
+
+    def __iter__(self):
+        if not self.workers:
+            for indices in self._indices():
+                yield _to_tensors(self.dataset.batch(indices))
+            return
+
+        executor = self._executor()
+        load = _load_batch if self.processes else self.dataset.batch
+        pending = deque()
+        try:
+            for indices in self._indices():
+                pending.append(executor.submit(load, indices))
+                if len(pending) >= self.prefetch:
+                    yield _to_tensors(pending.popleft().result())
+
+            while pending:
+                yield _to_tensors(pending.popleft().result())
+        finally:
+            # Drop the batches prefetched for an iteration that stopped early.
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
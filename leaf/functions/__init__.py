@@ -1,2 +1,3 @@
-# This file should be empty. It only exists such that the importlib module finds this submodule 
-# and can properly add the function names to the namespace of the core leaf module.
+# Importing the package binds every op as a method of Tensor, through the
+# registry generated by ``python -m leaf.functions._generate``.
+from leaf.functions import _registry
@@ -22,32 +22,71 @@
 # SOFTWARE.
 #
 # File created: 2022-11-05
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 import numpy as np
-import leafrs as rs
+from leaf import memory
+from leaf.backend import dispatch
 from .function import Function
+from ._broadcast import unbroadcast
 from typing import Tuple
 
-def _unbroadcast(arr, shape) -> np.ndarray:
-    """ Revert broadcasting on an array to desired original shape. """
-    return np.lib.stride_tricks.as_stride(arr, shape).copy()
-
 class Add(Function):
-    def forward(self, x, y) -> np.ndarray:
+    def forward(self, x, y, out=None) -> np.ndarray:
         self.save_for_backward(x.shape, y.shape)
-        return rs.add(x, y)
+        return dispatch('add', self.device, x, y, out=out)
     
     def backward(self, grad) -> Tuple[np.ndarray]:
         xshape, yshape, = self.saved_tensors
-        return _unbroadcast(grad, xshape), _unbroadcast(grad, yshape)
+        return unbroadcast(grad, xshape), unbroadcast(grad, yshape)
 
 class Sub(Function):
-    def forward(self, x, y) -> np.ndarray:
+    def forward(self, x, y, out=None) -> np.ndarray:
         self.save_for_backward(x.shape, y.shape)
-        return x - y
+        return dispatch('sub', self.device, x, y, out=out)
     
     def backward(self, grad) -> Tuple[np.ndarray]:
         xshape, yshape, = self.saved_tensors
-        return _unbroadcast(grad, xshape), _unbroadcast(grad, yshape)
+        return unbroadcast(grad, xshape), -unbroadcast(grad, yshape)
+
+class Mul(Function):
+    def forward(self, x, y, out=None) -> np.ndarray:
+        # Each operand is only needed for the gradient of the other one.
+        self.save_for_backward(
+            x.shape, y.shape,
+            x if self.needs_input_grad[1] else None,
+            y if self.needs_input_grad[0] else None,
+        )
+        return dispatch('mul', self.device, x, y, out=out)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        xshape, yshape, x, y, = self.saved_tensors
+        dx = unbroadcast(np.multiply(grad, y, out=memory.empty_result(grad, y)), xshape) \
+            if self.needs_input_grad[0] else None
+        dy = unbroadcast(np.multiply(grad, x, out=memory.empty_result(grad, x)), yshape) \
+            if self.needs_input_grad[1] else None
+        return dx, dy
+
+class Div(Function):
+    def forward(self, x, y, out=None) -> np.ndarray:
+        self.save_for_backward(x.shape, x if self.needs_input_grad[1] else None, y)
+        return dispatch('div', self.device, x, y, out=out)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        xshape, x, y, = self.saved_tensors
+        dx = unbroadcast(grad / y, xshape) if self.needs_input_grad[0] else None
+        dy = unbroadcast(-grad * x / (y * y), y.shape) if self.needs_input_grad[1] else None
+        return dx, dy
+
+class Pow(Function):
+    def forward(self, x, y, out=None) -> np.ndarray:
+        result = dispatch('pow', self.device, x, y, out=out)
+        self.save_for_backward(x, y, result if self.needs_input_grad[1] else None)
+        return result
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        x, y, result, = self.saved_tensors
+        dx = unbroadcast(grad * y * x ** (y - 1), x.shape) if self.needs_input_grad[0] else None
+        dy = unbroadcast(grad * result * np.log(x), y.shape) if self.needs_input_grad[1] else None
+        return dx, dy
@@ -0,0 +1,72 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import memory
+from functools import lru_cache
+from typing import Tuple
+
+@lru_cache(maxsize=4096)
+def reduction_plan(shape, target) -> Tuple[int]:
+    """ Return the axes of ``shape`` that have to be summed over to revert
+    broadcasting it from ``target``. These are all leading axes that were
+    prepended, together with the axes where ``target`` has size one. The
+    plan only depends on the shapes, so it is computed once per pair.
+
+    Parameters
+    ----------
+    shape: tuple
+        Shape of the broadcasted array, e.g. the gradient of an op output.
+    target: tuple
+        Shape of the op input that was broadcast.
+
+    """
+    lead = len(shape) - len(target)
+    if lead < 0:
+        raise ValueError(f'Can not unbroadcast shape {shape} to {target}.')
+
+    return tuple(range(lead)) + tuple(
+        lead + axis for axis, size in enumerate(target)
+        if size == 1 and shape[lead + axis] != 1
+    )
+
+def unbroadcast(grad, shape) -> np.ndarray:
+    """ Revert broadcasting on a gradient to the original shape of the input.
+    The reduction is a single vectorized sum into a buffer of the pool, of
+    the shape of the input such that it can be released back to the pool,
+    and viewed with the reduced axes kept for the sum. A gradient that was
+    not broadcast is returned as is.
+
+    """
+    if grad.shape == shape:
+        return grad
+
+    axes = reduction_plan(grad.shape, shape)
+    out = memory.empty(shape, grad.dtype)
+    kept = tuple(1 if axis in axes else size for axis, size in enumerate(grad.shape))
+    np.sum(grad, axis=axes, keepdims=True, out=out.reshape(kept))
+    return out
@@ -0,0 +1,88 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import amp, autograd
+from leaf.tensor import Tensor
+from leaf.lazy import current_graph
+from leaf.functions.function import Function
+
+class Checkpoint(Function):
+    # The segment runs without building the DAG, so its intermediate arrays are
+    # freed right away and only the inputs are saved. The parameters of the
+    # segment are passed as extra parents, such that the context is created
+    # even if the inputs do not require grad.
+    def forward(self, *arrays, segment, inputs) -> np.ndarray:
+        tensors = [Tensor.from_numpy(x) for x in arrays[:inputs]]
+        with autograd.no_grad():
+            result = segment(*tensors)
+
+        self.save_for_backward(segment, amp._state.dtype, *arrays[:inputs])
+        return result.data
+
+    def backward(self, grad) -> tuple:
+        # Recompute the segment, in the precision of the forward pass, onto a tape
+        # of its own and propagate through it. The gradients of the parameters
+        # are accumulated by that pass, those of the inputs are passed on.
+        segment, dtype, *arrays = self.saved_tensors
+        inputs = [Tensor.from_numpy(x, requires_grad=need)
+                  for x, need in zip(arrays, self.needs_input_grad)]
+
+        with autograd._recompute(), amp.autocast(enabled=dtype is not None, dtype=dtype or np.float16):
+            result = segment(*inputs)
+        autograd.backward(result, grad)
+
+        grads = tuple(t.grad for t in inputs)
+        return grads + (None, ) * (len(self.needs_input_grad) - len(grads))
+
+def checkpoint(segment, *inputs) -> Tensor:
+    """ Apply the segment to the inputs without keeping its intermediate tensors
+    alive until the backwards pass, as ``segment(*inputs)`` would. Only the
+    inputs are saved, the segment is executed a second time during backward
+    to recompute the rest. This trades one extra forward pass of the segment
+    for not holding its activations, e.g. checkpointing every ``k``-th module
+    of a ``Sequential`` of ``n`` modules, with ``k`` close to ``sqrt(n)``,
+    keeps O(sqrt(n)) activations alive instead of O(n).
+
+    The segment has to be deterministic and its parameters, found through its
+    ``parameters`` method if it has one, must not be modified before the
+    backwards pass. Outside of DAG construction, or in lazy mode, the segment
+    is simply applied.
+
+    Parameters
+    ----------
+    segment: Module | callable
+        The part of the model to checkpoint, returning a single tensor.
+    *inputs: Tensor
+        The tensors to apply the segment to.
+
+    """
+    if not autograd.is_grad_enabled() or current_graph() is not None:
+        return segment(*inputs)
+
+    params = segment.parameters() if hasattr(segment, 'parameters') else ()
+    return Checkpoint.apply(*inputs, *params, segment=segment, inputs=len(inputs))
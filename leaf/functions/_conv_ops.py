@@ -0,0 +1,66 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf.backend import dispatch
+from .function import Function
+from ._im2col import pair
+from typing import Tuple
+
+class Conv2d(Function):
+    def forward(self, x, w, b=None, stride=1, padding=0, dilation=1, out=None) -> np.ndarray:
+        stride, padding, dilation = pair(stride), pair(padding), pair(dilation)
+        if x.ndim != 4 or w.ndim != 4 or x.shape[1] != w.shape[1]:
+            raise ValueError(
+                f'Conv2d expects input (N, C, H, W) and weight (C_out, C, kh, kw), ' \
+                f'got {x.shape} and {w.shape}.'
+            )
+        if min(stride) < 1 or min(dilation) < 1 or min(padding) < 0:
+            raise ValueError(f'Invalid {stride=}, {padding=} or {dilation=}.')
+
+        # Each operand is only needed for the gradient of the other one.
+        self.save_for_backward(
+            x.shape, w.shape, stride, padding, dilation,
+            x if self.needs_input_grad[1] else None,
+            w if self.needs_input_grad[0] else None,
+        )
+        result = dispatch('conv2d', self.device, x, w, stride=stride,
+            padding=padding, dilation=dilation, out=out)
+        if b is not None:
+            np.add(result, b.reshape(-1, 1, 1), out=result)
+        return result
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        xshape, wshape, stride, padding, dilation, x, w, = self.saved_tensors
+        needs_input_grad = self.needs_input_grad
+
+        dx = dispatch('conv2d_input_grad', self.device, grad, w, shape=xshape,
+            stride=stride, padding=padding, dilation=dilation) if needs_input_grad[0] else None
+        dw = dispatch('conv2d_weight_grad', self.device, grad, x, shape=wshape,
+            stride=stride, padding=padding, dilation=dilation) if needs_input_grad[1] else None
+        db = grad.sum(axis=(0, 2, 3)) if len(needs_input_grad) > 2 and needs_input_grad[2] else None
+        return dx, dw, db
@@ -0,0 +1,131 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import string
+import numpy as np
+from functools import lru_cache
+from collections import Counter
+from typing import Tuple
+
+@lru_cache(maxsize=1024)
+def normalize(subscripts, shapes) -> Tuple[Tuple[str], str]:
+    """ Return the subscripts of every operand and of the output, with
+    ellipses expanded to explicit letters and the output of implicit mode
+    made explicit, i.e. the letters appearing once in alphabetical order.
+
+    Parameters
+    ----------
+    subscripts: str
+        The subscripts as passed to ``einsum``, e.g. '...ij,...jk->...ik'.
+    shapes: tuple
+        Shapes of the operands.
+
+    """
+    subscripts = subscripts.replace(' ', '')
+    inputs, output = subscripts.split('->') if '->' in subscripts else (subscripts, None)
+    terms = inputs.split(',')
+    if len(terms) != len(shapes):
+        raise ValueError(f'Subscripts {subscripts} specify {len(terms)} operands, got {len(shapes)}.')
+
+    unused = [c for c in string.ascii_letters if c not in subscripts]
+    n_ellipsis = max([len(shape) - len(term) + 3 for term, shape in zip(terms, shapes)
+                      if '...' in term] or [0])
+    ellipsis = ''.join(unused[:n_ellipsis])
+
+    expanded = []
+    for term, shape in zip(terms, shapes):
+        if '...' in term:
+            n = len(shape) - len(term) + 3
+            term = term.replace('...', ellipsis[n_ellipsis - n:] if n > 0 else '')
+        if len(term) != len(shape):
+            raise ValueError(f'Subscripts {term} do not match operand of shape {shape}.')
+        expanded.append(term)
+
+    if output is None:
+        counts = Counter(''.join(expanded))
+        output = ellipsis + ''.join(sorted(
+            c for c, count in counts.items() if count == 1 and c not in ellipsis
+        ))
+    else:
+        output = output.replace('...', ellipsis)
+    return tuple(expanded), output
+
+@lru_cache(maxsize=1024)
+def contraction_path(subscripts, shapes) -> list:
+    """ Return the order in which to contract the operands, as found by
+    ``np.einsum_path``. Passing it on to ``np.einsum`` has pairwise
+    contractions run as BLAS matrix products. The path only depends on the
+    shapes, so it is computed once per pair of subscripts and shapes.
+
+    """
+    operands = [np.broadcast_to(np.float32(0.0), shape) for shape in shapes]
+    return np.einsum_path(subscripts, *operands, optimize='greedy')[0]
+
+def gradient_subscripts(inputs, output, index) -> Tuple[str, str]:
+    """ Return the subscripts computing the gradient of operand ``index``
+    from the gradient of the output and the other operands, together with
+    the letters of the operand it produces. Letters that only the operand
+    itself has, i.e. axes it was summed over, are left out, the gradient
+    is broadcast along them afterwards. A letter repeated in the operand,
+    i.e. a diagonal of it, appears once, see ``expand``.
+
+    """
+    term = inputs[index]
+    others = inputs[:index] + inputs[index + 1:]
+    available = set(output).union(*others)
+    target = ''.join(c for c in dict.fromkeys(term) if c in available)
+    return ','.join((output, ) + others) + '->' + target, target
+
+def expand(grad, term, target, shape) -> np.ndarray:
+    """ Expand the gradient computed for the letters of ``target`` to the
+    operand of subscripts ``term`` and ``shape``. Axes of size one that were
+    broadcast are summed over, axes the operand was summed over are
+    broadcast to, the latter as a read-only view. If a letter is repeated
+    in ``term`` only the diagonal of the operand contributed to the result,
+    the gradient is written to the diagonal of a zero array through the
+    writeable view ``np.einsum`` returns for it.
+
+    """
+    unique = ''.join(dict.fromkeys(term))
+    if unique != term:
+        sizes = dict(zip(term, shape))
+        diagonal = expand(grad, unique, target, tuple(sizes[c] for c in unique))
+        result = np.zeros(shape, dtype=diagonal.dtype)
+        np.einsum(f'{term}->{unique}', result)[...] = diagonal
+        return result
+
+    if target != term:
+        sizes = dict(zip(target, grad.shape))
+        grad = grad.reshape(tuple(sizes.get(c, 1) for c in term))
+
+    axes = tuple(i for i, (a, b) in enumerate(zip(grad.shape, shape)) if b == 1 and a != 1)
+    if axes:
+        grad = grad.sum(axis=axes, keepdims=True)
+
+    if grad.shape != shape:
+        grad = np.broadcast_to(grad, shape)
+    return grad
@@ -0,0 +1,172 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import backend
+from .function import Function
+from typing import Tuple
+
+# Number of elements processed per block, small enough for the scratch
+# buffers of a whole chain to stay resident in cache.
+BLOCK_SIZE = 1 << 14
+
+def _exp(x, y, out):
+    np.clip(x, -50, 50, out=out)
+    return np.exp(out, out=out)
+
+_FORWARD = {
+    'Exp': _exp,
+    'Log': lambda x, y, out: np.log(x, out=out),
+    'ReLU': lambda x, y, out: np.maximum(x, 0.0, out=out),
+    'Add': lambda x, y, out: np.add(x, y, out=out),
+    'Sub': lambda x, y, out: np.subtract(x, y, out=out),
+    'Mul': lambda x, y, out: np.multiply(x, y, out=out),
+    'Div': lambda x, y, out: np.divide(x, y, out=out),
+    'Pow': lambda x, y, out: np.power(x, y, out=out),
+}
+
+_BACKWARD = {
+    'Exp': lambda g, x, y, r: (g * r, None),
+    'Log': lambda g, x, y, r: (g / x, None),
+    'ReLU': lambda g, x, y, r: (g * (x > 0.0), None),
+    'Add': lambda g, x, y, r: (g, g),
+    'Sub': lambda g, x, y, r: (g, -g),
+    'Mul': lambda g, x, y, r: (g * y, g * x),
+    'Div': lambda g, x, y, r: (g / y, -g * x / (y * y)),
+    'Pow': lambda g, x, y, r: (g * y * x ** (y - 1), g * r * np.log(x)),
+}
+
+# Opcodes of the leafrs fused kernel, has to match ``rust_fn::fused_elementwise``.
+_OPCODES = {name: code for code, name in enumerate(_FORWARD)}
+
+UNARY = ('Exp', 'Log', 'ReLU')
+BINARY = ('Add', 'Sub', 'Mul', 'Div', 'Pow')
+
+def _blocks(size):
+    for start in range(0, size, BLOCK_SIZE):
+        yield slice(start, min(start + BLOCK_SIZE, size))
+
+def _flatten(arrays, size) -> list:
+    """ Return full size inputs as flat views and size one inputs as scalars. """
+    return [x.reshape(-1) if x.size == size else x.reshape(()) for x in arrays]
+
+def _run_block(program, inputs, block, scratch, out=None) -> list:
+    """ Execute the program on one block of the inputs, returning all registers.
+    Intermediate results are written into the scratch buffers, the last one
+    into ``out`` if it is provided. """
+    n = block.stop - block.start
+    registers = [x[block] if x.ndim else x for x in inputs]
+    for k, (name, a, b) in enumerate(program):
+        result = scratch[k][:n] if out is None or k < len(program) - 1 else out[block]
+        registers.append(_FORWARD[name](registers[a], registers[b], result))
+    return registers
+
+class FusedElementwise(Function):
+    """ A chain of elementwise ops executed as a single op. The chain is given
+    as a program, a tuple of ``(op, a, b)`` instructions where ``a`` and ``b``
+    index registers. The inputs are registers ``0, ..., n - 1`` and the result
+    of instruction ``k`` is register ``n + k``, unary ops ignore ``b``. The
+    result of the last instruction is the output.
+
+    All inputs have to be of the output shape or of size one. The chain is
+    computed in a single pass over the data, block by block, such that no
+    full size temporaries are written. The backwards pass only saves the
+    inputs and recomputes the intermediate results block by block.
+
+    """
+    def forward(self, *inputs, program=None, out=None) -> np.ndarray:
+        shape = np.broadcast_shapes(*(x.shape for x in inputs))
+        self.save_for_backward(program, shape, *inputs)
+
+        fused = getattr(backend.rust(), 'fused_elementwise', None)
+        if fused is not None and out is None and all(x.dtype == np.float32 for x in inputs):
+            codes = [(_OPCODES[name], a, b) for name, a, b in program]
+            return fused(codes, list(inputs), list(shape))
+
+        size = int(np.prod(shape))
+        dtype = np.result_type(*inputs)
+        if out is not None and out.flags.c_contiguous and out.shape == shape:
+            result = out
+        else:
+            result = np.empty(shape, dtype=dtype)
+        flat = _flatten(inputs, size)
+        scratch = [np.empty(min(size, BLOCK_SIZE), dtype=dtype) for _ in program[:-1]]
+
+        blocks = result.reshape(-1)
+        for block in _blocks(size):
+            _run_block(program, flat, block, scratch, out=blocks)
+
+        if out is not None and result is not out:
+            out[...] = result
+            return out
+        return result
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        program, shape, *inputs = self.saved_tensors
+        size = int(np.prod(shape))
+        dtype = np.result_type(*inputs)
+
+        flat = _flatten(inputs, size)
+        grad = np.broadcast_to(grad, shape).reshape(-1)
+        scratch = [np.empty(min(size, BLOCK_SIZE), dtype=dtype) for _ in program]
+        gradients = [
+            (np.empty(size, dtype=dtype) if x.size == size else np.zeros((), dtype=dtype))
+            if needs_grad else None
+            for x, needs_grad in zip(inputs, self.needs_input_grad)
+        ]
+
+        for block in _blocks(size):
+            registers = _run_block(program, flat, block, scratch)
+            partials = [None] * len(registers)
+            partials[-1] = grad[block]
+
+            for k in range(len(program) - 1, -1, -1):
+                name, a, b = program[k]
+                g = partials[len(inputs) + k]
+                if g is None:
+                    continue
+
+                ga, gb = _BACKWARD[name](g, registers[a], registers[b], registers[len(inputs) + k])
+                for register, partial in ((a, ga), (b, gb)):
+                    if partial is not None:
+                        partials[register] = partial if partials[register] is None \
+                            else partials[register] + partial
+
+            for gradient, partial in zip(gradients, partials):
+                if gradient is None:
+                    continue
+                if partial is None:
+                    partial = 0.0
+                if gradient.ndim:
+                    gradient[block] = partial
+                else:
+                    gradient += np.sum(partial)
+
+        return tuple(
+            None if gradient is None else gradient.reshape(x.shape)
+            for x, gradient in zip(inputs, gradients)
+        )
@@ -0,0 +1,163 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+""" Generator of ``leaf/functions/_registry.py``, the static table binding
+every op to a Tensor method. Rerun it after adding an op to one of the
+``*_ops.py`` modules with
+
+    python -m leaf.functions._generate
+
+"""
+
+import os
+import sys
+import inspect
+import importlib
+from leaf.functions.function import Function
+
+DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+REGISTRY_PATH = os.path.join(DIRECTORY, '_registry.py')
+
+# Python operators implemented by an op, as (operator, reflected operator).
+OPERATORS = {
+    'add': ('__add__', '__radd__'),
+    'sub': ('__sub__', '__rsub__'),
+    'mul': ('__mul__', '__rmul__'),
+    'div': ('__truediv__', '__rtruediv__'),
+    'pow': ('__pow__', '__rpow__'),
+    'matmul': ('__matmul__', '__rmatmul__'),
+}
+
+def collect_ops() -> dict:
+    """ Return the op classes defined in the ``*_ops.py`` modules, keyed on
+    their module name, in the order the methods are bound to Tensor. """
+    modules = sorted(
+        f[:-len('.py')] for f in os.listdir(DIRECTORY) if f.endswith('_ops.py')
+    )
+
+    ops = {}
+    for name in modules:
+        module = importlib.import_module('leaf.functions.' + name)
+        ops[name] = [
+            cls for _, cls in inspect.getmembers(module, inspect.isclass)
+            if issubclass(cls, Function) and cls.__module__ == module.__name__
+        ]
+    return ops
+
+def render() -> str:
+    """ Return the source of the registry module. """
+    with open(__file__) as f:
+        header = ''.join(f.readlines()[:26])
+
+    ops = collect_ops()
+    lines = [
+        header,
+        '# This file is generated by ``python -m leaf.functions._generate``, do',
+        '# not edit it by hand.',
+        '',
+        'import numbers',
+        'import numpy as np',
+        'from leaf.tensor import Tensor',
+    ]
+    for module, classes in ops.items():
+        names = ', '.join(cls.__name__ for cls in classes)
+        lines.append(f'from leaf.functions.{module} import {names}')
+
+    lines += [
+        '',
+        'def _operand(tensor, other):',
+        '    """ Return the other operand of a Python operator as a tensor, or None',
+        '    if it is not a tensor, a number or an array. Numbers take the datatype',
+        '    NumPy promotes the tensor and the number to, so that e.g. ``x * 2`` does',
+        '    not upcast half tensors while ``x * 0.5`` does not truncate the number',
+        '    for integer tensors. """',
+        '    if isinstance(other, Tensor):',
+        '        return other',
+        '    if isinstance(other, numbers.Number):',
+        '        dtype = np.result_type(tensor.dtype, other)',
+        '        return Tensor(other, dtype=dtype, device=tensor.device)',
+        '    if isinstance(other, np.ndarray):',
+        '        return Tensor(other, dtype=other.dtype, device=tensor.device, copy=False)',
+        '    return None',
+    ]
+
+    for classes in ops.values():
+        for cls in classes:
+            method = cls.__name__.lower()
+            lines += [
+                '',
+                f'def {method}(self, *tensors, **kwargs) -> Tensor:',
+                f'    return {cls.__name__}.apply(self, *tensors, **kwargs)',
+            ]
+
+            if method not in OPERATORS:
+                continue
+
+            operator, reflected = OPERATORS[method]
+            lines += [
+                '',
+                f'def {operator}(self, other) -> Tensor:',
+                '    other = _operand(self, other)',
+                '    if other is None:',
+                '        return NotImplemented',
+                f'    return {cls.__name__}.apply(self, other)',
+                '',
+                f'def {reflected}(self, other) -> Tensor:',
+                '    other = _operand(self, other)',
+                '    if other is None:',
+                '        return NotImplemented',
+                f'    return {cls.__name__}.apply(other, self)',
+            ]
+
+    lines += [
+        '',
+        'def __neg__(self) -> Tensor:',
+        '    return Mul.apply(self, Tensor(-1, dtype=self.dtype, device=self.device))',
+        '',
+        'METHODS = {',
+    ]
+    for classes in ops.values():
+        for cls in classes:
+            method = cls.__name__.lower()
+            lines.append(f"    '{method}': {method},")
+            for operator in OPERATORS.get(method, ()):
+                lines.append(f"    '{operator}': {operator},")
+    lines += [
+        "    '__neg__': __neg__,",
+        '}',
+        '',
+        'for _name, _method in METHODS.items():',
+        '    setattr(Tensor, _name, _method)',
+        '',
+    ]
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+    source = render()
+    with open(REGISTRY_PATH, 'w') as f:
+        f.write(source)
+    print(f'Wrote {sum(len(c) for c in collect_ops().values())} ops to {REGISTRY_PATH}', file=sys.stderr)
@@ -0,0 +1,166 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+""" NumPy kernels of the 2D convolution. The input is unfolded into columns,
+one per output position holding the input pixels the kernel is multiplied
+with there, which turns the convolution into a single matrix product with
+the flattened kernel. The Rust kernels in ``leafrs`` follow the same
+strategy, parallelized over the batch. """
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from leaf import memory
+from leaf.backend import register_kernel
+from typing import Tuple
+
+def pair(value) -> Tuple[int, int]:
+    """ Return the value for both spatial axes, given an int or a pair. """
+    if isinstance(value, (tuple, list)):
+        if len(value) != 2:
+            raise ValueError(f'Expected a pair of values, got {value}.')
+        return int(value[0]), int(value[1])
+    return int(value), int(value)
+
+def output_shape(shape, kernel, stride, padding, dilation) -> Tuple[int, int]:
+    """ Return the spatial shape of the convolution output for an input of
+    spatial ``shape`` and a kernel of spatial shape ``kernel``. """
+    sizes = []
+    for size, k, s, p, d in zip(shape, kernel, stride, padding, dilation):
+        span = d * (k - 1) + 1
+        if size + 2 * p < span:
+            raise ValueError(
+                f'Kernel of size {kernel} with dilation {dilation} does not fit into ' \
+                f'input of size {shape} with padding {padding}.'
+            )
+        sizes.append((size + 2 * p - span) // s + 1)
+    return tuple(sizes)
+
+def pad(x, padding, value=0.0) -> np.ndarray:
+    """ Return the input padded with ``value`` on both sides of each spatial
+    axis, drawn from the pool, or the input itself without padding. """
+    ph, pw = padding
+    if not ph and not pw:
+        return x
+
+    n, c, h, w = x.shape
+    padded = memory.empty((n, c, h + 2 * ph, w + 2 * pw), x.dtype)
+    padded.fill(value)
+    padded[:, :, ph:ph + h, pw:pw + w] = x
+    return padded
+
+def offsets(x, kernel, stride, dilation, shape):
+    """ Yield the index k = i * kw + j of every kernel offset (i, j), together
+    with a strided view of the pixels it covers at the output positions, of
+    spatial ``shape``. The views are slices of ``x``, nothing is copied, and
+    as no two output positions share a pixel, writes through them do not
+    overlap. """
+    (kh, kw), (sh, sw), (dh, dw), (ho, wo) = kernel, stride, dilation, shape
+    for i in range(kh):
+        for j in range(kw):
+            top, left = i * dh, j * dw
+            yield i * kw + j, x[:, :, top:top + sh * (ho - 1) + 1:sh, left:left + sw * (wo - 1) + 1:sw]
+
+def im2col(x, kernel, stride, padding, dilation) -> np.ndarray:
+    """ Return the columns of the input, of shape (N, C * kh * kw, Ho * Wo),
+    where row (c, i, j) holds the pixels of channel c that kernel offset
+    (i, j) is multiplied with, for every output position. The array is
+    drawn from the pool. """
+    n, c = x.shape[:2]
+    (kh, kw), (sh, sw), (dh, dw) = kernel, stride, dilation
+    ho, wo = output_shape(x.shape[2:], kernel, stride, padding, dilation)
+
+    padded = pad(x, padding)
+    sn, sc, sy, sx = padded.strides
+    windows = as_strided(padded, shape=(n, c, kh, kw, ho, wo),
+        strides=(sn, sc, sy * dh, sx * dw, sy * sh, sx * sw), writeable=False)
+
+    cols = memory.empty((n, c * kh * kw, ho * wo), x.dtype)
+    cols.reshape(n, c, kh, kw, ho, wo)[...] = windows
+    if padded is not x:
+        windows = None
+        memory.release(padded)
+    return cols
+
+def col2im(cols, shape, kernel, stride, padding, dilation) -> np.ndarray:
+    """ Inverse of ``im2col``, summing the columns back into an input of
+    ``shape``, which is the gradient of the input given the gradient of
+    its columns. """
+    n, c, h, w = shape
+    (kh, kw), (sh, sw), (dh, dw), (ph, pw) = kernel, stride, dilation, padding
+    ho, wo = output_shape((h, w), kernel, stride, padding, dilation)
+
+    padded = memory.zeros((n, c, h + 2 * ph, w + 2 * pw), cols.dtype)
+    cols = cols.reshape(n, c, kh * kw, ho, wo)
+    for k, view in offsets(padded, kernel, stride, dilation, (ho, wo)):
+        view += cols[:, :, k]
+
+    if ph or pw:
+        return padded[:, :, ph:ph + h, pw:pw + w]
+    return padded
+
+@register_kernel('conv2d', 'cpu')
+def conv2d(x, w, stride, padding, dilation, out=None) -> np.ndarray:
+    n, co = x.shape[0], w.shape[0]
+    cols = im2col(x, w.shape[2:], stride, padding, dilation)
+    ho, wo = output_shape(x.shape[2:], w.shape[2:], stride, padding, dilation)
+
+    weights = w.reshape(co, -1)
+    if out is not None and out.flags.c_contiguous:
+        np.matmul(weights, cols, out=out.reshape(n, co, ho * wo))
+        result = out
+    else:
+        result = np.matmul(weights, cols).reshape(n, co, ho, wo)
+        if out is not None:
+            out[...] = result
+            result = out
+
+    memory.release(cols)
+    return result
+
+@register_kernel('conv2d_input_grad', 'cpu')
+def conv2d_input_grad(grad, w, shape, stride, padding, dilation) -> np.ndarray:
+    n, co = grad.shape[:2]
+    weights = w.reshape(co, -1)
+    cols = np.matmul(weights.T, grad.reshape(n, co, -1),
+        out=memory.empty((n, weights.shape[1], grad.shape[2] * grad.shape[3]), np.result_type(grad, w)))
+
+    dx = col2im(cols, shape, w.shape[2:], stride, padding, dilation)
+    memory.release(cols)
+    return dx
+
+@register_kernel('conv2d_weight_grad', 'cpu')
+def conv2d_weight_grad(grad, x, shape, stride, padding, dilation) -> np.ndarray:
+    n, co = grad.shape[:2]
+    cols = im2col(x, shape[2:], stride, padding, dilation)
+    # One product per image summed afterwards, which unlike a single tensordot
+    # over the batch does not need a transposed copy of the columns.
+    partial = np.matmul(grad.reshape(n, co, -1), cols.transpose(0, 2, 1),
+        out=memory.empty((n, co, cols.shape[1]), np.result_type(grad, cols)))
+    dw = partial.sum(axis=0).reshape(shape)
+    memory.release(cols)
+    memory.release(partial)
+    return dw
@@ -0,0 +1,94 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from .function import InplaceFunction
+from ._broadcast import unbroadcast
+from ._unary_ops import _clamp_mask
+from typing import Tuple
+
+class Add_(InplaceFunction):
+    def forward(self, x, y) -> np.ndarray:
+        self.save_for_backward(y.shape)
+        return np.add(x, y, out=x)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        yshape, = self.saved_tensors
+        return grad, unbroadcast(grad, yshape)
+
+class Sub_(InplaceFunction):
+    def forward(self, x, y) -> np.ndarray:
+        self.save_for_backward(y.shape)
+        return np.subtract(x, y, out=x)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        yshape, = self.saved_tensors
+        return grad, -unbroadcast(grad, yshape)
+
+class Mul_(InplaceFunction):
+    def forward(self, x, y) -> np.ndarray:
+        # The original values of x are only needed for the gradient of y,
+        # so they are copied before being overwritten only if required. The
+        # same holds for y when it aliases x, e.g. ``h.mul_(h)``.
+        if np.shares_memory(x, y):
+            y = y.copy()
+        self.save_for_backward(y, x.copy() if self.needs_input_grad[1] else None)
+        return np.multiply(x, y, out=x)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        y, x, = self.saved_tensors
+        return grad * y, None if x is None else unbroadcast(grad * x, y.shape)
+
+class ReLU_(InplaceFunction):
+    def forward(self, x) -> np.ndarray:
+        self.save_for_backward(x)
+        return np.maximum(x, 0.0, out=x)
+
+    def backward(self, grad) -> np.ndarray:
+        result, = self.saved_tensors
+        return grad * (result > 0.0)
+
+class Exp_(InplaceFunction):
+    def forward(self, x) -> np.ndarray:
+        self.save_for_backward(x)
+        np.clip(x, -50, 50, out=x)
+        return np.exp(x, out=x)
+
+    def backward(self, grad) -> np.ndarray:
+        result, = self.saved_tensors
+        return grad * result
+
+class Clamp_(InplaceFunction):
+    def forward(self, x, low=None, high=None) -> np.ndarray:
+        self.save_for_backward(
+            _clamp_mask(x, low, high) if self.needs_input_grad[0] else None
+        )
+        return np.clip(x, low, high, out=x)
+
+    def backward(self, grad) -> np.ndarray:
+        mask, = self.saved_tensors
+        return grad * mask
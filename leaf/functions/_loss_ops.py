@@ -0,0 +1,113 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import memory
+from .function import Function
+from ._broadcast import unbroadcast
+from typing import Tuple
+
+def _indices(x, targets) -> np.ndarray:
+    """ Return the class index targets as an integer array, one per row of x. """
+    if x.ndim != 2 or targets.shape != (x.shape[0], ):
+        raise ValueError(
+            f'Expected inputs of shape (batch, classes) and targets of shape (batch, ), ' \
+            f'got {x.shape} and {targets.shape}.'
+        )
+    return targets if targets.dtype.kind in 'iu' else targets.astype(np.intp)
+
+def _scale(grad, n) -> float:
+    """ Return the gradient of the loss, a single element, divided by n. """
+    return float(np.asarray(grad).reshape(-1)[0]) / n
+
+def _loss(value, dtype, out) -> np.ndarray:
+    if out is None:
+        return np.asarray(value, dtype=dtype)
+    out[...] = value
+    return out
+
+class NLL(Function):
+    def forward(self, x, targets, out=None) -> np.ndarray:
+        # Mean negative log likelihood of the targets given log probabilities, the
+        # target entries are gathered by index instead of through a one-hot matrix.
+        indices = _indices(x, targets)
+        self.save_for_backward(x.shape, x.dtype, indices)
+        return _loss(-x[np.arange(x.shape[0]), indices].mean(), x.dtype, out)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        shape, dtype, indices, = self.saved_tensors
+        dx = memory.zeros(shape, dtype)
+        dx[np.arange(shape[0]), indices] = -_scale(grad, shape[0])
+        return dx, None
+
+class CrossEntropy(Function):
+    def forward(self, x, targets, out=None) -> np.ndarray:
+        # Log-softmax followed by the negative log likelihood. The log-sum-exp is
+        # shifted by the row maximum, which keeps it from overflowing. The maximum
+        # and the shifted log-sum-exp are saved apart, as adding them back up loses
+        # the precision of the log-sum-exp for large logits, O(batch) extra memory.
+        indices = _indices(x, targets)
+        rows = np.arange(x.shape[0])
+
+        peak = x.max(axis=1, keepdims=True)
+        shifted = np.subtract(x, peak, out=memory.empty_result(x))
+        logsumexp = np.log(np.exp(shifted, out=shifted).sum(axis=1, keepdims=True))
+        memory.release(shifted)
+
+        self.save_for_backward(x, indices, peak, logsumexp)
+        loss = (logsumexp[:, 0] - (x[rows, indices] - peak[:, 0])).mean()
+        return _loss(loss, x.dtype, out)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        # Softmax minus one at the targets, computed in a single buffer.
+        x, indices, peak, logsumexp, = self.saved_tensors
+        scale = _scale(grad, x.shape[0])
+
+        dx = np.subtract(x, peak, out=memory.empty_result(x))
+        np.subtract(dx, logsumexp, out=dx)
+        np.exp(dx, out=dx)
+        dx[np.arange(x.shape[0]), indices] -= 1.0
+        np.multiply(dx, scale, out=dx)
+        return dx, None
+
+class MSE(Function):
+    def forward(self, x, y, out=None) -> np.ndarray:
+        # The difference is reduced with a dot product instead of being squared first.
+        self.save_for_backward(x, y)
+        diff = np.subtract(x, y, out=memory.empty_result(x, y))
+        loss = np.vdot(diff, diff) / diff.size
+        memory.release(diff)
+        return _loss(loss, np.result_type(x, y), out)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        x, y, = self.saved_tensors
+        diff = np.subtract(x, y, out=memory.empty_result(x, y))
+        np.multiply(diff, 2.0 * _scale(grad, diff.size), out=diff)
+
+        dx = unbroadcast(diff, x.shape) if self.needs_input_grad[0] else None
+        dy = -unbroadcast(diff, y.shape) if self.needs_input_grad[1] else None
+        return dx, dy
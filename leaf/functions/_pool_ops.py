@@ -0,0 +1,141 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import memory
+from leaf.backend import dispatch, register_kernel
+from .function import Function
+from ._im2col import pair, pad, offsets, output_shape
+from typing import Tuple
+
+_NO_DILATION = (1, 1)
+
+def _pool_arguments(x, kernel_size, stride, padding) -> Tuple[tuple, tuple, tuple]:
+    kernel = pair(kernel_size)
+    stride = kernel if stride is None else pair(stride)
+    padding = pair(padding)
+    if x.ndim != 4:
+        raise ValueError(f'Pooling expects input (N, C, H, W), got {x.shape}.')
+    if min(stride) < 1 or min(padding) < 0 or padding[0] > kernel[0] // 2 or padding[1] > kernel[1] // 2:
+        raise ValueError(f'Invalid {stride=} or {padding=} for kernel of size {kernel}.')
+    return kernel, stride, padding
+
+def _index_dtype(kernel) -> np.dtype:
+    return np.dtype(np.uint8) if kernel[0] * kernel[1] <= 256 else np.dtype(np.int32)
+
+def _unpad(dx, shape, padding) -> np.ndarray:
+    ph, pw = padding
+    if ph or pw:
+        return dx[:, :, ph:ph + shape[2], pw:pw + shape[3]]
+    return dx
+
+@register_kernel('max_pool2d', 'cpu')
+def max_pool2d(x, kernel, stride, padding, out=None) -> Tuple[np.ndarray, np.ndarray]:
+    """ Return the maximum of every window, together with the index of the
+    kernel offset it was found at. The windows are visited one kernel offset
+    at a time through strided views, so besides the result and its indices
+    only a mask of the output size is allocated. """
+    shape = x.shape[:2] + output_shape(x.shape[2:], kernel, stride, padding, _NO_DILATION)
+    padded = pad(x, padding, -np.inf)
+    views = offsets(padded, kernel, stride, _NO_DILATION, shape[2:])
+
+    _, first = next(views)
+    result = np.array(first) if out is None else out
+    if out is not None:
+        out[...] = first
+
+    indices = np.zeros(shape, dtype=_index_dtype(kernel))
+    mask = np.empty(shape, dtype=bool)
+    for k, view in views:
+        np.greater(view, result, out=mask)
+        np.copyto(result, view, where=mask)
+        np.copyto(indices, k, where=mask)
+
+    if padded is not x:
+        first = view = views = None
+        memory.release(padded)
+    return result, indices
+
+@register_kernel('avg_pool2d', 'cpu')
+def avg_pool2d(x, kernel, stride, padding, out=None) -> np.ndarray:
+    """ Return the mean of every window, padding included, summed one kernel
+    offset at a time through strided views. """
+    shape = x.shape[:2] + output_shape(x.shape[2:], kernel, stride, padding, _NO_DILATION)
+    padded = pad(x, padding)
+    views = offsets(padded, kernel, stride, _NO_DILATION, shape[2:])
+
+    _, first = next(views)
+    result = np.array(first) if out is None else out
+    if out is not None:
+        out[...] = first
+    for _, view in views:
+        np.add(result, view, out=result)
+    np.multiply(result, 1.0 / (kernel[0] * kernel[1]), out=result)
+
+    if padded is not x:
+        first = view = views = None
+        memory.release(padded)
+    return result
+
+class MaxPool2d(Function):
+    def forward(self, x, kernel_size=2, stride=None, padding=0, out=None) -> np.ndarray:
+        kernel, stride, padding = _pool_arguments(x, kernel_size, stride, padding)
+        result, indices = dispatch('max_pool2d', self.device, x, kernel=kernel,
+            stride=stride, padding=padding, out=out)
+
+        # Only the argmax offsets are kept, not the input nor a mask of its size.
+        self.save_for_backward(x.shape, kernel, stride, padding, indices)
+        return result
+
+    def backward(self, grad) -> np.ndarray:
+        xshape, kernel, stride, padding, indices, = self.saved_tensors
+        n, c, h, w = xshape
+
+        dx = memory.zeros((n, c, h + 2 * padding[0], w + 2 * padding[1]), grad.dtype)
+        mask = np.empty(grad.shape, dtype=bool)
+        for k, view in offsets(dx, kernel, stride, _NO_DILATION, grad.shape[2:]):
+            np.equal(indices, k, out=mask)
+            np.add(view, grad, out=view, where=mask)
+        return _unpad(dx, xshape, padding)
+
+class AvgPool2d(Function):
+    def forward(self, x, kernel_size=2, stride=None, padding=0, out=None) -> np.ndarray:
+        kernel, stride, padding = _pool_arguments(x, kernel_size, stride, padding)
+        self.save_for_backward(x.shape, kernel, stride, padding)
+        return dispatch('avg_pool2d', self.device, x, kernel=kernel,
+            stride=stride, padding=padding, out=out)
+
+    def backward(self, grad) -> np.ndarray:
+        xshape, kernel, stride, padding, = self.saved_tensors
+        n, c, h, w = xshape
+
+        dx = memory.zeros((n, c, h + 2 * padding[0], w + 2 * padding[1]), grad.dtype)
+        grad = np.multiply(grad, 1.0 / (kernel[0] * kernel[1]), out=memory.empty_result(grad))
+        for _, view in offsets(dx, kernel, stride, _NO_DILATION, grad.shape[2:]):
+            view += grad
+        memory.release(grad)
+        return _unpad(dx, xshape, padding)
@@ -22,18 +22,113 @@
 # SOFTWARE.
 #
 # File created: 2022-11-18
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 import numpy as np
+from leaf import memory
+from leaf.backend import dispatch
 from .function import Function
+from ._broadcast import unbroadcast
+from . import _einsum
 from typing import Tuple
 
+def _matmul_grad(a, b, shape) -> np.ndarray:
+    """ Return ``a @ b`` reverted to ``shape``, the operand the gradient is of,
+    where ``a`` and ``b`` are the gradient of the result and the other
+    operand, in the order of the product. A matrix that was broadcast over
+    the batch axes of the other operand has its gradient summed over them,
+    which is then folded into the contraction, as a single matrix product
+    rather than one per batch entry that is reduced afterwards.
+
+    """
+    batch = np.broadcast_shapes(a.shape[:-2], b.shape[:-2])
+    if len(shape) == 2 and batch and a.shape[:-2] == b.shape[:-2]:
+        axes = tuple(range(len(batch)))
+        return np.tensordot(a, b, axes=(axes + (a.ndim - 1, ), axes + (b.ndim - 2, )))
+
+    grad = np.matmul(a, b, out=memory.empty(batch + (a.shape[-2], b.shape[-1]), np.result_type(a, b)))
+    return unbroadcast(grad, shape)
+
 class Matmul(Function):
-    def forward(self, x, y) -> np.ndarray:
-        self.save_for_backward(x, y)
-        return x @ y
+    def forward(self, x, y, out=None) -> np.ndarray:
+        # Each operand is only needed for the gradient of the other one.
+        self.save_for_backward(
+            x.shape, y.shape,
+            x if self.needs_input_grad[1] else None,
+            y if self.needs_input_grad[0] else None,
+        )
+        return dispatch('matmul', self.device, x, y, out=out)
     
     def backward(self, grad) -> Tuple[np.ndarray]:
-        x, y, = self.saved_tensors
-        return grad @ y.T, x.T @ grad
+        xshape, yshape, x, y, = self.saved_tensors
+
+        # Vector operands are matrices of a single row, or column for y, of which
+        # the axis is removed from the result.
+        xmatrix, ymatrix = xshape, yshape
+        if len(yshape) == 1:
+            ymatrix, grad = yshape + (1, ), grad[..., None]
+            y = None if y is None else y[:, None]
+        if len(xshape) == 1:
+            xmatrix, grad = (1, ) + xshape, np.expand_dims(grad, -2)
+            x = None if x is None else x[None, :]
+
+        dx = _matmul_grad(grad, np.swapaxes(y, -1, -2), xmatrix) if self.needs_input_grad[0] else None
+        dy = _matmul_grad(np.swapaxes(x, -1, -2), grad, ymatrix) if self.needs_input_grad[1] else None
+
+        # Only reshaped for vectors, as a view can not be taken back by the pool.
+        if dx is not None and xmatrix != xshape:
+            dx = dx.reshape(xshape)
+        if dy is not None and ymatrix != yshape:
+            dy = dy.reshape(yshape)
+        return dx, dy
+
+class Einsum(Function):
+    def forward(self, *operands, subscripts, out=None) -> np.ndarray:
+        shapes = tuple(x.shape for x in operands)
+        inputs, output = _einsum.normalize(subscripts, shapes)
+        subscripts = ','.join(inputs) + '->' + output
+
+        # An operand is only needed for the gradients of the other operands.
+        needed = [any(self.needs_input_grad[:i] + self.needs_input_grad[i + 1:])
+                  for i in range(len(operands))]
+        self.save_for_backward(inputs, output, shapes,
+            *(x if need else None for x, need in zip(operands, needed)))
+
+        path = _einsum.contraction_path(subscripts, shapes)
+        return dispatch('einsum', self.device, *operands, subscripts=subscripts, path=path, out=out)
+
+    def backward(self, grad) -> Tuple[np.ndarray]:
+        inputs, output, shapes, *operands = self.saved_tensors
+        grads = []
+        for i, (term, shape) in enumerate(zip(inputs, shapes)):
+            if not self.needs_input_grad[i]:
+                grads.append(None)
+                continue
+
+            subscripts, target = _einsum.gradient_subscripts(inputs, output, i)
+            others = operands[:i] + operands[i + 1:]
+            path = _einsum.contraction_path(subscripts, (grad.shape, ) + tuple(x.shape for x in others))
+            grads.append(_einsum.expand(
+                np.einsum(subscripts, grad, *others, optimize=path), term, target, shape,
+            ))
+        return tuple(grads)
+
+def einsum(subscripts, *operands, out=None):
+    """ Evaluate the Einstein summation convention on the tensors, as
+    ``np.einsum`` does, e.g. ``einsum('bij,bjk->bik', x, y)`` for a batched
+    matrix product. The contraction order is picked from the shapes of the
+    operands once and then cached, in backward only the gradients of the
+    tensors requiring grad are computed.
+
+    Parameters
+    ----------
+    subscripts: str
+        The subscripts of the operands and, after '->', of the result.
+    *operands: Tensor
+        The tensors to contract.
+    out: Tensor
+        Optional tensor to write the result into.
+
+    """
+    return Einsum.apply(*operands, subscripts=subscripts, out=out)
@@ -22,27 +22,32 @@
 # SOFTWARE.
 #
 # File created: 2022-11-23
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 import numpy as np
+from leaf import memory
+from leaf.backend import dispatch
 from .function import Function
 
 class Mean(Function):
-    def forward(self, x, axis=None, keepdims=True):
-        result = x.sum(axis=axis, keepdims=keepdims)
+    def forward(self, x, axis=None, keepdims=True, out=None):
+        result = dispatch('sum', self.device, x, axis=axis, keepdims=keepdims, out=out)
         self.save_for_backward(x.shape, result.shape)
-        return result * np.prod(result.shape) / np.prod(x.shape)
+        return np.multiply(result, float(np.prod(result.shape) / np.prod(x.shape)), out=out)
     
     def backward(self, grad):
         xshape, resultshape, = self.saved_tensors
-        return np.ones(xshape) * grad * np.prod(resultshape) / np.prod(xshape)
+        result = memory.empty(xshape, grad.dtype)
+        return np.multiply(grad, float(np.prod(resultshape) / np.prod(xshape)), out=result)
 
 class Sum(Function):
-    def forward(self, x, axis=None, keepdims=True):
+    def forward(self, x, axis=None, keepdims=True, out=None):
         self.save_for_backward(x.shape)
-        return x.sum(axis=axis, keepdims=keepdims)
+        return dispatch('sum', self.device, x, axis=axis, keepdims=keepdims, out=out)
 
     def backward(self, grad):
         xshape, = self.saved_tensors
-        return np.ones(xshape) * grad
+        result = memory.empty(xshape, grad.dtype)
+        result[...] = grad
+        return result
@@ -0,0 +1,254 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+# This file is generated by ``python -m leaf.functions._generate``, do
+# not edit it by hand.
+
+import numbers
+import numpy as np
+from leaf.tensor import Tensor
+from leaf.functions._binary_ops import Add, Div, Mul, Pow, Sub
+from leaf.functions._conv_ops import Conv2d
+from leaf.functions._inplace_ops import Add_, Clamp_, Exp_, Mul_, ReLU_, Sub_
+from leaf.functions._loss_ops import CrossEntropy, MSE, NLL
+from leaf.functions._pool_ops import AvgPool2d, MaxPool2d
+from leaf.functions._processing_ops import Einsum, Matmul
+from leaf.functions._reduce_ops import Mean, Sum
+from leaf.functions._unary_ops import Cast, Clamp, Exp, Log, ReLU
+
+def _operand(tensor, other):
+    """ Return the other operand of a Python operator as a tensor, or None
+    if it is not a tensor, a number or an array. Numbers take the datatype
+    NumPy promotes the tensor and the number to, so that e.g. ``x * 2`` does
+    not upcast half tensors while ``x * 0.5`` does not truncate the number
+    for integer tensors. """
+    if isinstance(other, Tensor):
+        return other
+    if isinstance(other, numbers.Number):
+        dtype = np.result_type(tensor.dtype, other)
+        return Tensor(other, dtype=dtype, device=tensor.device)
+    if isinstance(other, np.ndarray):
+        return Tensor(other, dtype=other.dtype, device=tensor.device, copy=False)
+    return None
+
+def add(self, *tensors, **kwargs) -> Tensor:
+    return Add.apply(self, *tensors, **kwargs)
+
+def __add__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Add.apply(self, other)
+
+def __radd__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Add.apply(other, self)
+
+def div(self, *tensors, **kwargs) -> Tensor:
+    return Div.apply(self, *tensors, **kwargs)
+
+def __truediv__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Div.apply(self, other)
+
+def __rtruediv__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Div.apply(other, self)
+
+def mul(self, *tensors, **kwargs) -> Tensor:
+    return Mul.apply(self, *tensors, **kwargs)
+
+def __mul__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Mul.apply(self, other)
+
+def __rmul__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Mul.apply(other, self)
+
+def pow(self, *tensors, **kwargs) -> Tensor:
+    return Pow.apply(self, *tensors, **kwargs)
+
+def __pow__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Pow.apply(self, other)
+
+def __rpow__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Pow.apply(other, self)
+
+def sub(self, *tensors, **kwargs) -> Tensor:
+    return Sub.apply(self, *tensors, **kwargs)
+
+def __sub__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Sub.apply(self, other)
+
+def __rsub__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Sub.apply(other, self)
+
+def conv2d(self, *tensors, **kwargs) -> Tensor:
+    return Conv2d.apply(self, *tensors, **kwargs)
+
+def add_(self, *tensors, **kwargs) -> Tensor:
+    return Add_.apply(self, *tensors, **kwargs)
+
+def clamp_(self, *tensors, **kwargs) -> Tensor:
+    return Clamp_.apply(self, *tensors, **kwargs)
+
+def exp_(self, *tensors, **kwargs) -> Tensor:
+    return Exp_.apply(self, *tensors, **kwargs)
+
+def mul_(self, *tensors, **kwargs) -> Tensor:
+    return Mul_.apply(self, *tensors, **kwargs)
+
+def relu_(self, *tensors, **kwargs) -> Tensor:
+    return ReLU_.apply(self, *tensors, **kwargs)
+
+def sub_(self, *tensors, **kwargs) -> Tensor:
+    return Sub_.apply(self, *tensors, **kwargs)
+
+def crossentropy(self, *tensors, **kwargs) -> Tensor:
+    return CrossEntropy.apply(self, *tensors, **kwargs)
+
+def mse(self, *tensors, **kwargs) -> Tensor:
+    return MSE.apply(self, *tensors, **kwargs)
+
+def nll(self, *tensors, **kwargs) -> Tensor:
+    return NLL.apply(self, *tensors, **kwargs)
+
+def avgpool2d(self, *tensors, **kwargs) -> Tensor:
+    return AvgPool2d.apply(self, *tensors, **kwargs)
+
+def maxpool2d(self, *tensors, **kwargs) -> Tensor:
+    return MaxPool2d.apply(self, *tensors, **kwargs)
+
+def einsum(self, *tensors, **kwargs) -> Tensor:
+    return Einsum.apply(self, *tensors, **kwargs)
+
+def matmul(self, *tensors, **kwargs) -> Tensor:
+    return Matmul.apply(self, *tensors, **kwargs)
+
+def __matmul__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Matmul.apply(self, other)
+
+def __rmatmul__(self, other) -> Tensor:
+    other = _operand(self, other)
+    if other is None:
+        return NotImplemented
+    return Matmul.apply(other, self)
+
+def mean(self, *tensors, **kwargs) -> Tensor:
+    return Mean.apply(self, *tensors, **kwargs)
+
+def sum(self, *tensors, **kwargs) -> Tensor:
+    return Sum.apply(self, *tensors, **kwargs)
+
+def cast(self, *tensors, **kwargs) -> Tensor:
+    return Cast.apply(self, *tensors, **kwargs)
+
+def clamp(self, *tensors, **kwargs) -> Tensor:
+    return Clamp.apply(self, *tensors, **kwargs)
+
+def exp(self, *tensors, **kwargs) -> Tensor:
+    return Exp.apply(self, *tensors, **kwargs)
+
+def log(self, *tensors, **kwargs) -> Tensor:
+    return Log.apply(self, *tensors, **kwargs)
+
+def relu(self, *tensors, **kwargs) -> Tensor:
+    return ReLU.apply(self, *tensors, **kwargs)
+
+def __neg__(self) -> Tensor:
+    return Mul.apply(self, Tensor(-1, dtype=self.dtype, device=self.device))
+
+METHODS = {
+    'add': add,
+    '__add__': __add__,
+    '__radd__': __radd__,
+    'div': div,
+    '__truediv__': __truediv__,
+    '__rtruediv__': __rtruediv__,
+    'mul': mul,
+    '__mul__': __mul__,
+    '__rmul__': __rmul__,
+    'pow': pow,
+    '__pow__': __pow__,
+    '__rpow__': __rpow__,
+    'sub': sub,
+    '__sub__': __sub__,
+    '__rsub__': __rsub__,
+    'conv2d': conv2d,
+    'add_': add_,
+    'clamp_': clamp_,
+    'exp_': exp_,
+    'mul_': mul_,
+    'relu_': relu_,
+    'sub_': sub_,
+    'crossentropy': crossentropy,
+    'mse': mse,
+    'nll': nll,
+    'avgpool2d': avgpool2d,
+    'maxpool2d': maxpool2d,
+    'einsum': einsum,
+    'matmul': matmul,
+    '__matmul__': __matmul__,
+    '__rmatmul__': __rmatmul__,
+    'mean': mean,
+    'sum': sum,
+    'cast': cast,
+    'clamp': clamp,
+    'exp': exp,
+    'log': log,
+    'relu': relu,
+    '__neg__': __neg__,
+}
+
+for _name, _method in METHODS.items():
+    setattr(Tensor, _name, _method)
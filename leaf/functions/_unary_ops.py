@@ -22,36 +22,70 @@
 # SOFTWARE.
 #
 # File created: 2022-11-23
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 import numpy as np
+from leaf import memory
+from leaf.backend import dispatch
 from .function import Function
 
+def _clamp_mask(x, low, high) -> np.ndarray:
+    """ Return a mask of the elements in ``x`` that lie within the bounds. """
+    if low is None and high is None:
+        raise ValueError('At least one of ``low`` and ``high`` has to be specified.')
+
+    if low is None:
+        return x <= high
+    if high is None:
+        return x >= low
+    return (x >= low) & (x <= high)
+
 class Exp(Function):
-    def forward(self, x):
-        result = np.exp(x.clip(-50, 50))
+    def forward(self, x, out=None):
+        result = dispatch('exp', self.device, x, out=out)
         self.save_for_backward(result)
         return result
     
     def backward(self, grad):
         exp, = self.saved_tensors
-        return grad * exp
+        return np.multiply(grad, exp, out=memory.empty_result(grad, exp))
 
 class Log(Function):
-    def forward(self, x):
+    def forward(self, x, out=None):
         self.save_for_backward(x)
-        return np.log(x)
+        return dispatch('log', self.device, x, out=out)
     
     def backward(self, grad):
         x, = self.saved_tensors
-        return grad * 1.0 / x
+        return np.divide(grad, x, out=memory.empty_result(grad, x))
 
 class ReLU(Function):
-    def forward(self, x):
+    def forward(self, x, out=None):
         self.save_for_backward(x)
-        return np.maximum(x, 0.0)
+        return dispatch('relu', self.device, x, out=out)
 
     def backward(self, grad):
         x, = self.saved_tensors
-        return grad * (x >= 0.0)
+        return np.multiply(grad, x > 0.0, out=memory.empty_result(grad, x))
+
+class Clamp(Function):
+    def forward(self, x, low=None, high=None, out=None):
+        self.save_for_backward(_clamp_mask(x, low, high))
+        return np.clip(x, low, high, out=out)
+
+    def backward(self, grad):
+        mask, = self.saved_tensors
+        return grad * mask
+
+class Cast(Function):
+    def forward(self, x, dtype=np.float32, out=None):
+        self.save_for_backward(x.dtype)
+        if out is not None:
+            np.copyto(out, x, casting='unsafe')
+            return out
+        return x.astype(dtype, copy=False)
+
+    def backward(self, grad):
+        dtype, = self.saved_tensors
+        return grad.astype(dtype, copy=False)
@@ -22,11 +22,16 @@
 # SOFTWARE.
 #
 # File created: 2022-11-05
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
+import copy
+import weakref
 import numpy as np
-from leaf import Tensor
+from leaf.tensor import Tensor, _VersionCounter, _to_array
+from leaf.autograd import current_tape, is_grad_enabled
+from leaf.lazy import current_graph
+from leaf import amp
 from typing import List
 from leaf.types import Boolean, String
 
@@ -42,9 +47,55 @@ def _extract_data(tensor) -> np.ndarray:
     """ TEMPORARY!!!! EDIT this function """
     return tensor.data
 
-class Function(object):
+def _result_dtype(data) -> np.dtype:
+    """ Return the datatype of the op result, which the resulting tensor keeps. """
+    return getattr(data, 'dtype', np.float32)
+
+def _storage(array) -> object:
+    """ Return the object owning the memory of the array. """
+    return array if array.base is None else array.base
+
+class _NoInputGrad(object):
+    """ Reports every input of the stand-in context as not requiring grad. """
+    __slots__ = ()
+
+    def __getitem__(self, index) -> Boolean:
+        return False
+
+class _InferenceContext(object):
+    """ Stand-in context passed to ``forward`` when no DAG is built. """
+    __slots__ = ('device',)
+    needs_input_grad = _NoInputGrad()
+
+    def __init__(self, device) -> None:
+        self.device = device
+
+    def save_for_backward(self, *items) -> None:
+        pass
+
+_inference_contexts = {}
+
+def _inference_context(device) -> _InferenceContext:
+    """ Return the shared stand-in context of the device. """
+    context = _inference_contexts.get(device)
+    if context is None:
+        context = _inference_contexts[device] = _InferenceContext(device)
+    return context
+
+class _Slotted(type):
+    """ Metaclass giving every op an empty ``__slots__`` unless it defines its
+    own, such that contexts never get a per instance ``__dict__``. """
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        namespace.setdefault('__slots__', ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+class Function(object, metaclass=_Slotted):
     """ Definition and impelmentation of the Function class.
 
+    Contexts are slot based, graphs of many small ops create one per op. Ops
+    are given empty slots by the metaclass, an op that needs to store more
+    than ``save_for_backward`` allows has to declare its own ``__slots__``.
+
     Parameters
     ----------
     device: str
@@ -54,15 +105,63 @@ class Function(object):
         For example, two tensors if a binary op is invoked.
 
     """
+    __slots__ = (
+        'parents', 'device', 'saved_tensors', 'requires_grad', 'needs_input_grad',
+        '_parent_ctxs', '_saved_versions', '_tape', '_index', '__weakref__',
+    )
+
     def __init__(self, device, *tensors) -> None:
-        self.parents = [t for t in tensors if isinstance(t, Tensor)]
+        parents = self.parents = tuple([t for t in tensors if isinstance(t, Tensor)])
         self.device = device
-        self.saved_tensors = []
-        self.requires_grad = _tensors_require_grad(*tensors)
+        self.saved_tensors = ()
+        self.needs_input_grad = needs_input_grad = tuple([t.requires_grad for t in parents])
+        self.requires_grad = True in needs_input_grad
+        self._parent_ctxs = tuple([t._ctx for t in parents])
+        self._saved_versions = ()
 
     def save_for_backward(self, *items) -> None:
         """ Store the provided items during forward pass to later be used. """
-        self.saved_tensors.extend(items)
+        self.saved_tensors += items
+
+    def release(self) -> None:
+        """ Free the saved items and parent tensors after the backwards pass.
+        The context can not be backpropagated through after being released.
+
+        """
+        self.saved_tensors = None
+        self.parents = ()
+        self._parent_ctxs = ()
+        self._saved_versions = ()
+
+    def _track_saved_versions(self, result) -> None:
+        """ Remember the version of every parent, and of the result, whose data was
+        saved for backward. Stored flat as (tensor, version, ...), the result only
+        by weak reference as it references the context itself. """
+        storages = [id(_storage(item)) for item in self.saved_tensors if isinstance(item, np.ndarray)]
+        if not storages:
+            return
+
+        tracked = []
+        for t in self.parents:
+            if id(_storage(t._data)) in storages:
+                tracked += (t, t._version)
+        if id(_storage(result._data)) in storages:
+            tracked += (weakref.ref(result), result._version)
+        self._saved_versions = tuple(tracked)
+
+    def _check_saved_versions(self) -> None:
+        """ Raise if a tensor saved for backward has been modified in-place since. """
+        versions = self._saved_versions
+        for i in range(0, len(versions), 2):
+            tensor, version = versions[i], versions[i + 1]
+            if type(tensor) is weakref.ref:
+                tensor = tensor()
+            if tensor is not None and tensor._version != version:
+                raise RuntimeError(
+                    f'One of the tensors saved for the backwards pass of {type(self).__name__} ' \
+                    f'has been modified by an in-place operation, it is at version ' \
+                    f'{tensor._version} but was saved at version {version}.'
+                )
     
     def forward(self, *args, **kwargs): 
         raise NotImplementedError(f'forward pass not implemented for {type(self)}')
@@ -71,21 +170,159 @@ class Function(object):
         raise NotImplementedError(f'backward pass not implemented for {type(self)}')
     
     @classmethod
-    def apply(cls, *tensors) -> Tensor: 
+    def apply(cls, *tensors, out=None, **kwargs) -> Tensor: 
         """ This classmethod constructs a Function, also referred to as a context, when 
         a tensor invokes an operation. As such, the tensor initially invoking the 
         call, self, is represented as part of the *tensors arg together with any
-        optional tensors that are to be part of the context. 
+        optional tensors that are to be part of the context. Keyword arguments
+        are passed on to the forward pass of the op.
 
         After applying the the op on the provided tensors, a resulting tensor is 
         created and returned. This tensor is not a leaf node in the DAG, and 
         contains the context of the op, meaning, it specifies that it was 
-        created through an op and stores the parent tensors.
+        created through an op and stores the parent tensors. The context is
+        recorded on the tape of the current thread, which is what the
+        backwards pass walks in reverse.
+
+        If no tensor requires grad, or the DAG is disabled through ``no_grad``,
+        no context is constructed and nothing is saved for the backwards pass.
+        The resulting tensor is then a leaf node.
+
+        Inside of ``leaf.amp.autocast`` the inputs are first cast to the datatype
+        the op computes in, see ``leaf.amp``.
+
+        In lazy mode the op is only recorded, and executed once the data of the
+        resulting tensor is needed.
+
+        If an ``out`` tensor is provided, the result is written into its data
+        instead of a newly allocated array, and ``out`` is returned. The op
+        is then executed right away, also in lazy mode.
 
         """
-        context = cls(*tensors[0].device, *tensors)
-        results = Tensor(context.forward(*_verify_tensors(*tensors)),
-                         requires_grad=context.requires_grad,
-                         device=context.device)
+        dtype = amp.autocast_dtype(cls)
+        if dtype is not None:
+            tensors = amp.cast(tensors, dtype)
+
+        requires_grad = is_grad_enabled() and _tensors_require_grad(*tensors)
+        if out is not None:
+            return cls._execute_out(tensors, kwargs, requires_grad, out)
+
+        graph = current_graph()
+        if graph is not None:
+            return graph.record(cls, tensors, kwargs, requires_grad)
+        return cls._execute(tensors, kwargs, requires_grad)
+
+    @classmethod
+    def _execute(cls, tensors, kwargs, requires_grad, results=None) -> Tensor:
+        """ Run the op, storing the result in ``results`` if provided. """
+        if not requires_grad:
+            data = cls.forward(_inference_context(tensors[0].device), *_verify_tensors(*tensors), **kwargs)
+            if results is None:
+                return Tensor(data, dtype=_result_dtype(data), device=tensors[0].device, copy=False)
+            results.data = _to_array(data, _result_dtype(data), copy=False)
+            return results
+
+        context = cls(tensors[0].device, *tensors)
+        data = context.forward(*_verify_tensors(*tensors), **kwargs)
+        if results is None:
+            results = Tensor(data, dtype=_result_dtype(data), requires_grad=True,
+                             device=context.device, copy=False, _is_leaf=False)
+        else:
+            results.data = _to_array(data, _result_dtype(data), copy=False)
+
         results._ctx = context
+        context._track_saved_versions(results)
+        current_tape().record(context)
         return results
+
+    @classmethod
+    def _execute_out(cls, tensors, kwargs, requires_grad, out) -> Tensor:
+        """ Run the op writing the result into the data of ``out``.
+
+        Writing into ``out`` is an in-place modification of it, so its version
+        is bumped and, when the op is part of the DAG, it is rebased onto the
+        new context. Should ``out`` also be one of the inputs, the context gets
+        a shallow copy of it as parent, representing it before the op.
+
+        Inputs sharing memory with ``out`` are copied before the op when it is
+        part of the DAG, as the op may save them for backward and the forward
+        pass would otherwise overwrite them while computing.
+
+        """
+        arrays = _verify_tensors(*tensors)
+        buffer = out.data
+        if not requires_grad:
+            cls.forward(_inference_context(out.device), *arrays, out=buffer, **kwargs)
+            out._version += 1
+            return out
+
+        if out.requires_grad and out._ctx is None:
+            raise RuntimeError(
+                f'A leaf tensor that requires grad can not be used as output of ' \
+                f'{cls.__name__}, wrap the operation in ``leaf.no_grad()``.'
+            )
+
+        arrays = [x.copy() if np.shares_memory(x, buffer) else x for x in arrays]
+        parents = []
+        for t, x in zip(tensors, arrays):
+            if t is out:
+                t = copy.copy(t)
+                t._data = x
+                t._version_counter = _VersionCounter()
+            parents.append(t)
+        context = cls(out.device, *parents)
+        context.forward(*arrays, out=buffer, **kwargs)
+        out._version += 1
+        out._ctx = context
+        out._is_leaf = False
+        out.requires_grad = True
+        context._track_saved_versions(out)
+        current_tape().record(context)
+        return out
+
+class InplaceFunction(Function):
+    """ Parent class for ops that write their result into the data of the first
+    tensor instead of allocating a new array. The forward pass receives the
+    array to overwrite as its first argument.
+
+    Every in-place op bumps the version counter of the tensor. Contexts that
+    saved the data of the tensor for their backwards pass compare against
+    the version it had at the time, and raise instead of computing incorrect
+    gradients if it has since been modified.
+
+    """
+    @classmethod
+    def apply(cls, tensor, *tensors, **kwargs) -> Tensor:
+        """ Apply the op in-place on ``tensor`` and return it.
+
+        When the op is part of the DAG, the tensor is rebased onto a new
+        context whose parent is a shallow copy representing the tensor as
+        it was before the op. Contexts that consumed the tensor earlier
+        keep routing their gradients to its previous context.
+
+        In-place ops are never recorded in lazy mode, the tensors are realized
+        and the op is executed right away.
+
+        """
+        arrays = _verify_tensors(tensor, *tensors)
+        if not (is_grad_enabled() and _tensors_require_grad(tensor, *tensors)):
+            cls.forward(_inference_context(tensor.device), *arrays, **kwargs)
+            tensor._version += 1
+            return tensor
+
+        if tensor.requires_grad and tensor._ctx is None:
+            raise RuntimeError(
+                f'A leaf tensor that requires grad can not be used in the in-place ' \
+                f'operation {cls.__name__}, wrap the operation in ``leaf.no_grad()``.'
+            )
+
+        previous = copy.copy(tensor)
+        context = cls(tensor.device, previous, *tensors)
+        context.forward(*arrays, **kwargs)
+        tensor._version += 1
+        tensor._ctx = context
+        tensor._is_leaf = False
+        tensor.requires_grad = True
+        context._track_saved_versions(tensor)
+        current_tape().record(context)
+        return tensor
@@ -0,0 +1,173 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import functools
+import numpy as np
+from leaf.tensor import Tensor
+from leaf.functions._fused import FusedElementwise, UNARY, BINARY
+
+class _Trace(object):
+    """ Recording of the elementwise ops applied to the symbolic inputs of a
+    function. Tensors the function uses besides its arguments are captured
+    as constants, which become additional inputs of the fused op. """
+    def __init__(self, n_inputs) -> None:
+        self.n_inputs = n_inputs
+        self.constants = []
+        self.instructions = []
+
+    def reference(self, obj) -> tuple:
+        if isinstance(obj, _Symbol) and obj._trace is self:
+            return obj._reference
+
+        if not isinstance(obj, Tensor):
+            obj = Tensor(obj)
+
+        self.constants.append(obj)
+        return ('constant', len(self.constants) - 1)
+
+    def record(self, name, *operands):
+        references = [self.reference(operand) for operand in operands]
+        self.instructions.append((name, references[0], references[-1]))
+        return _Symbol(self, ('op', len(self.instructions) - 1))
+
+    def program(self, output) -> tuple:
+        """ Return the instructions that ``output`` depends on, with all
+        references resolved to registers of the fused op. """
+        live = {output}
+        for k in range(output, -1, -1):
+            if k in live:
+                _, a, b = self.instructions[k]
+                live.update(ref[1] for ref in (a, b) if ref[0] == 'op')
+
+        offsets = {'input': 0, 'constant': self.n_inputs}
+        registers = {}
+        for k in sorted(live):
+            registers[k] = self.n_inputs + len(self.constants) + len(registers)
+
+        def resolve(ref):
+            return registers[ref[1]] if ref[0] == 'op' else offsets[ref[0]] + ref[1]
+
+        return tuple(
+            (self.instructions[k][0], resolve(self.instructions[k][1]),
+             resolve(self.instructions[k][2])) for k in sorted(live)
+        )
+
+class _Symbol(object):
+    """ Stand-in for a tensor while tracing, only supporting fusable ops. """
+    def __init__(self, trace, reference) -> None:
+        self._trace = trace
+        self._reference = reference
+
+    def __neg__(self):
+        return self._trace.record('Mul', self, -1.0)
+
+def _unary(name):
+    def op(self):
+        return self._trace.record(name, self)
+    return op
+
+def _binary(name):
+    def op(self, other):
+        return self._trace.record(name, self, other)
+    return op
+
+def _reflected(name):
+    def op(self, other):
+        return self._trace.record(name, other, self)
+    return op
+
+# Python operators of the binary ops, as on Tensor, so that e.g. ``x * y + 1``
+# is traced the same way as ``x.mul(y).add(1)``.
+_OPERATORS = {
+    'Add': ('__add__', '__radd__'),
+    'Sub': ('__sub__', '__rsub__'),
+    'Mul': ('__mul__', '__rmul__'),
+    'Div': ('__truediv__', '__rtruediv__'),
+    'Pow': ('__pow__', '__rpow__'),
+}
+
+for _name in UNARY:
+    setattr(_Symbol, _name.lower(), _unary(_name))
+for _name in BINARY:
+    setattr(_Symbol, _name.lower(), _binary(_name))
+    setattr(_Symbol, _OPERATORS[_name][0], _binary(_name))
+    setattr(_Symbol, _OPERATORS[_name][1], _reflected(_name))
+
+def _trace(func, n_inputs):
+    """ Trace the function and return its program together with the captured
+    constants, or None if the function is not a chain of elementwise ops. """
+    trace = _Trace(n_inputs)
+    try:
+        result = func(*(_Symbol(trace, ('input', i)) for i in range(n_inputs)))
+    except (AttributeError, TypeError):
+        return None
+
+    if not isinstance(result, _Symbol) or result._trace is not trace \
+        or result._reference[0] != 'op':
+        return None
+
+    return trace.program(result._reference[1]), tuple(trace.constants)
+
+def fuse(func):
+    """ Decorator fusing a function made up of a chain of elementwise ops,
+    e.g. ``x.sub(y).exp().relu()``, into a single op. The function is traced
+    on its first call and every later call runs the whole chain as one
+    kernel, without writing a full size temporary for each op, and with a
+    single fused backwards pass.
+
+    The traced ops are exp, log, relu, add, sub, mul, div and pow, called as
+    methods or through the Python operators. Tensors other than the arguments
+    are captured as constants when tracing. If the function uses any other
+    op, or the arguments are not all of the same shape or of size one, the
+    function is executed as is.
+
+    Parameters
+    ----------
+    func: callable
+        The function to fuse, taking one or more tensors as arguments.
+
+    """
+    traces = {}
+
+    @functools.wraps(func)
+    def fused(*tensors):
+        n_inputs = len(tensors)
+        if n_inputs not in traces:
+            traces[n_inputs] = _trace(func, n_inputs)
+
+        trace = traces[n_inputs]
+        if trace is None or not all(isinstance(t, Tensor) for t in tensors):
+            return func(*tensors)
+
+        program, constants = trace
+        inputs = tensors + constants
+        shape = np.broadcast_shapes(*(t.shape for t in inputs))
+        if any(t.shape != shape and t.data.size != 1 for t in inputs):
+            return func(*tensors)
+
+        return FusedElementwise.apply(*inputs, program=program)
+    return fused
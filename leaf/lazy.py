@@ -0,0 +1,191 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+from __future__ import annotations
+import weakref
+import threading
+import itertools
+from collections import OrderedDict
+from contextlib import contextmanager
+
+class _State(threading.local):
+    graph = None
+
+_state = _State()
+_sequence = itertools.count()
+
+class _Node(object):
+    """ An op recorded in lazy mode, together with everything needed to run it. """
+    __slots__ = ('graph', 'op', 'tensors', 'versions', 'kwargs', 'requires_grad', 'key', 'index')
+
+    def __init__(self, graph, op, tensors, kwargs, requires_grad, key, index) -> None:
+        self.graph = graph
+        self.op = op
+        self.tensors = tensors
+        self.versions = tuple(t._version for t in tensors)
+        self.kwargs = kwargs
+        self.requires_grad = requires_grad
+        self.key = key
+        self.index = index
+
+    def realize(self, tensor) -> None:
+        realize(tensor)
+
+class LazyGraph(object):
+    """ Graph of ops recorded in lazy mode, see ``lazy``. Keeping the same graph
+    between iterations of a loop lets constant subexpressions computed in one
+    iteration be reused by the next ones.
+
+    Parameters
+    ----------
+    cache_size: int
+        Maximum number of constant results kept between realizations, the
+        least recently used one is evicted when exceeded.
+
+    """
+    def __init__(self, cache_size=256) -> None:
+        self.cache_size = cache_size
+        self.recorded = 0
+        self.merged = 0
+        self.folded = 0
+        self.executed = 0
+        self._pending = weakref.WeakValueDictionary()
+        self._constants = OrderedDict()
+
+    def _key(self, op, tensors, kwargs):
+        """ Return the key identifying the op applied to exactly these tensors,
+        or None if the keyword arguments are not hashable. """
+        key = (op, tuple((id(t), t._version) for t in tensors),
+               tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def record(self, op, tensors, kwargs, requires_grad) -> Tensor:
+        """ Record the op and return its unrealized result. An identical op that
+        is still pending or a cached constant is returned instead. """
+        key = self._key(op, tensors, kwargs)
+        if key is not None:
+            tensor = self._pending.get(key)
+            if tensor is not None:
+                self.merged += 1
+                return tensor
+
+            entry = self._constants.get(key)
+            if entry is not None and entry[0]._version == entry[1]:
+                self._constants.move_to_end(key)
+                self.folded += 1
+                return entry[0]
+
+        self.recorded += 1
+        node = _Node(self, op, tensors, kwargs, requires_grad, key, next(_sequence))
+        from leaf.tensor import Tensor
+        tensor = Tensor._unrealized(node, requires_grad, tensors[0].device)
+        if key is not None:
+            self._pending[key] = tensor
+        return tensor
+
+    def _realized(self, node, tensor) -> None:
+        """ Move the result of a constant node from the pending ops to the cache. """
+        self.executed += 1
+        if node.key is None:
+            return
+
+        if self._pending.get(node.key) is tensor:
+            del self._pending[node.key]
+
+        if not node.requires_grad:
+            # The input tensors are kept alive so that their ids in the key stay unique.
+            self._constants[node.key] = (tensor, tensor._version, node.tensors)
+            if len(self._constants) > self.cache_size:
+                self._constants.popitem(last=False)
+
+def realize(tensor) -> None:
+    """ Compute the tensor together with every unrealized tensor it depends on.
+    Only these are computed, any recorded op whose result is never used is
+    never executed. The ops are run in the order they were recorded in.
+
+    Raises if an input of one of the ops has been modified in-place since the
+    op was recorded, as its result would silently reflect the modification. """
+    nodes = {id(tensor): tensor}
+    stack = [tensor]
+    while stack:
+        for parent in stack.pop()._lazy.tensors:
+            if parent._lazy is not None and id(parent) not in nodes:
+                nodes[id(parent)] = parent
+                stack.append(parent)
+
+    ordered = sorted(nodes.values(), key=lambda t: t._lazy.index)
+    for t in ordered:
+        node = t._lazy
+        for parent, version in zip(node.tensors, node.versions):
+            if parent._version != version:
+                raise RuntimeError(
+                    f'One of the inputs of the lazily recorded {node.op.__name__} has been ' \
+                    f'modified by an in-place operation, it is at version {parent._version} ' \
+                    f'but was recorded at version {version}. Access the data of the result ' \
+                    f'before modifying its inputs in-place.'
+                )
+
+    for t in ordered:
+        node, t._lazy = t._lazy, None
+        node.op._execute(node.tensors, node.kwargs, node.requires_grad, results=t)
+        node.graph._realized(node, t)
+
+def current_graph():
+    """ Return the lazy graph ops on the calling thread record onto, if any. """
+    return _state.graph
+
+@contextmanager
+def lazy(graph=None):
+    """ Context manager in which ops are recorded instead of computed. The data
+    of a tensor is computed when it is first accessed, or when ``backward`` is
+    called on it. While recording, ops identical to an op that is still
+    pending are merged into it, i.e. common subexpression elimination.
+    Subgraphs that do not require grad are computed without building a DAG
+    and their results are cached, so recording the same constant op on the
+    same, unmodified, tensors again reuses the earlier result. Only what is
+    needed to compute the accessed tensor is ever executed.
+
+    Identical expressions recorded in lazy mode may therefore return the very
+    same tensor object.
+
+    Parameters
+    ----------
+    graph: LazyGraph
+        The graph to record onto, a new one is created if not provided.
+
+    """
+    graph = LazyGraph() if graph is None else graph
+    previous = current_graph()
+    _state.graph = graph
+    try:
+        yield graph
+    finally:
+        _state.graph = previous
@@ -0,0 +1,219 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import threading
+import numpy as np
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 1 << 28
+
+def _references(array) -> int:
+    return sys.getrefcount(array)
+
+def _probe() -> int:
+    array = np.empty(1)
+    return _references(array)
+
+# Number of references to an array that is only held by a single local variable
+# of the caller of ``release``, which adds its own frame on top of the probe.
+_UNREFERENCED = _probe() + 1
+
+class BufferPool(object):
+    """ Pool of recycled NumPy arrays, keyed by their shape and datatype.
+
+    Training with fixed shapes allocates and frees arrays of the same shapes on
+    every iteration. Instead of handing those back to the allocator, arrays
+    that are no longer needed are released to the pool and handed out again
+    by ``empty`` and ``zeros``. The pool is bounded in bytes, the buffers of
+    the least recently used (shape, dtype) pair are evicted first.
+
+    An array is only taken back if nothing but the caller references it, no
+    views of it are alive and it owns its memory, so releasing an array that
+    turns out to still be in use is a no-op rather than an error. Arrays of
+    a shape that has never been requested from the pool are not taken back
+    either, as they would only take up space.
+
+    Parameters
+    ----------
+    max_bytes: int
+        Upper bound on the number of bytes held by the pool.
+
+    """
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._free = OrderedDict()
+        self._requested = set()
+        self._lock = threading.Lock()
+
+    def empty(self, shape, dtype=np.float32) -> np.ndarray:
+        """ Return an uninitialized array, recycled if possible. """
+        key = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            buffers = self._free.get(key)
+            if buffers:
+                array = buffers.pop()
+                self._free.move_to_end(key)
+                self.nbytes -= array.nbytes
+                self.hits += 1
+                return array
+            self.misses += 1
+            self._requested.add(key)
+        return np.empty(key[0], dtype=key[1])
+
+    def empty_result(self, *arrays) -> np.ndarray:
+        """ Return an uninitialized array to hold the result of an elementwise
+        op on the arrays, i.e. of their broadcast shape and result datatype. """
+        shape = np.broadcast_shapes(*(np.shape(x) for x in arrays))
+        return self.empty(shape, np.result_type(*arrays))
+
+    def zeros(self, shape, dtype=np.float32) -> np.ndarray:
+        """ Return a zero-filled array, recycled if possible. """
+        array = self.empty(shape, dtype)
+        array.fill(0)
+        return array
+
+    def release(self, array) -> bool:
+        """ Hand the array back to the pool, returns True if it was taken. The
+        caller must not use the array afterwards.
+
+        """
+        if not isinstance(array, np.ndarray) or array.base is not None \
+                or not array.flags.c_contiguous or not array.flags.writeable \
+                or array.nbytes > self.max_bytes \
+                or _references(array) > _UNREFERENCED:
+            return False
+
+        key = (array.shape, array.dtype)
+        with self._lock:
+            if key not in self._requested:
+                return False
+            self._free.setdefault(key, []).append(array)
+            self._free.move_to_end(key)
+            self.nbytes += array.nbytes
+            while self.nbytes > self.max_bytes:
+                _, buffers = next(iter(self._free.items()))
+                self.nbytes -= buffers.pop(0).nbytes
+                self.evictions += 1
+                if not buffers:
+                    self._free.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        """ Drop all pooled buffers and reset the statistics. """
+        with self._lock:
+            self._free.clear()
+            self._requested.clear()
+            self.nbytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """ Return the hit and miss counts together with the pooled bytes. """
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'evictions': self.evictions,
+            'nbytes': self.nbytes,
+        }
+
+_pool = BufferPool()
+
+def default_pool() -> BufferPool:
+    """ Return the pool shared by the ops and the autograd engine. """
+    return _pool
+
+# Bound directly, a wrapping function would add a reference to released arrays.
+empty = _pool.empty
+empty_result = _pool.empty_result
+zeros = _pool.zeros
+release = _pool.release
+stats = _pool.stats
+
+def flatten(arrays, dtype=None, out=None) -> tuple:
+    """ Copy the arrays into a single contiguous 1D buffer, returning it together
+    with a list of views of it, one of the shape of each array, in order.
+
+    Parameters
+    ----------
+    arrays: list | tuple
+        The arrays to copy into the buffer.
+    dtype: np.dtype
+        Datatype of the buffer, the result type of the arrays if not given.
+    out: np.ndarray
+        1D buffer of the total size to copy into, e.g. one in shared memory,
+        instead of a newly allocated one.
+
+    """
+    size = sum(np.size(a) for a in arrays)
+    if out is None:
+        dtype = np.result_type(*arrays) if dtype is None else dtype
+        flat = np.empty(size, dtype=dtype)
+    elif out.ndim != 1 or out.size != size or not out.flags.c_contiguous:
+        raise ValueError(
+            f'Can not flatten {size} elements into buffer of shape {out.shape}.'
+        )
+    else:
+        flat = out
+    views, offset = [], 0
+    for array in arrays:
+        view = flat[offset:offset + np.size(array)].reshape(np.shape(array))
+        view[...] = array
+        views.append(view)
+        offset += view.size
+    return flat, views
+
+def flat_base(arrays) -> np.ndarray:
+    """ Return the 1D buffer the arrays are consecutive contiguous views of, in
+    order and covering all of it, as returned by ``flatten``. Returns None if
+    they are not laid out like that. A single contiguous array is its own buffer,
+    for which a 1D view of it is returned.
+
+    Parameters
+    ----------
+    arrays: list | tuple
+        The arrays to find the common buffer of.
+
+    """
+    if len(arrays) == 1 and isinstance(arrays[0], np.ndarray) and arrays[0].flags.c_contiguous:
+        return arrays[0].reshape(-1)
+
+    base = getattr(arrays[0], 'base', None) if arrays else None
+    if not isinstance(base, np.ndarray) or base.ndim != 1 or not base.flags.c_contiguous:
+        return None
+
+    address, offset = base.ctypes.data, 0
+    for array in arrays:
+        if getattr(array, 'base', None) is not base or not array.flags.c_contiguous \
+                or array.ctypes.data != address + offset * base.itemsize:
+            return None
+        offset += array.size
+    return base if offset == base.size else None
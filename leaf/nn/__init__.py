@@ -22,14 +22,21 @@
 # SOFTWARE.
 #
 # File created: 2022-11-17
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 from leaf.nn.base import Module, Sequential
 from leaf.nn.linear import Linear
+from leaf.nn.conv import Conv2d
+from leaf.nn.pooling import MaxPool2d, AvgPool2d
+from leaf.nn.activations import ReLU
 
 __all__ = (
     'Module',
     'Sequential',
     'Linear',
+    'Conv2d',
+    'MaxPool2d',
+    'AvgPool2d',
+    'ReLU',
 )
@@ -22,11 +22,11 @@
 # SOFTWARE.
 #
 # File created: 2022-11-23
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 from leaf.nn import Module
 
 class ReLU(Module):
     def forward(self, input_):
-        return x.relu()
+        return input_.relu()
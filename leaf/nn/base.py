@@ -22,10 +22,14 @@
 # SOFTWARE.
 #
 # File created: 2022-11-01
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
+import numpy as np
+from leaf import memory
 from leaf import Tensor
+from leaf.autograd import is_grad_enabled
+from leaf.functions._checkpoint import checkpoint
 
 class Module(object):
     """ Parent class for the neural network building blocks, i.e. so called Modules.
@@ -36,7 +40,7 @@ class Module(object):
 
     """
     def __call__(self, input_) -> Tensor:
-        raise self.forward(input_)
+        return self.forward(input_)
     
     def forward(self, input_, *args, **kwargs) -> Tensor:
         """ Each respective neural network module has to implement this depending on funcionality. """
@@ -45,9 +49,164 @@ class Module(object):
         )
     
     def parameters(self) -> list:
-        pass
+        """ Return a list of all tensors requiring gradient that are attributes of the
+        module, followed by the parameters of its submodules, in definition order. """
+        return [p for _, p in self.named_parameters()]
+
+    def named_parameters(self, prefix='') -> list:
+        """ Return the parameters as a list of (name, tensor) pairs, in the order of
+        ``parameters()``. Names are the dot separated attribute paths, without
+        leading underscores, e.g. ``0.weights`` for the first Sequential module.
+
+        Parameters
+        ----------
+        prefix: str
+            String prepended to all names.
+
+        """
+        params = []
+        for name, value in vars(self).items():
+            if isinstance(value, Tensor) and value.requires_grad:
+                params.append((prefix + name.lstrip('_'), value))
+            elif isinstance(value, Module):
+                params.extend(value.named_parameters(prefix + name.lstrip('_') + '.'))
+        return params
 
-class Sequential(object):
+    def state_dict(self) -> dict:
+        """ Return a dictionary from parameter name to the array of the parameter,
+        which are not copied, see ``leaf.save`` to write it to disk. """
+        return {name: p.data for name, p in self.named_parameters()}
+
+    def load_state_dict(self, state_dict, strict=True) -> None:
+        """ Set the parameters to the arrays, or tensors, of the state dictionary,
+        e.g. as returned by ``leaf.load``. Parameters whose data is a view of
+        another buffer, e.g. after ``flatten_parameters`` or once an optimizer
+        moved them into its flat buffer, are copied into, such that the buffer
+        stays in use. Parameters owning their data take the arrays without
+        copying them.
+
+        Parameters
+        ----------
+        state_dict: dict
+            Dictionary from parameter name to the array or tensor to load.
+        strict: bool
+            Specify whether the names have to exactly match the parameters.
+
+        """
+        params = dict(self.named_parameters())
+        missing, unexpected = params.keys() - state_dict.keys(), state_dict.keys() - params.keys()
+        if strict and (missing or unexpected):
+            raise ValueError(
+                f'State dict does not match the parameters of {type(self).__name__}, ' \
+                f'missing {sorted(missing)} unexpected {sorted(unexpected)}.'
+            )
+
+        for name, p in params.items():
+            if name not in state_dict:
+                continue
+
+            value = state_dict[name]
+            value = value.data if isinstance(value, Tensor) else np.asarray(value)
+            if value.shape != p.shape:
+                raise ValueError(
+                    f'Can not load array of shape {value.shape} into parameter {name} of shape {p.shape}.'
+                )
+
+            if p.data.base is not None:
+                p.data[...] = value
+            else:
+                p.data = value if value.dtype == p.dtype else value.astype(p.dtype)
+            p._version += 1
+
+    def _children(self) -> list:
+        """ Return the submodules that are attributes of the module. """
+        return [value for value in vars(self).values() if isinstance(value, Module)]
+
+    def flatten_parameters(self, buffer=None) -> None:
+        """ Move all parameters, and their gradients, into two contiguous flat buffers
+        that the tensors hold views of, in the order of ``parameters()``. Gradients
+        are then accumulated into the buffer by the backwards pass, which makes
+        ``zero_grad`` a single fill and ``clip_grad_norm`` a single norm, and lets
+        optimizers update the parameters with no copies, see ``leaf.optim``.
+
+        Call this on the outermost module, after constructing it, as the buffers
+        of submodules that were flattened before are replaced.
+
+        Parameters
+        ----------
+        buffer: np.ndarray
+            1D array to move the parameters into, e.g. one in shared memory,
+            instead of a newly allocated one.
+
+        """
+        params = self.parameters()
+        if len({p.dtype for p in params}) > 1:
+            raise ValueError(
+                f'Can only flatten parameters of a single datatype, got {set(p.dtype for p in params)}.'
+            )
+
+        self._clear_flat()
+        self._flat_parameters, views = memory.flatten([p.data for p in params], out=buffer)
+        self._flat_grads, self._grad_views = memory.flatten(
+            [np.zeros(p.shape, p.dtype) if p.grad is None else p.grad for p in params])
+        for p, view, grad in zip(params, views, self._grad_views):
+            p.data, p.grad = view, grad
+            p._version += 1
+
+    def _clear_flat(self) -> None:
+        self._flat_parameters = self._flat_grads = self._grad_views = None
+        for child in self._children():
+            child._clear_flat()
+
+    def _flat_grad_buffer(self) -> np.ndarray:
+        """ Return the flat gradient buffer if all gradients are still views of it. """
+        views = getattr(self, '_grad_views', None)
+        if views is None:
+            return None
+
+        params = self.parameters()
+        if len(params) != len(views) or any(p.grad is not v for p, v in zip(params, views)):
+            return None
+        return self._flat_grads
+
+    def zero_grad(self) -> None:
+        """ Reset the gradients of all parameters, filling the flat gradient buffer with
+        zeros if the parameters are flattened, or handing them back to the memory pool. """
+        views = getattr(self, '_grad_views', None)
+        if views is not None:
+            self._flat_grads.fill(0)
+            for p, view in zip(self.parameters(), views):
+                if p.grad is not view:
+                    grad, p.grad = p.grad, view
+                    memory.release(grad)
+            return
+
+        for p in self.parameters():
+            grad, p.grad = p.grad, None
+            memory.release(grad)
+
+    def clip_grad_norm(self, max_norm) -> float:
+        """ Scale the gradients of all parameters in place such that their total L2 norm
+        is at most ``max_norm``, and return the total norm before clipping.
+
+        Parameters
+        ----------
+        max_norm: float
+            Upper bound on the norm of the concatenated gradients.
+
+        """
+        flat = self._flat_grad_buffer()
+        grads = [flat] if flat is not None else \
+            [p.grad.reshape(-1) for p in self.parameters() if p.grad is not None]
+
+        norm = float(np.sqrt(sum(float(np.dot(g, g)) for g in grads)))
+        if norm > max_norm:
+            scale = max_norm / (norm + 1e-6)
+            for g in grads:
+                np.multiply(g, scale, out=g)
+        return norm
+
+class Sequential(Module):
     """ A high-level wrapper for the module object, simplifies the forward pass when
     multiple operations are needed to perform in order. Follows the same naming
     convention as the main module object, namely, __call__() forward() and parameters(),
@@ -57,14 +216,33 @@ class Sequential(object):
     ----------
     *modules: iterable | list | tuple
         The collection of modules stored sequentially.
+    flat: bool
+        Specify whether to store all parameters and gradients in contiguous flat
+        buffers, see ``Module.flatten_parameters``.
+    checkpoint_every: int
+        If set, the modules are split into segments of this many modules and
+        all but the last segment are applied through ``leaf.checkpoint``,
+        keeping only the activations between segments alive until backward.
 
     """
-    def __init__(self, *modules) -> None:
+    def __init__(self, *modules, flat=False, checkpoint_every=None) -> None:
         if not all(isinstance(m, Module) for m in modules):
             raise ValueError(
                 f'Not all objects provided to {self} is a module, {modules}.'
             )
+
+        if checkpoint_every is not None and (not isinstance(checkpoint_every, int) or checkpoint_every < 1):
+            raise ValueError(
+                f'Segment length has to be a positive integer, got {checkpoint_every}.'
+            )
+
         self._modules = modules
+        self._segments = None
+        if checkpoint_every is not None:
+            self._segments = [Sequential(*modules[i:i + checkpoint_every])
+                              for i in range(0, len(modules), checkpoint_every)]
+        if flat:
+            self.flatten_parameters()
 
     def __call__(self, input_) -> Tensor:
         return self.forward(input_)
@@ -72,6 +250,13 @@ class Sequential(object):
     def forward(self, input_) -> Tensor:
         """ Return the resulting tensor after applying all sequential forward passes. """
         x = input_
+        if self._segments is not None and is_grad_enabled():
+            # The last segment is not checkpointed, as backward starts by
+            # consuming its activations anyway.
+            for segment in self._segments[:-1]:
+                x = checkpoint(segment, x)
+            return self._segments[-1](x)
+
         for module in self._modules:
             x = module(x)
         return x 
@@ -82,3 +267,13 @@ class Sequential(object):
         for module in self._modules:
             params.extend(module.parameters())
         return params
+
+    def named_parameters(self, prefix='') -> list:
+        """ Return the parameters as (name, tensor) pairs, named by module index. """
+        params = []
+        for i, module in enumerate(self._modules):
+            params.extend(module.named_parameters(f'{prefix}{i}.'))
+        return params
+
+    def _children(self) -> list:
+        return list(self._modules)
@@ -0,0 +1,74 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+from leaf import Tensor
+from leaf.nn import Module
+from leaf.functions._im2col import pair
+
+class Conv2d(Module):
+    """ 2D convolution layer implementation as a neural network module, on
+    inputs in (N, C, H, W) layout. Computed as a single matrix product of the
+    flattened kernel with the unfolded input, see ``Tensor.conv2d``.
+
+    Parameters
+    ----------
+    in_channels: int
+        Number of channels of the input.
+    out_channels: int
+        Number of channels produced by the convolution.
+    kernel_size: int | tuple
+        Spatial size of the kernel, the same for both axes if an int.
+    stride: int | tuple
+        Step between the positions the kernel is applied at.
+    padding: int | tuple
+        Number of zeros added to both sides of each spatial axis.
+    dilation: int | tuple
+        Spacing between the kernel elements.
+    bias: bool
+        Specify whether or not to add a learnable bias per output channel.
+
+    """
+    def __init__(self, in_channels, out_channels, kernel_size, stride=1,
+        padding=0, dilation=1, bias=True) -> None:
+        self._weights = Tensor.uniform(out_channels, in_channels, *pair(kernel_size), requires_grad=True)
+        self._bias = Tensor.uniform(out_channels, requires_grad=True) if bias else None
+        self._stride = pair(stride)
+        self._padding = pair(padding)
+        self._dilation = pair(dilation)
+
+    def forward(self, input_) -> Tensor:
+        """ Convolve the input of shape (N, C_in, H, W) with the kernel, resulting
+        in an output of shape (N, C_out, H_out, W_out) where
+
+        H_out = (H + 2 * padding - dilation * (kernel_size - 1) - 1) // stride + 1
+
+        and likewise for W_out.
+
+        """
+        tensors = (self._weights, ) if self._bias is None else (self._weights, self._bias)
+        return input_.conv2d(*tensors, stride=self._stride,
+            padding=self._padding, dilation=self._dilation)
@@ -22,7 +22,7 @@
 # SOFTWARE.
 #
 # File created: 2022-11-18
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 from leaf import Tensor
@@ -43,6 +43,10 @@ class Linear(Module):
         if `True`, then learnable bias parameter is added to output of
         the matmul operator.
 
+    Inside of ``leaf.amp.autocast`` the parameters are kept as float32 master
+    weights, they are cast to float16 for the matmul and the bias addition
+    and receive float32 gradients.
+
     """
     def __init__(self, fan_in, fan_out, bias=True) -> None:
         self._weights = Tensor.uniform(fan_in, fan_out, requires_grad=True)
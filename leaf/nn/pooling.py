@@ -0,0 +1,78 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+from leaf import Tensor
+from leaf.nn import Module
+
+class MaxPool2d(Module):
+    """ 2D max pooling as a neural network module, on inputs in (N, C, H, W)
+    layout. Only the position of the maximum within each window is kept for
+    the backwards pass, see ``Tensor.maxpool2d``.
+
+    Parameters
+    ----------
+    kernel_size: int | tuple
+        Spatial size of the windows, the same for both axes if an int.
+    stride: int | tuple
+        Step between the windows, defaults to ``kernel_size``.
+    padding: int | tuple
+        Number of padded pixels on both sides of each spatial axis, at most
+        half of the kernel size. Padding never is the maximum.
+
+    """
+    def __init__(self, kernel_size, stride=None, padding=0) -> None:
+        self._kernel_size = kernel_size
+        self._stride = stride
+        self._padding = padding
+
+    def forward(self, input_) -> Tensor:
+        return input_.maxpool2d(kernel_size=self._kernel_size,
+            stride=self._stride, padding=self._padding)
+
+class AvgPool2d(Module):
+    """ 2D average pooling as a neural network module, on inputs in (N, C, H, W)
+    layout, see ``Tensor.avgpool2d``.
+
+    Parameters
+    ----------
+    kernel_size: int | tuple
+        Spatial size of the windows, the same for both axes if an int.
+    stride: int | tuple
+        Step between the windows, defaults to ``kernel_size``.
+    padding: int | tuple
+        Number of zero padded pixels on both sides of each spatial axis, at
+        most half of the kernel size. Padding counts towards the average.
+
+    """
+    def __init__(self, kernel_size, stride=None, padding=0) -> None:
+        self._kernel_size = kernel_size
+        self._stride = stride
+        self._padding = padding
+
+    def forward(self, input_) -> Tensor:
+        return input_.avgpool2d(kernel_size=self._kernel_size,
+            stride=self._stride, padding=self._padding)
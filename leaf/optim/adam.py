@@ -0,0 +1,106 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import math
+import numpy as np
+from leaf import memory
+from leaf.optim.base import Optimizer
+
+class Adam(Optimizer):
+    """ Adam optimizer with L2 weight decay, following the same update rule as
+    ``torch.optim.Adam``. Bias correction uses the number of optimizer steps.
+
+        g = grad + weight_decay * param
+        m = beta1 * m + (1 - beta1) * g
+        v = beta2 * v + (1 - beta2) * g^2
+        param -= lr / (1 - beta1^t) * m / (sqrt(v / (1 - beta2^t)) + eps)
+
+    Parameters
+    ----------
+    parameters: iterable
+        The tensors to optimize, e.g. ``module.parameters()``.
+    lr: float
+        The learning rate.
+    betas: tuple
+        Decay rates of the running averages of the gradient and its square.
+    eps: float
+        Term added to the denominator for numerical stability.
+    weight_decay: float
+        Factor of the L2 penalty added to the gradients.
+    multi_tensor: bool
+        Specify whether to update all parameters at once on flat buffers.
+
+    """
+    def __init__(self, parameters, lr=1e-3, betas=(0.9, 0.999), eps=1e-8,
+        weight_decay=0.0, multi_tensor=True) -> None:
+        if lr < 0.0 or eps < 0.0 or weight_decay < 0.0 \
+                or not all(0.0 <= beta < 1.0 for beta in betas):
+            raise ValueError(
+                f'Invalid Adam hyperparameters, lr={lr} betas={betas} eps={eps} ' \
+                f'weight_decay={weight_decay}.'
+            )
+
+        super(Adam, self).__init__(parameters, multi_tensor=multi_tensor)
+        self.lr = lr
+        self.betas = tuple(betas)
+        self.eps = eps
+        self.weight_decay = weight_decay
+        self.exp_avgs = self._state()
+        self.exp_avg_sqs = self._state()
+
+    def _states(self) -> tuple:
+        return (self.exp_avgs, self.exp_avg_sqs)
+
+    def _update(self, param, grad, exp_avg, exp_avg_sq) -> None:
+        beta1, beta2 = self.betas
+        scratch = memory.empty(param.shape, param.dtype)
+        direction = grad
+        if self.weight_decay:
+            np.multiply(param, self.weight_decay, out=scratch)
+            direction = np.add(scratch, grad, out=scratch)
+
+        # The running averages are updated as b * (avg - x) + x, which needs
+        # no scratch space and leaves it to hold the squared gradient.
+        np.subtract(exp_avg, direction, out=exp_avg)
+        np.multiply(exp_avg, beta1, out=exp_avg)
+        np.add(exp_avg, direction, out=exp_avg)
+
+        np.multiply(direction, direction, out=scratch)
+        np.subtract(exp_avg_sq, scratch, out=exp_avg_sq)
+        np.multiply(exp_avg_sq, beta2, out=exp_avg_sq)
+        np.add(exp_avg_sq, scratch, out=exp_avg_sq)
+
+        correction1 = 1.0 - beta1 ** self.steps
+        correction2 = 1.0 - beta2 ** self.steps
+        np.sqrt(exp_avg_sq, out=scratch)
+        np.multiply(scratch, 1.0 / math.sqrt(correction2), out=scratch)
+        np.add(scratch, self.eps, out=scratch)
+        np.divide(exp_avg, scratch, out=scratch)
+        np.multiply(scratch, self.lr / correction1, out=scratch)
+        np.subtract(param, scratch, out=param)
+        direction = None
+        memory.release(scratch)
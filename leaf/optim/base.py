@@ -0,0 +1,157 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import memory
+from leaf.tensor import Tensor
+
+class Optimizer(object):
+    """ Parent class for the optimizers, updating a fixed list of parameters in
+    place from their gradients. Subclasses implement ``_update``, which is
+    handed the parameter array, its gradient and the state buffers registered
+    with ``_state`` and updates them with in-place NumPy ops only.
+
+    In multi-tensor mode, the default, the parameters are moved into a single
+    contiguous buffer that their tensors hold views of, and all state is kept
+    in buffers of the same layout. A step then concatenates the gradients into
+    one array and runs ``_update`` once on the flat buffers, i.e. a handful of
+    vectorized calls regardless of the number of parameters. Parameters that
+    are flattened already, see ``Module.flatten_parameters``, are not moved
+    and their gradients not copied, as they are views of one buffer too.
+    Otherwise, or if the parameters are of different datatypes, ``_update``
+    runs per parameter. Parameters without a gradient are skipped, which falls
+    back to the per parameter update for that step.
+
+    When training with ``leaf.amp.LossScaler``, unscale the gradients before
+    stepping and skip the step if they overflowed:
+
+        if scaler.unscale(optimizer.parameters):
+            optimizer.step()
+        scaler.update()
+
+    Parameters
+    ----------
+    parameters: iterable
+        The tensors to optimize, e.g. ``module.parameters()``.
+    multi_tensor: bool
+        Specify whether to update all parameters at once on flat buffers.
+
+    """
+    def __init__(self, parameters, multi_tensor=True) -> None:
+        parameters = list(parameters)
+        if not parameters:
+            raise ValueError(
+                f'{type(self).__name__} received an empty list of parameters.'
+            )
+
+        if not all(isinstance(p, Tensor) and p.requires_grad for p in parameters):
+            raise ValueError(
+                f'Can only optimize tensors requiring grad, got {parameters}.'
+            )
+
+        self.parameters = parameters
+        self.steps = 0
+        self.multi_tensor = multi_tensor and len({p.dtype for p in parameters}) == 1
+
+        bounds = np.cumsum([0] + [p.data.size for p in parameters])
+        self._slices = [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        self._flat = self._flat_grad = self._grad_views = None
+        if self.multi_tensor:
+            self._flatten()
+
+    def _flatten(self) -> None:
+        """ Use the flat buffers the parameters and gradients already are views of,
+        e.g. by ``Module.flatten_parameters``, or else move the parameters into
+        a new one and allocate a private buffer to gather the gradients into. """
+        parameters = self.parameters
+        self._flat = memory.flat_base([p.data for p in parameters])
+        if self._flat is None:
+            self._flat, views = memory.flatten([p.data for p in parameters])
+            for p, view in zip(parameters, views):
+                p.data = view
+                p._version += 1
+
+        grads = [p.grad for p in parameters]
+        if all(g is not None for g in grads):
+            self._flat_grad = memory.flat_base(grads)
+        if self._flat_grad is not None and self._flat_grad.dtype == self._flat.dtype:
+            self._grad_views = grads
+        else:
+            self._flat_grad = np.empty_like(self._flat)
+
+    def _state(self) -> tuple:
+        """ Allocate a zeroed state buffer, returned as a tuple of the flat buffer,
+        which is None unless in multi-tensor mode, and per parameter arrays. """
+        if self.multi_tensor:
+            flat = np.zeros_like(self._flat)
+            return flat, [flat[s].reshape(p.shape) for p, s in zip(self.parameters, self._slices)]
+        return None, [np.zeros_like(p.data) for p in self.parameters]
+
+    def _states(self) -> tuple:
+        """ Return the state buffers the subclass passes on to ``_update``. """
+        return ()
+
+    def _update(self, param, grad, *states) -> None:
+        """ Each respective optimizer has to implement this depending on its update rule. """
+        raise NotImplementedError(
+            f'User defined optimizer {self} has not implemented its update.'
+        )
+
+    def zero_grad(self) -> None:
+        """ Reset the gradients of all parameters, filling the shared gradient buffer
+        with zeros if there is one, or handing them back to the memory pool. """
+        if self._grad_views is not None:
+            self._flat_grad.fill(0)
+            for p, view in zip(self.parameters, self._grad_views):
+                if p.grad is not view:
+                    grad, p.grad = p.grad, view
+                    memory.release(grad)
+            return
+
+        for p in self.parameters:
+            grad, p.grad = p.grad, None
+            memory.release(grad)
+
+    def step(self) -> None:
+        """ Update all parameters with a gradient in place. """
+        self.steps += 1
+        states = self._states()
+        grads = [p.grad for p in self.parameters]
+
+        if self.multi_tensor and all(g is not None for g in grads):
+            views = self._grad_views
+            if views is None or any(g is not v for g, v in zip(grads, views)):
+                np.concatenate([g.reshape(-1) for g in grads], out=self._flat_grad)
+            self._update(self._flat, self._flat_grad, *(flat for flat, _ in states))
+            for p in self.parameters:
+                p._version += 1
+            return
+
+        for i, (p, grad) in enumerate(zip(self.parameters, grads)):
+            if grad is not None:
+                self._update(p.data, grad, *(arrays[i] for _, arrays in states))
+                p._version += 1
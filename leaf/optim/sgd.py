@@ -0,0 +1,100 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+from leaf import memory
+from leaf.optim.base import Optimizer
+
+class SGD(Optimizer):
+    """ Stochastic gradient descent, optionally with (Nesterov) momentum and L2
+    weight decay, following the same update rule as ``torch.optim.SGD``:
+
+        g = grad + weight_decay * param
+        b = momentum * b + g
+        param -= lr * (g + momentum * b)  if nesterov
+        param -= lr * b                   otherwise
+
+    Parameters
+    ----------
+    parameters: iterable
+        The tensors to optimize, e.g. ``module.parameters()``.
+    lr: float
+        The learning rate.
+    momentum: float
+        Momentum factor, plain SGD if zero in which case no buffer is kept.
+    weight_decay: float
+        Factor of the L2 penalty added to the gradients.
+    nesterov: bool
+        Specify whether to use Nesterov momentum, requires non-zero momentum.
+    multi_tensor: bool
+        Specify whether to update all parameters at once on flat buffers.
+
+    """
+    def __init__(self, parameters, lr=1e-3, momentum=0.0, weight_decay=0.0,
+        nesterov=False, multi_tensor=True) -> None:
+        if lr < 0.0 or momentum < 0.0 or weight_decay < 0.0:
+            raise ValueError(
+                f'Invalid SGD hyperparameters, lr={lr} momentum={momentum} ' \
+                f'weight_decay={weight_decay}, must all be non-negative.'
+            )
+
+        if nesterov and momentum == 0.0:
+            raise ValueError('Nesterov momentum requires a non-zero momentum.')
+
+        super(SGD, self).__init__(parameters, multi_tensor=multi_tensor)
+        self.lr = lr
+        self.momentum = momentum
+        self.weight_decay = weight_decay
+        self.nesterov = nesterov
+        self.momentum_buffers = self._state() if momentum else None
+
+    def _states(self) -> tuple:
+        return () if self.momentum_buffers is None else (self.momentum_buffers, )
+
+    def _update(self, param, grad, *states) -> None:
+        # A single scratch array suffices, the Nesterov term is applied as a
+        # second subtraction rather than being added to the direction first.
+        scratch = memory.empty(param.shape, param.dtype)
+        direction, lr = grad, self.lr
+        if self.weight_decay:
+            np.multiply(param, self.weight_decay, out=scratch)
+            direction = np.add(scratch, grad, out=scratch)
+
+        if self.momentum:
+            buffer, = states
+            np.multiply(buffer, self.momentum, out=buffer)
+            np.add(buffer, direction, out=buffer)
+            if self.nesterov:
+                np.multiply(direction, lr, out=scratch)
+                np.subtract(param, scratch, out=param)
+                lr = lr * self.momentum
+            direction = buffer
+
+        np.multiply(direction, lr, out=scratch)
+        np.subtract(param, scratch, out=param)
+        direction = None
+        memory.release(scratch)
@@ -0,0 +1,274 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import os
+import traceback
+import numpy as np
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from leaf.tensor import Tensor
+from leaf.nn import Module
+
+def _shared(shape, dtype) -> tuple:
+    """ Return a new block of shared memory and a zeroed array backed by it. """
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    array.fill(0)
+    return block, array
+
+def _bounds(size, parts) -> list:
+    """ Return the offsets splitting ``size`` elements into ``parts`` even chunks. """
+    return [int(b) for b in np.linspace(0, size, parts + 1)]
+
+def _worker(rank, conn, barrier, timeout, module, criterion, optimizer, params, slots,
+        reduced) -> None:
+    """ Loop of a worker process, running a training step for every batch shard it
+    receives until it receives None. The parameters are shared by all workers,
+    each one reduces and updates its own chunk of them. """
+    bounds = _bounds(params.size, len(slots))
+    lo, hi = bounds[rank], bounds[rank + 1]
+
+    shard = Tensor(params[lo:hi], dtype=params.dtype, requires_grad=True, copy=False)
+    shard.grad = reduced[lo:hi]
+    optimizer = optimizer([shard])
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+
+        x, y, weight = message
+        try:
+            # Shards are weighted by their share of the batch, such that the sum
+            # of the gradients is the gradient of the mean over the full batch.
+            loss = 0.0
+            if weight:
+                module.zero_grad()
+                loss = criterion(module(Tensor(x)), Tensor(y, dtype=y.dtype))
+                loss.backward()
+                loss = loss.data.item() * weight
+                np.multiply(module._flat_grads, weight, out=slots[rank])
+            else:
+                slots[rank].fill(0)
+
+            barrier.wait(timeout)
+            np.sum(slots[:, lo:hi], axis=0, out=reduced[lo:hi])
+            optimizer.step()
+            barrier.wait(timeout)
+            conn.send(loss)
+        except Exception:
+            barrier.abort()
+            conn.send(RuntimeError(f'Worker {rank} failed:\n{traceback.format_exc()}'))
+
+class DataParallel(object):
+    """ Data parallel training of a module on a single host. Forks ``workers``
+    processes that each run the forward and backwards pass on their shard of
+    every batch, after which the gradients are averaged through shared memory
+    and the parameters updated.
+
+    The parameters are moved into a flat buffer in shared memory, see
+    ``Module.flatten_parameters``, which the module in the calling process and
+    in all workers hold views of, so the workers always have identical weights.
+    Each worker copies its flat gradient into its own slot of a shared array.
+    The reduction is the reduce-scatter half of a ring all-reduce: worker ``i``
+    sums the ``i``-th chunk of all slots and runs its own optimizer on that
+    chunk of the parameters. The all-gather half is not needed, as the
+    updated parameters already are in shared memory. Each step therefore moves
+    every gradient element through memory a constant number of times, and the
+    optimizer state is split across the workers.
+
+    The optimizers are element-wise, so the sharded update equals a single one.
+    Uses the fork start method and is thus only supported on POSIX systems.
+    Limit the BLAS threads of NumPy, e.g. with ``OMP_NUM_THREADS``, such that
+    the workers together do not use more threads than there are cores.
+
+    Parameters
+    ----------
+    module: Module
+        The module to train, its parameters are flattened into shared memory.
+    criterion: Criterion
+        Loss function called on the output of the module and the targets.
+    optimizer: callable
+        Called with a list of parameters to create the optimizer in each worker,
+        e.g. ``functools.partial(leaf.optim.Adam, lr=1e-3)``.
+    workers: int
+        Number of worker processes, one per core if not given.
+    timeout: float
+        Seconds a worker waits for the others to finish their shard before it
+        fails the step, should a worker hang.
+
+    """
+    def __init__(self, module, criterion, optimizer, workers=None, timeout=300.0) -> None:
+        if not isinstance(module, Module):
+            raise ValueError(f'Can only parallelize a nn.Module, got {module}.')
+
+        params = module.parameters()
+        if not params:
+            raise ValueError(f'Module {module} has no parameters to train.')
+
+        workers = os.cpu_count() if workers is None else workers
+        if workers < 1:
+            raise ValueError(f'Number of workers has to be positive, got {workers}.')
+
+        size, dtype = sum(p.data.size for p in params), params[0].dtype
+        self.module = module
+        self.workers = workers
+        self._parameters = params
+        self._params_block, params = _shared((size, ), dtype)
+        self._grads_block, grads = _shared((workers + 1, size), dtype)
+        module.flatten_parameters(buffer=params)
+
+        context = multiprocessing.get_context('fork')
+        self._barrier = barrier = context.Barrier(workers)
+        self._conns, self._processes = [], []
+        for rank in range(workers):
+            conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker, daemon=True, args=(rank, child_conn,
+                barrier, timeout, module, criterion, optimizer, params, grads[:workers], grads[workers]))
+            process.start()
+            child_conn.close()
+            self._conns.append(conn)
+            self._processes.append(process)
+
+        self._gradient = grads[workers]
+
+    @property
+    def gradient(self) -> np.ndarray:
+        """ The flat gradient averaged over the last batch, in the order of ``parameters()``. """
+        return self._gradient
+
+    def __enter__(self) -> 'DataParallel':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def step(self, x, y) -> float:
+        """ Run a training step on the batch split across the workers and return
+        the mean loss over it.
+
+        Parameters
+        ----------
+        x: np.ndarray | Tensor
+            The batch of inputs, split along the first axis.
+        y: np.ndarray | Tensor
+            The batch of targets, split along the first axis.
+
+        """
+        if self._processes is None:
+            raise RuntimeError('Trying to step a DataParallel that has been closed.')
+
+        x = x.data if isinstance(x, Tensor) else np.asarray(x)
+        y = y.data if isinstance(y, Tensor) else np.asarray(y)
+        if len(x) != len(y) or not len(x):
+            raise ValueError(
+                f'Expected non-empty batches of inputs and targets of equal size, ' \
+                f'got {len(x)} and {len(y)}.'
+            )
+
+        bounds = _bounds(len(x), self.workers)
+        try:
+            for rank, conn in enumerate(self._conns):
+                lo, hi = bounds[rank], bounds[rank + 1]
+                conn.send((x[lo:hi], y[lo:hi], (hi - lo) / len(x)))
+        except OSError as e:
+            self.close()
+            raise RuntimeError(f'Worker {rank} of DataParallel has died.') from e
+
+        results = self._receive()
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            self.close()
+            raise errors[0]
+
+        # The workers updated the shared parameters in place, bump the versions
+        # here as the copies of the parameters in the workers are not ours.
+        for p in self._parameters:
+            p._version += 1
+
+        return sum(results)
+
+    def _receive(self) -> list:
+        """ Return the result of every worker, waiting on the exit of the worker
+        processes as well such that a dead worker does not block forever. """
+        results = [None] * self.workers
+        pending = {conn: rank for rank, conn in enumerate(self._conns)}
+        pending.update({p.sentinel: rank for rank, p in enumerate(self._processes)})
+        while pending:
+            for ready in wait(list(pending)):
+                rank = pending.pop(ready, None)
+                if rank is None:
+                    continue
+
+                conn = self._conns[rank]
+                try:
+                    if ready is conn or conn.poll():
+                        results[rank] = conn.recv()
+                        pending.pop(conn, None)
+                        pending.pop(self._processes[rank].sentinel, None)
+                        continue
+                except (OSError, EOFError):
+                    pass
+
+                process = self._processes[rank]
+                self.close()
+                raise RuntimeError(
+                    f'Worker {rank} of DataParallel has died with exit code {process.exitcode}.'
+                )
+
+        return results
+
+    def close(self) -> None:
+        """ Stop the workers and move the parameters of the module back out of
+        shared memory, after which it can be used as before. """
+        if self._processes is None:
+            return
+
+        # Wakes up the workers waiting for one that has died.
+        self._barrier.abort()
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            conn.close()
+
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+
+        self.module.flatten_parameters()
+        self._processes = self._conns = self._gradient = None
+        for block in (self._params_block, self._grads_block):
+            try:
+                block.close()
+            except BufferError:
+                pass
+            block.unlink()
@@ -0,0 +1,131 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+""" Checkpoint format of ``leaf.save`` and ``leaf.load``. A file consists of
+
+    MAGIC              8 bytes, b'LEAF' followed by the format version
+    header length      8 bytes, little endian unsigned integer
+    header             UTF-8 JSON, {name: {dtype, shape, offset, nbytes}}
+    buffers            raw C-ordered array data, each at an offset that is a
+                       multiple of ALIGNMENT from the start of the file
+
+so that loading only parses the header and maps the rest of the file. """
+
+import os
+import struct
+import numpy as np
+from leaf.tensor import Tensor
+
+MAGIC = b'LEAF\x00\x00\x00\x01'
+ALIGNMENT = 64
+
+def _align(offset) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def save(obj, path) -> None:
+    """ Write the parameters of a module, or a dictionary of arrays or tensors,
+    to a checkpoint file. The file is written next to the path and moved over
+    it once complete, such that processes that have the previous checkpoint
+    memory-mapped keep on reading it unchanged.
+
+    Parameters
+    ----------
+    obj: Module | dict
+        The module, whose ``state_dict`` is saved, or dictionary from name to
+        array or tensor.
+    path: str
+        Path of the checkpoint file.
+
+    """
+    import json
+
+    state = obj.state_dict() if hasattr(obj, 'state_dict') else obj
+    arrays = {}
+    for name, value in state.items():
+        value = value.data if isinstance(value, Tensor) else value
+        arrays[str(name)] = np.asarray(value, order='C')
+
+    # The offsets depend on the length of the header, which depends on the
+    # offsets, so it is first encoded with offsets that are at least as long.
+    header, offset = {}, 0
+    for name, array in arrays.items():
+        header[name] = {'dtype': array.dtype.str, 'shape': list(array.shape),
+            'offset': offset, 'nbytes': array.nbytes}
+        offset = _align(offset + array.nbytes)
+    start = _align(len(MAGIC) + 8 + len(json.dumps(header).encode()) + 32 * len(header))
+
+    for entry in header.values():
+        entry['offset'] += start
+    encoded = json.dumps(header).encode()
+
+    tmp = f'{path}.tmp{os.getpid()}'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(MAGIC + struct.pack('<Q', len(encoded)) + encoded)
+            for name, array in arrays.items():
+                f.write(b'\x00' * (header[name]['offset'] - f.tell()))
+                f.write(array.reshape(-1).view(np.uint8))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def load(path, mmap=True) -> dict:
+    """ Read a checkpoint file written by ``save``, returning a dictionary from
+    name to tensor, e.g. to pass to ``Module.load_state_dict``.
+
+    By default the file is memory-mapped and the tensors are views of it, so
+    loading takes constant time regardless of the size of the checkpoint, and
+    only the pages that are read are loaded from disk. The mapping is copy on
+    write, a page is copied into memory of the process once written to, while
+    pages that are only read are shared with all processes mapping the file.
+
+    Parameters
+    ----------
+    path: str
+        Path of the checkpoint file.
+    mmap: bool
+        Specify whether to memory-map the file rather than read it into memory.
+
+    """
+    import json
+
+    with open(path, 'rb') as f:
+        magic = f.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f'File {path} is not a leaf checkpoint, or of an unsupported version.')
+        length, = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(length))
+
+    data = np.memmap(path, dtype=np.uint8, mode='c') if mmap else np.fromfile(path, dtype=np.uint8)
+
+    state = {}
+    for name, entry in header.items():
+        offset = entry['offset']
+        array = data[offset:offset + entry['nbytes']].view(np.dtype(entry['dtype']))
+        state[name] = Tensor.from_numpy(array.reshape(entry['shape']))
+    return state
@@ -22,12 +22,43 @@
 # SOFTWARE.
 #
 # File created: 2022-11-01
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 from __future__ import annotations
 from typing import Union, Tuple, List
 import numpy as np
+from leaf import autograd
+
+def _to_array(data, dtype, copy=True) -> np.ndarray:
+    """ Cast the data to a numpy array of the specified datatype. Unless ``copy``
+    is set, arrays and objects exposing the buffer protocol or ``__array__``,
+    e.g. memory-mapped files or shared memory, are wrapped without copying
+    whenever they already are of the datatype. """
+    if not copy and type(data) is np.ndarray and data.dtype == dtype:
+        return data
+
+    if isinstance(data, (list, tuple)):
+        return np.array(data, dtype=dtype)
+
+    if isinstance(data, np.ndarray):
+        return data.astype(dtype) if copy else np.asarray(data, dtype=dtype)
+
+    if hasattr(data, '__array__') or isinstance(data, (memoryview, bytearray)):
+        return np.array(data, dtype=dtype) if copy else np.asarray(data, dtype=dtype)
+
+    if not hasattr(data, '__iter__'):
+        return np.array([data], dtype=dtype)
+
+    return np.array(data, dtype=dtype)
+
+class _VersionCounter(object):
+    """ Number of in-place modifications of the data of a tensor, shared with the
+    tensors detached from it as they share the data. """
+    __slots__ = ('value', )
+
+    def __init__(self) -> None:
+        self.value = 0
 
 class Tensor(object):
     """ Definition and implementation of the Tensor class.
@@ -47,27 +78,76 @@ class Tensor(object):
         Determines on what device the Tensor operations will be
         performed on. Defaults to 'CPU', valid options are
         ('cpu', 'gpu', 'Rust'). GPU currently not supported. 
+    copy: bool
+        Specify whether the data should be copied. If False, arrays and
+        buffers already of the datatype are shared with the Tensor.
 
     """
-    def __init__(self, data, *args, dtype=np.float32,
-        requires_grad=False, device='cpu', _is_leaf=True, **kwargs) -> None:
+    __slots__ = (
+        '_data', '_lazy', 'grad', '_ctx', '_is_leaf', '_version_counter',
+        'device', 'requires_grad', '__weakref__',
+    )
 
-        if isinstance(data, (list, tuple)):
-            data = np.array(data).astype(dtype)
-
-        if not hasattr(data, '__iter__'):
-            data = np.array([data]).astype(dtype)
-
-        if isinstance(data, np.ndarray):
-            data = data.astype(dtype)
+    def __init__(self, data, *args, dtype=np.float32,
+        requires_grad=False, device='cpu', copy=True, _is_leaf=True, **kwargs) -> None:
 
-        self.data = data
+        self._data = None if data is None else _to_array(data, dtype, copy=copy)
+        self._lazy = None
         self.grad = None
         self._ctx = None
         self._is_leaf = _is_leaf
+        self._version_counter = _VersionCounter()
         self.device = device
         self.requires_grad = requires_grad
 
+    @classmethod
+    def from_numpy(cls, array, **kwargs) -> Tensor:
+        """ Create a Tensor sharing the memory of the array, or of any object
+        exposing the buffer protocol, keeping its datatype. Modifications of
+        the array are reflected in the Tensor and vice versa.
+
+        """
+        array = np.asarray(array)
+        return cls(array, dtype=array.dtype, copy=False, **kwargs)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self.data, dtype=dtype, copy=True)
+        if dtype is None or np.dtype(dtype) == self.dtype:
+            return self.data
+        if copy is False:
+            raise ValueError(f'Can not cast Tensor of {self.dtype} to {dtype} without copying.')
+        return self.data.astype(dtype)
+
+    def __buffer__(self, flags) -> memoryview:
+        return memoryview(self.data)
+
+    @classmethod
+    def _unrealized(cls, node, requires_grad, device) -> Tensor:
+        """ Create a tensor whose data is computed by the lazy node on first access. """
+        tensor = cls(None, requires_grad=requires_grad, device=device,
+                     _is_leaf=not requires_grad)
+        tensor._lazy = node
+        return tensor
+
+    @property
+    def _version(self) -> int:
+        return self._version_counter.value
+
+    @_version.setter
+    def _version(self, value) -> None:
+        self._version_counter.value = value
+
+    @property
+    def data(self) -> np.ndarray:
+        if self._data is None and self._lazy is not None:
+            self._lazy.realize(self)
+        return self._data
+
+    @data.setter
+    def data(self, data) -> None:
+        self._data = data
+
     @property
     def shape(self) -> Tuple:
         return self.data.shape
@@ -103,32 +183,27 @@ class Tensor(object):
         )
 
     def detach(self) -> Tensor:
-        """ Create a copy of the current tensor that is not part of the 
-        dynamic DAG. As such, the new tensor does not, and can not,
-        require grad because it is not part of any context nor DAG.
+        """ Create a new tensor, sharing the data of the current tensor, that
+        is not part of the dynamic DAG. As such, the new tensor does not, and
+        can not, require grad because it is not part of any context nor DAG.
         Subsequentially move the tensor to cpu device, if it was on other.
+        The version counter is shared as well, such that modifying the new
+        tensor in-place is caught by the contexts that saved the data.
+
+        """
+        tensor = Tensor(self.data, dtype=self.dtype, requires_grad=False, device='cpu', copy=False)
+        tensor._version_counter = self._version_counter
+        return tensor
+
+    def backward(self, allow_fill=True, retain_graph=False) -> None:
+        """ Calculate gradient backwards through DAG from reduced tensor.
+        Unless ``retain_graph`` is set, the DAG is freed during the pass and
+        a second backwards call through it raises a RuntimeError.
 
         """
-        return Tensor(self.data, dtype=self.dtype, requires_grad=False, device='cpu')
-
-    def _topological_sort(self):
-        def _recursive_walk(node, visited, nodes):
-            visited.add(node)
-            if node._ctx:
-                map(
-                    _recursive_walk,
-                    zip(
-                        [n for n in node._ctx.parents if n not in visited],
-                        visited,
-                        nodes,
-                    )
-                )
-                nodes.append(node)
-            return nodes
-        return _recursive_walk(self, set(), [])
-
-    def backward(self, allow_fill=True) -> None:
-        """ Calculate gradient backwards through DAG from reduced tensor. """
+        if self._lazy is not None:
+            self._lazy.realize(self)
+
         if allow_fill:
             self.grad = None
         
@@ -142,33 +217,14 @@ class Tensor(object):
                 'your tensor using either ``sum()`` or ``mean``, otherwise implicit ' \
                 'creation of the gradient, i.e. initiating it with ones, might be incorrect.'
         
-            self.grad = np.ones(self.shape)
-
-        for t in reversed(self._topological_sort()):
-            if not any(tt.requires_grad for tt in t._ctx.parents):
-                continue
-            
-            assert t.grad is not None, \
-                'The parents of the current node requires gradient, but no gradient has ' \
-                'been calculated or initialized for the current node. Make sure that the ' \
-                'current node inherited the correct grad requirements from parents.'
-            
-            parents = t._ctx.parents
-            gradients = t._ctx.backward(t.grad)
-
-            if isinstance(gradients, np.ndarray):
-                gradients = [gradients]
-            
-            for gradient, parent in zip(gradients, parents):
-                if gradient is None:
-                    continue
-                    
-                if parent.requires_grad:
-                    if parent.grad is None:
-                        gradient.flags.writeable = True
-                        parent.grad = gradient
-                    else:
-                        if not parent._is_leaf:
-                            parent.grad = gradient
-                        else:
-                            parent.grad += gradient
+            self.grad = np.ones(self.shape, dtype=self.dtype)
+
+        assert self.grad is not None, \
+            'No gradient has been initialized for the tensor to propagate backwards ' \
+            'from. Either set ``allow_fill=True`` or assign the ``grad`` attribute ' \
+            'before invoking the backwards pass.'
+
+        autograd.backward(self, self.grad, retain_graph=retain_graph)
+
+# Bind the ops as Tensor methods and operators, see ``leaf/functions/__init__.py``.
+import leaf.functions
@@ -22,74 +22,624 @@
 // SOFTWARE.
 //
 // File created: 2022-11-01
-// Last updated: 2023-01-13
+// Last updated: 2026-10-18
 //
 
-use ndarray;
+use ndarray::{ArrayView, Dimension};
+use numpy::npyffi::flags::{NPY_ARRAY_C_CONTIGUOUS, NPY_ARRAY_WRITEABLE};
 use numpy::{
     IntoPyArray,
+    PyArray,
     PyArray1,
     PyArray2,
+    PyArray4,
     PyArrayDyn,
     PyReadonlyArrayDyn,
+    PyReadonlyArray2,
     PyReadonlyArray4
 };
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::{
     pymodule,
+    PyErr,
     PyModule,
     PyResult,
     Python
 };
 
 mod rust_fn {
-    use ndarray::{arr1, Array1, Array2, ArrayD};
+    use ndarray::{arr1, Array1, Array2, ArrayD, IxDyn, Zip};
+    use ndarray::linalg::general_mat_mul;
+    use ndarray::parallel::prelude::*;
     use ndarray::prelude::*;
-    use numpy::ndarray::{ArrayViewD, ArrayView4};
+    use numpy::ndarray::{
+        ArrayViewD, ArrayViewMutD, ArrayView2, ArrayViewMut2, ArrayView3, ArrayViewMut3,
+        ArrayView4, ArrayViewMut4, Array4
+    };
     use ordered_float::OrderedFloat;
+    use rayon::slice::ParallelSliceMut;
+    use rayon::{ThreadPool, ThreadPoolBuilder};
+    use std::sync::{Arc, RwLock};
 
+    // Arrays smaller than this are processed on the calling thread, below it
+    // the cost of waking up the pool outweighs the parallel speedup.
+    const PARALLEL_MIN: usize = 1 << 15;
+
+    // Rows of the left operand per parallel matmul task.
+    const MATMUL_ROWS: usize = 64;
+
+    // Elements per parallel task of a fused elementwise program.
+    const FUSED_CHUNK: usize = 1 << 12;
+
+    static POOL: RwLock<Option<Arc<ThreadPool>>> = RwLock::new(None);
+
+    // Replaces the pool kernels run on, 0 threads selects one per core.
+    pub fn set_num_threads(n: usize) -> Result<(), String> {
+        let pool = ThreadPoolBuilder::new()
+            .num_threads(n)
+            .build()
+            .map_err(|e| e.to_string())?;
+        *POOL.write().expect("Error locking thread pool.") = Some(Arc::new(pool));
+        Ok(())
+    }
+
+    pub fn get_num_threads() -> usize {
+        match &*POOL.read().expect("Error locking thread pool.") {
+            Some(pool) => pool.current_num_threads(),
+            None => rayon::current_num_threads(),
+        }
+    }
+
+    // Runs the kernel inside the configured pool, or the global rayon pool if
+    // none has been configured.
+    pub fn install<R: Send>(op: impl FnOnce() -> R + Send) -> R {
+        let pool = POOL.read().expect("Error locking thread pool.").clone();
+        match pool {
+            Some(pool) => pool.install(op),
+            None => op(),
+        }
+    }
+
+    pub fn broadcast_shape(a: &[usize], b: &[usize]) -> Option<Vec<usize>> {
+        let ndim = a.len().max(b.len());
+        let mut shape = vec![1; ndim];
+        for i in 0..ndim {
+            let x = if i < ndim - a.len() { 1 } else { a[i + a.len() - ndim] };
+            let y = if i < ndim - b.len() { 1 } else { b[i + b.len() - ndim] };
+            shape[i] = match (x, y) {
+                (x, y) if x == y => x,
+                (1, y) => y,
+                (x, 1) => x,
+                _ => return None,
+            };
+        }
+        Some(shape)
+    }
+
+    // Elementwise kernels write into ``result``, which is either freshly
+    // allocated or an output buffer provided by the caller. None is
+    // returned if the operands can not be broadcast to its shape.
+    pub fn unary_into<F>(
+        x: &ArrayViewD<'_, f32>,
+        result: &mut ArrayViewMutD<'_, f32>,
+        f: F
+    ) -> Option<()>
+    where
+        F: Fn(f32) -> f32 + Sync + Send,
+    {
+        let x = x.broadcast(result.raw_dim())?;
+        let zip = Zip::from(result).and(&x);
+        if x.len() >= PARALLEL_MIN {
+            zip.par_for_each(|r, &a| *r = f(a));
+        } else {
+            zip.for_each(|r, &a| *r = f(a));
+        }
+        Some(())
+    }
+
+    pub fn unary<F>(x: &ArrayViewD<'_, f32>, f: F) -> ArrayD<f32>
+    where
+        F: Fn(f32) -> f32 + Sync + Send,
+    {
+        let mut result = ArrayD::<f32>::zeros(x.raw_dim());
+        unary_into(x, &mut result.view_mut(), f).expect("Error writing unary result.");
+        result
+    }
+
+    pub fn binary_into<F>(
+        x: &ArrayViewD<'_, f32>,
+        y: &ArrayViewD<'_, f32>,
+        result: &mut ArrayViewMutD<'_, f32>,
+        f: F
+    ) -> Option<()>
+    where
+        F: Fn(f32, f32) -> f32 + Sync + Send,
+    {
+        let x = x.broadcast(result.raw_dim())?;
+        let y = y.broadcast(result.raw_dim())?;
+        let zip = Zip::from(result).and(&x).and(&y);
+        if x.len() >= PARALLEL_MIN {
+            zip.par_for_each(|r, &a, &b| *r = f(a, b));
+        } else {
+            zip.for_each(|r, &a, &b| *r = f(a, b));
+        }
+        Some(())
+    }
+
+    pub fn binary<F>(
+        x: &ArrayViewD<'_, f32>,
+        y: &ArrayViewD<'_, f32>,
+        f: F
+    ) -> Option<ArrayD<f32>>
+    where
+        F: Fn(f32, f32) -> f32 + Sync + Send,
+    {
+        let shape = broadcast_shape(x.shape(), y.shape())?;
+        let mut result = ArrayD::<f32>::zeros(IxDyn(&shape));
+        binary_into(x, y, &mut result.view_mut(), f)?;
+        Some(result)
+    }
+
+    // Single pass over the data, returning [max, min].
     pub fn max_min(x: &ArrayViewD<'_, f32>) -> Array1<f32> {
         if x.len() == 0 { return arr1(&[]); }
-        let max_val = x
-            .iter()
-            .map(|a| OrderedFloat(*a))
-            .max()
-            .expect("Error calculating max value.")
-            .0;
-        let min_val = x
-            .iter()
-            .map(|a| OrderedFloat(*a))
-            .min()
-            .expect("Error calculating min value.")
-            .0;
-        let result_array = arr1(&[max_val, min_val]);
-        result_array
+        let first = OrderedFloat(x.iter().next().cloned().expect("Error reading first value."));
+        let fold = |(max, min): (OrderedFloat<f32>, OrderedFloat<f32>), &a: &f32| {
+            (max.max(OrderedFloat(a)), min.min(OrderedFloat(a)))
+        };
+        let (max_val, min_val) = match x.as_slice_memory_order() {
+            Some(slice) if slice.len() >= PARALLEL_MIN => slice
+                .par_iter()
+                .fold(|| (first, first), fold)
+                .reduce(|| (first, first), |a, b| (a.0.max(b.0), a.1.min(b.1))),
+            _ => x.iter().fold((first, first), fold),
+        };
+        arr1(&[max_val.0, min_val.0])
     }
 
     pub fn rusum(x: &ArrayView4<'_, f32>) -> Array2<f32> {
         let xshape = x.shape();
         let mut result_array = Array2::zeros((xshape[0], xshape[1]));
-        for h in 0..xshape[2] {
-            for w in 0..xshape[3] {
-                result_array += &ArrayView::from(x.slice(s![.., .., h, w]));
-            }
+        let zip = Zip::indexed(&mut result_array);
+        if x.len() >= PARALLEL_MIN {
+            zip.par_for_each(|(n, c), r| *r = x.slice(s![n, c, .., ..]).sum());
+        } else {
+            zip.for_each(|(n, c), r| *r = x.slice(s![n, c, .., ..]).sum());
         }
         result_array
     }
 
-    pub fn add(x: &ArrayViewD<'_, f32>, y: &ArrayViewD<'_, f32>) -> ArrayD<f32> {
-        x + y
+    pub fn add(a: f32, b: f32) -> f32 { a + b }
+
+    pub fn sub(a: f32, b: f32) -> f32 { a - b }
+
+    pub fn mul(a: f32, b: f32) -> f32 { a * b }
+
+    pub fn div(a: f32, b: f32) -> f32 { a / b }
+
+    pub fn exp(a: f32) -> f32 { a.max(-50.0).min(50.0).exp() }
+
+    pub fn log(a: f32) -> f32 { a.ln() }
+
+    pub fn relu(a: f32) -> f32 { a.max(0.0) }
+
+    // Splits the left operand into blocks of rows that are multiplied in parallel.
+    pub fn matmul_into(
+        x: &ArrayView2<'_, f32>,
+        y: &ArrayView2<'_, f32>,
+        result: &mut ArrayViewMut2<'_, f32>
+    ) -> Option<()> {
+        if x.ncols() != y.nrows() || result.dim() != (x.nrows(), y.ncols()) { return None; }
+        if x.len() + y.len() < PARALLEL_MIN {
+            general_mat_mul(1.0, x, y, 0.0, result);
+            return Some(());
+        }
+        result
+            .axis_chunks_iter_mut(Axis(0), MATMUL_ROWS)
+            .into_par_iter()
+            .zip(x.axis_chunks_iter(Axis(0), MATMUL_ROWS).into_par_iter())
+            .for_each(|(mut r, xs)| general_mat_mul(1.0, &xs, y, 0.0, &mut r));
+        Some(())
+    }
+
+    pub fn matmul(x: &ArrayView2<'_, f32>, y: &ArrayView2<'_, f32>) -> Option<Array2<f32>> {
+        let mut result = Array2::<f32>::zeros((x.nrows(), y.ncols()));
+        matmul_into(x, y, &mut result.view_mut())?;
+        Some(result)
+    }
+
+    // Geometry of a 2D convolution, each a (height, width) pair.
+    #[derive(Clone, Copy)]
+    pub struct Conv2d {
+        pub stride: (usize, usize),
+        pub padding: (usize, usize),
+        pub dilation: (usize, usize),
+    }
+
+    impl Conv2d {
+        // Spatial shape of the output, None if the kernel does not fit into the input.
+        fn output_dim(&self, input: (usize, usize), kernel: (usize, usize)) -> Option<(usize, usize)> {
+            let span = (self.dilation.0 * (kernel.0 - 1) + 1, self.dilation.1 * (kernel.1 - 1) + 1);
+            let padded = (input.0 + 2 * self.padding.0, input.1 + 2 * self.padding.1);
+            if kernel.0 == 0 || kernel.1 == 0 || padded.0 < span.0 || padded.1 < span.1 {
+                return None;
+            }
+            Some(((padded.0 - span.0) / self.stride.0 + 1, (padded.1 - span.1) / self.stride.1 + 1))
+        }
+
+        // Position in the unpadded input read by kernel offset k at output position o
+        // along the axis, None if it falls into the padding.
+        #[inline]
+        fn source(&self, axis: usize, o: usize, k: usize, size: usize) -> Option<usize> {
+            let (stride, padding, dilation) = match axis {
+                0 => (self.stride.0, self.padding.0, self.dilation.0),
+                _ => (self.stride.1, self.padding.1, self.dilation.1),
+            };
+            (o * stride + k * dilation).checked_sub(padding).filter(|&i| i < size)
+        }
+    }
+
+    // Unfolds one (C, H, W) image into columns, row (c, i, j) holds the pixels
+    // of channel c kernel offset (i, j) is multiplied with at every output
+    // position, as ``im2col`` in ``leaf/functions/_im2col.py``.
+    fn im2col(
+        x: &ArrayView3<'_, f32>,
+        kernel: (usize, usize),
+        p: &Conv2d,
+        out: (usize, usize),
+        cols: &mut ArrayViewMut2<'_, f32>
+    ) {
+        let (c, h, w) = x.dim();
+        for ci in 0..c {
+            for i in 0..kernel.0 {
+                for j in 0..kernel.1 {
+                    let mut row = cols.row_mut((ci * kernel.0 + i) * kernel.1 + j);
+                    for oy in 0..out.0 {
+                        let y = p.source(0, oy, i, h);
+                        for ox in 0..out.1 {
+                            row[oy * out.1 + ox] = match (y, p.source(1, ox, j, w)) {
+                                (Some(y), Some(xx)) => x[[ci, y, xx]],
+                                _ => 0.0,
+                            };
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    // Sums the columns back into the pixels they were read from.
+    fn col2im(
+        cols: &ArrayView2<'_, f32>,
+        kernel: (usize, usize),
+        p: &Conv2d,
+        out: (usize, usize),
+        dx: &mut ArrayViewMut3<'_, f32>
+    ) {
+        let (c, h, w) = dx.dim();
+        for ci in 0..c {
+            for i in 0..kernel.0 {
+                for j in 0..kernel.1 {
+                    let row = cols.row((ci * kernel.0 + i) * kernel.1 + j);
+                    for oy in 0..out.0 {
+                        let y = match p.source(0, oy, i, h) {
+                            Some(y) => y,
+                            None => continue,
+                        };
+                        for ox in 0..out.1 {
+                            if let Some(xx) = p.source(1, ox, j, w) {
+                                dx[[ci, y, xx]] += row[oy * out.1 + ox];
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    // The flattened (C_out, C * kh * kw) kernel.
+    fn flat_kernel(w: &ArrayView4<'_, f32>) -> Array2<f32> {
+        let (co, c, kh, kw) = w.dim();
+        w.as_standard_layout()
+            .into_owned()
+            .into_shape((co, c * kh * kw))
+            .expect("Error flattening kernel.")
+    }
+
+    // Convolves the (N, C, H, W) input with the (C_out, C, kh, kw) kernel, one
+    // image per parallel task, each a matrix product of the flattened kernel
+    // with the columns of the image.
+    pub fn conv2d_into(
+        x: &ArrayView4<'_, f32>,
+        w: &ArrayView4<'_, f32>,
+        p: &Conv2d,
+        result: &mut ArrayViewMut4<'_, f32>
+    ) -> Option<()> {
+        let (n, c, h, wd) = x.dim();
+        let (co, ci, kh, kw) = w.dim();
+        let out = p.output_dim((h, wd), (kh, kw))?;
+        if ci != c || result.dim() != (n, co, out.0, out.1) || !result.is_standard_layout() {
+            return None;
+        }
+
+        let weights = flat_kernel(w);
+        result
+            .axis_iter_mut(Axis(0))
+            .into_par_iter()
+            .zip(x.axis_iter(Axis(0)).into_par_iter())
+            .for_each(|(r, xi)| {
+                let mut cols = Array2::<f32>::zeros((c * kh * kw, out.0 * out.1));
+                im2col(&xi, (kh, kw), p, out, &mut cols.view_mut());
+                let mut r = r.into_shape((co, out.0 * out.1)).expect("Error reshaping output.");
+                general_mat_mul(1.0, &weights, &cols, 0.0, &mut r);
+            });
+        Some(())
+    }
+
+    pub fn conv2d(x: &ArrayView4<'_, f32>, w: &ArrayView4<'_, f32>, p: &Conv2d) -> Option<Array4<f32>> {
+        let (n, _, h, wd) = x.dim();
+        let (co, _, kh, kw) = w.dim();
+        let out = p.output_dim((h, wd), (kh, kw))?;
+        let mut result = Array4::<f32>::zeros((n, co, out.0, out.1));
+        conv2d_into(x, w, p, &mut result.view_mut())?;
+        Some(result)
+    }
+
+    // Gradient of the input, the transposed kernel times the output gradient
+    // of each image, summed back into pixels.
+    pub fn conv2d_input_grad(
+        grad: &ArrayView4<'_, f32>,
+        w: &ArrayView4<'_, f32>,
+        shape: (usize, usize, usize, usize),
+        p: &Conv2d
+    ) -> Option<Array4<f32>> {
+        let (n, c, h, wd) = shape;
+        let (co, ci, kh, kw) = w.dim();
+        let out = p.output_dim((h, wd), (kh, kw))?;
+        if ci != c || grad.dim() != (n, co, out.0, out.1) { return None; }
+
+        let weights = flat_kernel(w);
+        let mut dx = Array4::<f32>::zeros(shape);
+        dx.axis_iter_mut(Axis(0))
+            .into_par_iter()
+            .zip(grad.axis_iter(Axis(0)).into_par_iter())
+            .for_each(|(mut dxi, gi)| {
+                let gi = gi.as_standard_layout();
+                let gm = gi.view().into_shape((co, out.0 * out.1)).expect("Error reshaping gradient.");
+                let mut cols = Array2::<f32>::zeros((c * kh * kw, out.0 * out.1));
+                general_mat_mul(1.0, &weights.t(), &gm, 0.0, &mut cols);
+                col2im(&cols.view(), (kh, kw), p, out, &mut dxi);
+            });
+        Some(dx)
+    }
+
+    // Gradient of the kernel, the output gradient times the transposed columns
+    // of each image, accumulated per task and summed over the tasks.
+    pub fn conv2d_weight_grad(
+        grad: &ArrayView4<'_, f32>,
+        x: &ArrayView4<'_, f32>,
+        shape: (usize, usize, usize, usize),
+        p: &Conv2d
+    ) -> Option<Array4<f32>> {
+        let (n, c, h, wd) = x.dim();
+        let (co, ci, kh, kw) = shape;
+        let out = p.output_dim((h, wd), (kh, kw))?;
+        if ci != c || grad.dim() != (n, co, out.0, out.1) { return None; }
+
+        let size = c * kh * kw;
+        let dw = x
+            .axis_iter(Axis(0))
+            .into_par_iter()
+            .zip(grad.axis_iter(Axis(0)).into_par_iter())
+            .fold(|| Array2::<f32>::zeros((co, size)), |mut acc, (xi, gi)| {
+                let mut cols = Array2::<f32>::zeros((size, out.0 * out.1));
+                im2col(&xi, (kh, kw), p, out, &mut cols.view_mut());
+                let gi = gi.as_standard_layout();
+                let gm = gi.view().into_shape((co, out.0 * out.1)).expect("Error reshaping gradient.");
+                general_mat_mul(1.0, &gm, &cols.t(), 1.0, &mut acc);
+                acc
+            })
+            .reduce(|| Array2::<f32>::zeros((co, size)), |a, b| a + b);
+        dw.into_shape(shape).ok()
+    }
+
+    // Executes a chain of elementwise ops in a single pass over the data. Each
+    // instruction is (opcode, a, b) where a and b index the registers, inputs
+    // occupy the first registers and instruction k writes register n + k.
+    // Opcodes follow ``_OPCODES`` in ``leaf/functions/_fused.py``.
+    pub fn fused_elementwise(
+        program: &[(u8, usize, usize)],
+        inputs: &[ArrayViewD<'_, f32>],
+        shape: &[usize]
+    ) -> ArrayD<f32> {
+        let size: usize = shape.iter().product();
+        let owned: Vec<Option<Vec<f32>>> = inputs
+            .iter()
+            .map(|x| match x.as_slice() {
+                Some(_) => None,
+                None => Some(x.iter().cloned().collect()),
+            })
+            .collect();
+        let slices: Vec<&[f32]> = inputs
+            .iter()
+            .zip(owned.iter())
+            .map(|(x, o)| match o {
+                Some(v) => v.as_slice(),
+                None => x.as_slice().expect("Error reading contiguous input."),
+            })
+            .collect();
+
+        // Runs the program on the elements from ``offset`` onwards, with registers
+        // of its own such that chunks can be run in parallel.
+        let n_inputs = slices.len();
+        let run = |offset: usize, chunk: &mut [f32]| {
+            let mut registers = vec![0f32; n_inputs + program.len()];
+            for (j, value) in chunk.iter_mut().enumerate() {
+                let i = offset + j;
+                for (r, x) in slices.iter().enumerate() {
+                    registers[r] = if x.len() == 1 { x[0] } else { x[i] };
+                }
+                for (k, &(op, a, b)) in program.iter().enumerate() {
+                    let (x, y) = (registers[a], registers[b]);
+                    registers[n_inputs + k] = match op {
+                        0 => x.max(-50.0).min(50.0).exp(),
+                        1 => x.ln(),
+                        2 => x.max(0.0),
+                        3 => x + y,
+                        4 => x - y,
+                        5 => x * y,
+                        6 => x / y,
+                        7 => x.powf(y),
+                        _ => f32::NAN,
+                    };
+                }
+                *value = registers[n_inputs + program.len() - 1];
+            }
+        };
+
+        let mut result = vec![0f32; size];
+        if size >= PARALLEL_MIN {
+            result
+                .par_chunks_mut(FUSED_CHUNK)
+                .enumerate()
+                .for_each(|(c, chunk)| run(c * FUSED_CHUNK, chunk));
+        } else {
+            run(0, &mut result);
+        }
+        ArrayD::from_shape_vec(IxDyn(shape), result)
+            .expect("Error creating fused result array.")
+    }
+}
+
+fn shape_error() -> PyErr {
+    PyValueError::new_err("Operands could not be broadcast together.")
+}
+
+fn conv_error() -> PyErr {
+    PyValueError::new_err("Convolution input, kernel and output shapes do not match.")
+}
+
+// The datatype of ``out`` is checked when it is extracted as a float32 array,
+// the kernels further need it to be writeable and laid out in C order.
+fn check_out<D: Dimension>(out: &PyArray<f32, D>, shape: Option<&[usize]>) -> PyResult<()> {
+    let flags = unsafe { (*out.as_array_ptr()).flags };
+    if flags & NPY_ARRAY_WRITEABLE == 0 {
+        return Err(PyValueError::new_err("Output array is read-only."));
+    }
+    if flags & NPY_ARRAY_C_CONTIGUOUS == 0 {
+        return Err(PyValueError::new_err("Output array is not C-contiguous."));
+    }
+    match shape {
+        Some(shape) if out.shape() != shape => Err(PyValueError::new_err(format!(
+            "Output array has shape {:?}, expected {:?}.", out.shape(), shape
+        ))),
+        _ => Ok(()),
+    }
+}
+
+// Range of the addresses read through a view, None if it is empty.
+fn span<D: Dimension>(x: &ArrayView<'_, f32, D>) -> Option<(usize, usize)> {
+    if x.len() == 0 { return None; }
+    let size = std::mem::size_of::<f32>() as isize;
+    let (mut lo, mut hi) = (x.as_ptr() as isize, x.as_ptr() as isize + size);
+    for (&d, &s) in x.shape().iter().zip(x.strides()) {
+        let extent = (d as isize - 1) * s * size;
+        if extent < 0 { lo += extent; } else { hi += extent; }
+    }
+    Some((lo as usize, hi as usize))
+}
+
+// Whether ``out`` shares memory with any of the inputs, in which case a kernel
+// writing into it would hold a mutable view aliasing the input views.
+fn overlaps<D: Dimension, E: Dimension>(xs: &[&ArrayView<'_, f32, D>], out: &PyArray<f32, E>) -> bool {
+    let out = match span(&unsafe { out.as_array() }) {
+        Some(out) => out,
+        None => return false,
+    };
+    xs.iter().filter_map(|x| span(x)).any(|(lo, hi)| lo < out.1 && out.0 < hi)
+}
+
+// Runs an elementwise kernel with the GIL released, writing into ``out`` if
+// provided and into a newly allocated array otherwise. An ``out`` aliasing the
+// input is written after computing the result into a new array.
+fn unary_pyfn<'py>(
+    py: Python<'py>,
+    x: PyReadonlyArrayDyn<f32>,
+    out: Option<&'py PyArrayDyn<f32>>,
+    f: fn(f32) -> f32
+) -> PyResult<&'py PyArrayDyn<f32>> {
+    let x = x.as_array();
+    match out {
+        Some(out) if overlaps(&[&x], out) => {
+            check_out(out, Some(x.shape()))?;
+            let result = py.allow_threads(|| rust_fn::install(|| rust_fn::unary(&x, f)));
+            unsafe { out.as_array_mut() }.assign(&result);
+            Ok(out)
+        },
+        Some(out) => {
+            check_out(out, Some(x.shape()))?;
+            let mut result = unsafe { out.as_array_mut() };
+            py.allow_threads(|| rust_fn::install(|| rust_fn::unary_into(&x, &mut result, f)))
+                .ok_or_else(shape_error)?;
+            Ok(out)
+        },
+        None => {
+            let result = py.allow_threads(|| rust_fn::install(|| rust_fn::unary(&x, f)));
+            Ok(result.into_pyarray(py))
+        },
+    }
+}
+
+fn binary_pyfn<'py>(
+    py: Python<'py>,
+    x: PyReadonlyArrayDyn<f32>,
+    y: PyReadonlyArrayDyn<f32>,
+    out: Option<&'py PyArrayDyn<f32>>,
+    f: fn(f32, f32) -> f32
+) -> PyResult<&'py PyArrayDyn<f32>> {
+    let (x, y) = (x.as_array(), y.as_array());
+    match out {
+        Some(out) => {
+            let shape = rust_fn::broadcast_shape(x.shape(), y.shape()).ok_or_else(shape_error)?;
+            check_out(out, Some(shape.as_slice()))?;
+            if overlaps(&[&x, &y], out) {
+                let result = py.allow_threads(|| rust_fn::install(|| rust_fn::binary(&x, &y, f)));
+                unsafe { out.as_array_mut() }.assign(&result.ok_or_else(shape_error)?);
+                return Ok(out);
+            }
+            let mut result = unsafe { out.as_array_mut() };
+            py.allow_threads(|| rust_fn::install(|| rust_fn::binary_into(&x, &y, &mut result, f)))
+                .ok_or_else(shape_error)?;
+            Ok(out)
+        },
+        None => {
+            let result = py.allow_threads(|| rust_fn::install(|| rust_fn::binary(&x, &y, f)));
+            Ok(result.ok_or_else(shape_error)?.into_pyarray(py))
+        },
     }
 }
 
+// Every kernel releases the GIL while it runs, the input views are only
+// borrowed for the duration of the call.
 #[pymodule]
 fn leafrs(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
+    #[pyfn(m)]
+    fn set_num_threads(n: usize) -> PyResult<()> {
+        rust_fn::set_num_threads(n).map_err(PyRuntimeError::new_err)
+    }
+
+    #[pyfn(m)]
+    fn get_num_threads() -> usize {
+        rust_fn::get_num_threads()
+    }
+
     #[pyfn(m)]
     fn max_min<'py>(
         py: Python<'py>,
         x: PyReadonlyArrayDyn<f32>
     ) -> &'py PyArray1<f32> {
         let array = x.as_array();
-        let result_array = rust_fn::max_min(&array);
+        let result_array = py.allow_threads(|| rust_fn::install(|| rust_fn::max_min(&array)));
         result_array.into_pyarray(py)
     }
 
@@ -99,7 +649,7 @@ fn leafrs(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
         x: PyReadonlyArray4<f32>
     ) -> &'py PyArray2<f32> {
         let array = x.as_array();
-        let rustsum = rust_fn::rusum(&array);
+        let rustsum = py.allow_threads(|| rust_fn::install(|| rust_fn::rusum(&array)));
         rustsum.into_pyarray(py)
     }
 
@@ -116,9 +666,166 @@ fn leafrs(_py: Python<'_>, m: &PyModule) -> PyResult<()> {
     fn add<'py>(
         py: Python<'py>,
         x: PyReadonlyArrayDyn<f32>,
-        y: PyReadonlyArrayDyn<f32>
+        y: PyReadonlyArrayDyn<f32>,
+        out: Option<&'py PyArrayDyn<f32>>
+    ) -> PyResult<&'py PyArrayDyn<f32>> {
+        binary_pyfn(py, x, y, out, rust_fn::add)
+    }
+
+    #[pyfn(m)]
+    fn sub<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArrayDyn<f32>,
+        y: PyReadonlyArrayDyn<f32>,
+        out: Option<&'py PyArrayDyn<f32>>
+    ) -> PyResult<&'py PyArrayDyn<f32>> {
+        binary_pyfn(py, x, y, out, rust_fn::sub)
+    }
+
+    #[pyfn(m)]
+    fn mul<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArrayDyn<f32>,
+        y: PyReadonlyArrayDyn<f32>,
+        out: Option<&'py PyArrayDyn<f32>>
+    ) -> PyResult<&'py PyArrayDyn<f32>> {
+        binary_pyfn(py, x, y, out, rust_fn::mul)
+    }
+
+    #[pyfn(m)]
+    fn div<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArrayDyn<f32>,
+        y: PyReadonlyArrayDyn<f32>,
+        out: Option<&'py PyArrayDyn<f32>>
+    ) -> PyResult<&'py PyArrayDyn<f32>> {
+        binary_pyfn(py, x, y, out, rust_fn::div)
+    }
+
+    #[pyfn(m)]
+    fn exp<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArrayDyn<f32>,
+        out: Option<&'py PyArrayDyn<f32>>
+    ) -> PyResult<&'py PyArrayDyn<f32>> {
+        unary_pyfn(py, x, out, rust_fn::exp)
+    }
+
+    #[pyfn(m)]
+    fn log<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArrayDyn<f32>,
+        out: Option<&'py PyArrayDyn<f32>>
+    ) -> PyResult<&'py PyArrayDyn<f32>> {
+        unary_pyfn(py, x, out, rust_fn::log)
+    }
+
+    #[pyfn(m)]
+    fn relu<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArrayDyn<f32>,
+        out: Option<&'py PyArrayDyn<f32>>
+    ) -> PyResult<&'py PyArrayDyn<f32>> {
+        unary_pyfn(py, x, out, rust_fn::relu)
+    }
+
+    #[pyfn(m)]
+    fn matmul<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArray2<f32>,
+        y: PyReadonlyArray2<f32>,
+        out: Option<&'py PyArray2<f32>>
+    ) -> PyResult<&'py PyArray2<f32>> {
+        let (x, y) = (x.as_array(), y.as_array());
+        match out {
+            Some(out) if overlaps(&[&x, &y], out) => {
+                Err(PyValueError::new_err("Output array overlaps the operands."))
+            },
+            Some(out) => {
+                check_out(out, None)?;
+                let mut result = unsafe { out.as_array_mut() };
+                py.allow_threads(|| rust_fn::install(|| rust_fn::matmul_into(&x, &y, &mut result)))
+                    .ok_or_else(shape_error)?;
+                Ok(out)
+            },
+            None => {
+                let result = py.allow_threads(|| rust_fn::install(|| rust_fn::matmul(&x, &y)));
+                Ok(result.ok_or_else(shape_error)?.into_pyarray(py))
+            },
+        }
+    }
+
+    #[pyfn(m)]
+    fn conv2d<'py>(
+        py: Python<'py>,
+        x: PyReadonlyArray4<f32>,
+        w: PyReadonlyArray4<f32>,
+        stride: (usize, usize),
+        padding: (usize, usize),
+        dilation: (usize, usize),
+        out: Option<&'py PyArray4<f32>>
+    ) -> PyResult<&'py PyArray4<f32>> {
+        let (x, w) = (x.as_array(), w.as_array());
+        let p = rust_fn::Conv2d { stride, padding, dilation };
+        match out {
+            Some(out) if overlaps(&[&x, &w], out) => {
+                Err(PyValueError::new_err("Output array overlaps the operands."))
+            },
+            Some(out) => {
+                check_out(out, None)?;
+                let mut result = unsafe { out.as_array_mut() };
+                py.allow_threads(|| rust_fn::install(|| rust_fn::conv2d_into(&x, &w, &p, &mut result)))
+                    .ok_or_else(conv_error)?;
+                Ok(out)
+            },
+            None => {
+                let result = py.allow_threads(|| rust_fn::install(|| rust_fn::conv2d(&x, &w, &p)));
+                Ok(result.ok_or_else(conv_error)?.into_pyarray(py))
+            },
+        }
+    }
+
+    #[pyfn(m)]
+    fn conv2d_input_grad<'py>(
+        py: Python<'py>,
+        grad: PyReadonlyArray4<f32>,
+        w: PyReadonlyArray4<f32>,
+        shape: (usize, usize, usize, usize),
+        stride: (usize, usize),
+        padding: (usize, usize),
+        dilation: (usize, usize)
+    ) -> PyResult<&'py PyArray4<f32>> {
+        let (grad, w) = (grad.as_array(), w.as_array());
+        let p = rust_fn::Conv2d { stride, padding, dilation };
+        let result = py.allow_threads(|| rust_fn::install(|| rust_fn::conv2d_input_grad(&grad, &w, shape, &p)));
+        Ok(result.ok_or_else(conv_error)?.into_pyarray(py))
+    }
+
+    #[pyfn(m)]
+    fn conv2d_weight_grad<'py>(
+        py: Python<'py>,
+        grad: PyReadonlyArray4<f32>,
+        x: PyReadonlyArray4<f32>,
+        shape: (usize, usize, usize, usize),
+        stride: (usize, usize),
+        padding: (usize, usize),
+        dilation: (usize, usize)
+    ) -> PyResult<&'py PyArray4<f32>> {
+        let (grad, x) = (grad.as_array(), x.as_array());
+        let p = rust_fn::Conv2d { stride, padding, dilation };
+        let result = py.allow_threads(|| rust_fn::install(|| rust_fn::conv2d_weight_grad(&grad, &x, shape, &p)));
+        Ok(result.ok_or_else(conv_error)?.into_pyarray(py))
+    }
+
+    #[pyfn(m)]
+    fn fused_elementwise<'py>(
+        py: Python<'py>,
+        program: Vec<(u8, usize, usize)>,
+        inputs: Vec<PyReadonlyArrayDyn<f32>>,
+        shape: Vec<usize>
     ) -> &'py PyArrayDyn<f32> {
-        let result = rust_fn::add(&x.as_array(), &y.as_array());
+        let arrays: Vec<_> = inputs.iter().map(|x| x.as_array()).collect();
+        let result = py.allow_threads(|| rust_fn::install(|| rust_fn::fused_elementwise(&program, &arrays, &shape)));
         result.into_pyarray(py)
     }
 
@@ -0,0 +1,105 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+import unittest
+from leaf import Tensor, nn
+from leaf.amp import autocast, LossScaler
+
+class TestAmp(unittest.TestCase):
+    def test_op_dtypes(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(4, 8)))
+        w = Tensor(np.random.uniform(-1.0, 1.0, size=(8, 2)))
+
+        with autocast():
+            h = x.matmul(w)
+            assert h.dtype == np.float16
+            assert h.relu().dtype == np.float16
+            assert h.exp().dtype == np.float32
+            assert h.sum().dtype == np.float32
+
+        assert x.matmul(w).dtype == np.float32
+        assert x.dtype == np.float32 and w.dtype == np.float32
+
+    def test_master_weights(self):
+        layer = nn.Linear(8, 4)
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(16, 8)))
+
+        with autocast():
+            loss = layer.forward(x).relu().mean()
+        loss.backward()
+
+        w, b = layer._weights, layer._bias
+        assert w.dtype == np.float32 and w.grad.dtype == np.float32
+        assert b.grad.dtype == np.float32
+
+        h = x.data @ w.data + b.data
+        expected = x.data.T @ ((h > 0) / h.size)
+        np.testing.assert_allclose(w.grad, expected, rtol=1e-2, atol=1e-4)
+
+    def test_cast_cache(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(2, 2)))
+        w = Tensor(np.random.uniform(-1.0, 1.0, size=(2, 2)), requires_grad=True)
+
+        with autocast():
+            a = x.matmul(w)
+            b = x.matmul(w)
+            assert a._ctx.parents[1] is b._ctx.parents[1]
+            a.add(b).sum().backward()
+
+        np.testing.assert_allclose(w.grad, 2.0 * x.data.sum(axis=0)[:, None].repeat(2, 1),
+                                   rtol=1e-2)
+
+    def test_seed_dtype(self):
+        x = Tensor(np.ones((2, 2)), dtype=np.float16, requires_grad=True)
+        x.mul(Tensor(np.ones((2, 2)), dtype=np.float16)).sum().backward()
+        assert x.grad.dtype == np.float16
+
+    def test_loss_scaler(self):
+        scaler = LossScaler(init_scale=2.0 ** 10, growth_interval=2)
+        x = Tensor(np.full((4, 4), 1e-4), requires_grad=True)
+
+        with autocast():
+            loss = x.mul(Tensor(np.full((4, 4), 1e-4))).sum()
+        scaled = scaler.scale(loss)
+        assert scaled.dtype == np.float32
+        scaled.backward()
+
+        assert scaler.unscale([x])
+        np.testing.assert_allclose(x.grad, 1e-4, rtol=1e-2)
+
+        scaler.update()
+        scaler.update()
+        assert scaler.scale_factor == 2.0 ** 11
+
+        x.grad[0, 0] = np.inf
+        assert not scaler.unscale([x])
+        scaler.update()
+        assert scaler.scale_factor == 2.0 ** 10
+
+if __name__ == '__main__':
+    unittest.main()
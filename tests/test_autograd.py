@@ -0,0 +1,417 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import sys
+import threading
+import tracemalloc
+import numpy as np
+import unittest
+import leaf
+from leaf import Tensor
+from leaf.autograd import Tape, current_tape
+
+def _mlp_peak_memory(retain_graph, depth=24, width=128, batch=1024):
+    """ Return peak traced memory of a training iteration on a deep MLP while
+    the graph of the previous iteration is still referenced by ``loss``. The
+    second iteration allocates at least as much as the first, so the peak over
+    both is that of the second one. """
+    x = Tensor(np.random.uniform(-1.0, 1.0, size=(batch, width)))
+    weights = [Tensor.uniform(width, width, requires_grad=True) for _ in range(depth)]
+
+    tracemalloc.start()
+    for _ in range(2):
+        h = x
+        for w in weights:
+            h = h.matmul(w).relu()
+        loss = h.sum()
+        loss.backward(retain_graph=retain_graph)
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+class TestAutograd(unittest.TestCase):
+    def test_deep_graph(self):
+        depth = 4 * sys.getrecursionlimit()
+        x = Tensor(np.random.uniform(0.5, 1.0, size=(4, 4)), requires_grad=True)
+
+        y = x
+        for _ in range(depth):
+            y = y.relu()
+        y.sum().backward()
+
+        np.testing.assert_allclose(x.grad, np.ones((4, 4)))
+
+    def test_shared_parent(self):
+        data = np.random.uniform(0.5, 1.0, size=(3, 3)).astype(np.float32)
+        x = Tensor(data, requires_grad=True)
+
+        a = x.relu()
+        a.matmul(a).sum().backward()
+
+        ones = np.ones((3, 3))
+        np.testing.assert_allclose(x.grad, ones @ data.T + data.T @ ones, rtol=1e-5)
+
+    def test_interleaved_graphs(self):
+        x1 = Tensor(np.random.uniform(0.5, 1.0, size=(2, 5)), requires_grad=True)
+        x2 = Tensor(np.random.uniform(0.5, 1.0, size=(2, 5)), requires_grad=True)
+
+        y1, y2 = x1, x2
+        for _ in range(10):
+            y1 = y1.exp().log()
+            y2 = y2.relu()
+        y1.sum().backward()
+
+        np.testing.assert_allclose(x1.grad, np.ones((2, 5)), rtol=1e-5)
+        assert x2.grad is None
+
+    def test_tape_compaction(self):
+        tape = Tape(capacity=8)
+        x = Tensor(np.ones((2, 2)), requires_grad=True)
+        keep = x.relu()
+        tape.record(keep._ctx)
+
+        for _ in range(64):
+            tape.record(x.relu()._ctx)
+
+        assert len(tape) < 16
+        assert tape._nodes[keep._ctx._index]() is keep._ctx
+
+    def test_no_grad(self):
+        x = Tensor(np.random.uniform(0.5, 1.0, size=(3, 3)), requires_grad=True)
+        recorded = len(current_tape())
+
+        with leaf.no_grad():
+            y = x.exp().relu()
+            assert not leaf.is_grad_enabled()
+        assert leaf.is_grad_enabled()
+
+        assert y._ctx is None
+        assert not y.requires_grad
+        assert len(current_tape()) == recorded
+        np.testing.assert_allclose(y.data, np.exp(x.data))
+
+        z = x.exp()
+        assert z._ctx is not None
+        assert z.requires_grad
+
+    def test_inference_mode(self):
+        x = Tensor(np.ones((2, 2)), requires_grad=True)
+
+        @leaf.inference_mode()
+        def serve(t):
+            return t.relu()
+
+        assert serve(x)._ctx is None
+        with leaf.inference_mode(mode=False):
+            assert x.relu()._ctx is not None
+        with leaf.no_grad(), leaf.inference_mode(mode=False):
+            assert x.relu()._ctx is None
+
+    def test_no_context_without_grad(self):
+        x = Tensor(np.ones((2, 2)))
+        assert x.exp()._ctx is None
+
+    def test_backward_twice(self):
+        x = Tensor(np.ones((2, 2)), requires_grad=True)
+
+        y = x.exp().sum()
+        y.backward(retain_graph=True)
+        y.backward()
+        np.testing.assert_allclose(x.grad, 2.0 * np.exp(np.ones((2, 2))), rtol=1e-5)
+
+        with self.assertRaises(RuntimeError):
+            y.backward()
+
+    def test_release_graph(self):
+        x = Tensor(np.ones((2, 2)), requires_grad=True)
+
+        y = x.relu()
+        z = y.exp().sum()
+        z.backward()
+
+        assert y._ctx.saved_tensors is None
+        assert len(z._ctx.parents) == 0
+
+    def test_release_peak_memory(self):
+        peak_retained = _mlp_peak_memory(retain_graph=True)
+        peak_released = _mlp_peak_memory(retain_graph=False)
+        sys.stdout.write(
+            f'\npeak memory deep MLP, retained: {peak_retained / 2**20:.2f} MiB ' \
+            f'released: {peak_released / 2**20:.2f} MiB\n'
+        )
+
+        assert peak_released < 0.75 * peak_retained
+
+    def test_threads(self):
+        def run(f, *args):
+            results = []
+            thread = threading.Thread(target=lambda: results.append(f(*args)))
+            thread.start()
+            thread.join()
+            return results[0]
+
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)), requires_grad=True)
+        run(x.exp).relu().sum().backward()
+        np.testing.assert_allclose(x.grad, np.exp(x.data), rtol=1e-6)
+
+        # Both branches of the diamond have to reach h before it is propagated.
+        x.grad = None
+        h = x.exp()
+        y = h.mul(run(h.relu))
+        y.sum().backward()
+        np.testing.assert_allclose(x.grad, 2.0 * np.exp(2.0 * x.data), rtol=1e-5)
+
+    def test_inplace_no_grad(self):
+        w = Tensor(np.ones((2, 3)), requires_grad=True)
+        data = w.data
+
+        with leaf.no_grad():
+            result = w.sub_(Tensor(np.full((2, 3), 0.5)))
+
+        assert result is w
+        assert w.data is data
+        assert w._version == 1
+        np.testing.assert_allclose(w.data, np.full((2, 3), 0.5))
+
+        with self.assertRaises(RuntimeError):
+            w.add_(Tensor(np.ones((2, 3))))
+
+    def test_relu_zero(self):
+        grads = []
+        for inplace in (False, True):
+            x = Tensor(np.array([-1.0, 0.0, 2.0]), requires_grad=True)
+            h = x.add(Tensor(0.0))
+            y = h.relu_() if inplace else h.relu()
+            y.sum().backward()
+            grads.append(x.grad)
+
+        np.testing.assert_array_equal(grads[0], [0.0, 0.0, 1.0])
+        np.testing.assert_array_equal(grads[1], grads[0])
+
+    def test_inplace_backward(self):
+        data = np.random.uniform(-1.0, 1.0, size=(3, 4))
+        scale = np.random.uniform(0.5, 2.0, size=(3, 4)).astype(np.float32)
+        x = Tensor(data, requires_grad=True)
+
+        # Exp saves its result, which is shared with the tensor it returns.
+        h = x.exp().add(Tensor(0.0))
+        h.mul_(Tensor(scale)).clamp_(high=2.0).relu_()
+        h.sum().backward()
+
+        expected = np.exp(x.data) * scale
+        np.testing.assert_allclose(x.grad, expected * (expected <= 2.0), rtol=1e-5)
+
+    def test_inplace_self_aliased(self):
+        x = Tensor(np.array([0.5, 2.0, 3.0]), requires_grad=True)
+        h = x.mul(Tensor(1.0))
+        h.mul_(h).sum().backward()
+
+        np.testing.assert_allclose(h.data, x.data ** 2, rtol=1e-6)
+        np.testing.assert_allclose(x.grad, 2.0 * x.data, rtol=1e-6)
+
+    def test_inplace_routing(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(2, 2)), requires_grad=True)
+
+        h = x.exp().add(Tensor(0.0))
+        s = h.sum()
+        h.exp_()
+        s.backward()
+
+        np.testing.assert_allclose(x.grad, np.exp(x.data), rtol=1e-5)
+
+    def test_inplace_saved_result(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(2, 2)), requires_grad=True)
+
+        h = x.exp()
+        h.exp_()
+
+        with self.assertRaises(RuntimeError):
+            h.sum().backward()
+
+    def test_inplace_version_check(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(2, 2)), requires_grad=True)
+
+        h = x.exp()
+        y = h.relu()
+        h.exp_()
+
+        with self.assertRaises(RuntimeError):
+            y.sum().backward()
+
+    def test_inplace_detached(self):
+        w = Tensor(np.array([0.0, 1.0]), requires_grad=True)
+        x = w.exp()
+        x.detach().mul_(Tensor(2.0))
+        assert x._version == 1
+
+        with self.assertRaises(RuntimeError):
+            x.sum().backward()
+
+    def test_out_no_grad(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)))
+        y = Tensor(np.random.uniform(-1.0, 1.0, size=(1, 4)))
+        z = Tensor(np.empty((3, 4)))
+        buffer = z.data
+
+        for version in (1, 2):
+            assert x.add(y, out=z) is z
+            assert z.data is buffer
+            assert z._version == version
+
+        np.testing.assert_allclose(z.data, x.data + y.data, rtol=1e-6)
+        np.testing.assert_allclose(x.sum(axis=1, out=Tensor(np.empty((3, 1)))).data,
+                                   x.data.sum(axis=1, keepdims=True), rtol=1e-5)
+
+    def test_out_backward(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)), requires_grad=True)
+        w = Tensor(np.random.uniform(-1.0, 1.0, size=(4, 2)), requires_grad=True)
+        z = Tensor(np.empty((3, 2)))
+
+        x.matmul(w, out=z).exp(out=z).sum().backward()
+
+        expected = np.exp(x.data @ w.data)
+        np.testing.assert_allclose(z.data, expected, rtol=1e-5)
+        np.testing.assert_allclose(x.grad, expected @ w.data.T, rtol=1e-5)
+        np.testing.assert_allclose(w.grad, x.data.T @ expected, rtol=1e-5)
+
+    def test_out_aliased_input(self):
+        x = Tensor(np.array([0.5, 2.0, 3.0]), requires_grad=True)
+        for op, grad in ((lambda h: h.mul(h, out=h), 2.0 * x.data),
+                         (lambda h: h.log(out=h), 1.0 / x.data),
+                         (lambda h: h.pow(Tensor(3.0), out=h), 3.0 * x.data ** 2),
+                         (lambda h: h.relu(out=h), np.ones(3))):
+            x.grad = None
+            h = x.mul(Tensor(1.0))
+            buffer = h.data
+            op(h).sum().backward()
+            assert h.data is buffer
+            np.testing.assert_allclose(x.grad, grad, rtol=1e-6)
+
+    def test_out_leaf(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(2, 2)), requires_grad=True)
+
+        with self.assertRaises(RuntimeError):
+            x.exp(out=x)
+
+def _mlp(depth=16, width=32, **kwargs):
+    layers = []
+    for _ in range(depth):
+        layers += [leaf.nn.Linear(width, width), leaf.nn.ReLU()]
+    return leaf.nn.Sequential(*layers, **kwargs)
+
+def _gradients(model, x):
+    for p in model.parameters():
+        p.grad = None
+    x.grad = None
+    model(x).sum().backward()
+    return [x.grad] + [p.grad for p in model.parameters()]
+
+class TestCheckpoint(unittest.TestCase):
+    def test_sequential(self):
+        model = _mlp()
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(8, 32)), requires_grad=True)
+        expected = _gradients(model, x)
+
+        for k in (1, 5, 32, 64):
+            checkpointed = leaf.nn.Sequential(*model._modules, checkpoint_every=k)
+            for grad, reference in zip(_gradients(checkpointed, x), expected):
+                np.testing.assert_array_equal(grad, reference)
+
+        self.assertRaises(ValueError, leaf.nn.Sequential, *model._modules, checkpoint_every=0)
+
+    def test_function(self):
+        segment = leaf.nn.Sequential(leaf.nn.Linear(4, 8), leaf.nn.ReLU())
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)))
+        leaf.checkpoint(segment, x).sum().backward()
+        expected = [p.grad.copy() for p in segment.parameters()]
+
+        for p in segment.parameters():
+            p.grad = None
+        segment(x).sum().backward()
+        for p, grad in zip(segment.parameters(), expected):
+            np.testing.assert_allclose(p.grad, grad, rtol=1e-6)
+
+        y = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)), requires_grad=True)
+        leaf.checkpoint(lambda a, b: a.mul(b).exp(), x, y).sum().backward()
+        np.testing.assert_allclose(y.grad, x.data * np.exp(x.data * y.data), rtol=1e-6)
+
+        with leaf.no_grad():
+            assert leaf.checkpoint(segment, x)._ctx is None
+
+    def test_live_contexts(self):
+        def live(tape):
+            return sum(ref() is not None for ref in tape._nodes)
+
+        model, checkpointed = _mlp(), _mlp(checkpoint_every=8)
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(8, 32)))
+        tape = current_tape()
+        before = live(tape)
+        y = model(x)
+        plain = live(tape) - before
+        z = checkpointed(x)
+        assert live(tape) - before - plain == 3 + 4 * 3
+        assert plain == 16 * 3
+        del y, z
+
+    def test_activation_memory(self):
+        model = _mlp(depth=64, width=256)
+        checkpointed = leaf.nn.Sequential(*model._modules, checkpoint_every=16)
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(256, 256)).astype(np.float32))
+
+        sizes = []
+        for m in (model, checkpointed):
+            tracemalloc.start()
+            y = m(x).sum()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            y.backward()
+            sizes.append(current)
+
+        sys.stdout.write(
+            f'\nactivation memory 128 module MLP, plain: {sizes[0] / 2**20:.2f} MiB ' \
+            f'checkpointed: {sizes[1] / 2**20:.2f} MiB\n'
+        )
+        assert sizes[1] < 0.4 * sizes[0]
+
+    def test_autocast(self):
+        model = _mlp(depth=4)
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(8, 32)).astype(np.float32))
+        with leaf.amp.autocast():
+            expected = model(x).sum()
+        expected.backward()
+        expected = [p.grad.copy() for p in model.parameters()]
+
+        checkpointed = leaf.nn.Sequential(*model._modules, checkpoint_every=2)
+        for p in model.parameters():
+            p.grad = None
+        with leaf.amp.autocast():
+            y = checkpointed(x).sum()
+        y.backward()
+        for p, grad in zip(model.parameters(), expected):
+            assert p.grad.dtype == np.float32
+            np.testing.assert_allclose(p.grad, grad, rtol=1e-3, atol=1e-3)
@@ -0,0 +1,150 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import os
+import json
+import tempfile
+import numpy as np
+import unittest
+import leaf
+from leaf import Tensor, backend
+
+class TestBackend(unittest.TestCase):
+    def setUp(self):
+        backend._load()
+        self._kernels = dict(backend._kernels)
+        self._thresholds = dict(backend._thresholds)
+        self.calls = []
+
+        @backend.register_kernel('add', 'rust', np.float32)
+        def _add(x, y):
+            self.calls.append(x.size)
+            return np.add(x, y)
+
+    def tearDown(self):
+        backend._kernels.clear()
+        backend._kernels.update(self._kernels)
+        backend._thresholds.clear()
+        backend._thresholds.update(self._thresholds)
+        backend._resolved.clear()
+
+    def test_dispatch_by_size(self):
+        backend._thresholds[('add', np.dtype(np.float32))] = 64
+        backend._resolved.clear()
+        small = Tensor(np.ones((4, 4)))
+        large = Tensor(np.ones((16, 16)))
+
+        np.testing.assert_allclose(small.add(small).data, 2.0)
+        assert self.calls == []
+
+        np.testing.assert_allclose(large.add(large).data, 2.0)
+        assert self.calls == [256]
+
+    def test_dispatch_by_dtype(self):
+        backend._thresholds[('add', np.dtype(np.float32))] = 0
+        backend._resolved.clear()
+        x = np.ones(8, dtype=np.float32)
+        backend.dispatch('add', 'cpu', x, x.astype(np.float64))
+        backend.dispatch('add', 'cpu', x.astype(np.float64), x.astype(np.float64))
+        assert self.calls == []
+
+        backend.dispatch('add', 'cpu', x, x)
+        assert self.calls == [8]
+
+    def test_numpy_fallback(self):
+        x = np.ones(8, dtype=np.float32)
+        np.testing.assert_allclose(backend.dispatch('sub', 'cpu', x, x), 0.0)
+        self.assertRaises(NotImplementedError, backend.get_kernel, 'add', 'gpu', np.float32)
+        self.assertRaises(NotImplementedError, backend.get_kernel, 'unknown', 'cpu', np.float32)
+
+    def test_num_threads(self):
+        previous = backend._num_threads
+        try:
+            leaf.set_num_threads(2)
+            if backend.rust() is not None:
+                assert leaf.get_num_threads() == 2
+            self.assertRaises(ValueError, leaf.set_num_threads, -1)
+        finally:
+            backend._num_threads = previous
+
+    def test_calibrate(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'leaf', 'thresholds.json')
+            calibrated = backend.calibrate(sizes=[16, 256], repeats=1, path=path)
+            assert 'add/float32' in calibrated
+
+            with open(path) as f:
+                assert json.load(f) == calibrated
+
+            backend._thresholds.clear()
+            backend.load_thresholds(path)
+            assert backend.threshold('add', np.float32) == calibrated['add/float32']
+
+@unittest.skipIf(backend.rust() is None, 'The leafrs extension has not been built.')
+class TestRust(unittest.TestCase):
+    def setUp(self):
+        self.x = np.random.uniform(0.5, 1.5, size=(4, 8)).astype(np.float32)
+        self.y = np.random.uniform(0.5, 1.5, size=(8, )).astype(np.float32)
+
+    def test_elementwise(self):
+        rust = backend.rust()
+        x, y = self.x, self.y
+        binary = {'add': np.add, 'sub': np.subtract, 'mul': np.multiply, 'div': np.divide}
+        unary = {'exp': np.exp, 'log': np.log, 'relu': lambda a: np.maximum(a, 0.0)}
+        for op, f in binary.items():
+            np.testing.assert_allclose(getattr(rust, op)(x, y), f(x, y), rtol=1e-6)
+            out = np.empty_like(x)
+            assert getattr(rust, op)(x, y, out) is out
+            np.testing.assert_allclose(out, f(x, y), rtol=1e-6)
+
+            # The output overlapping an operand read in another order.
+            out = x.copy()
+            getattr(rust, op)(out[:, ::-1], out, out)
+            np.testing.assert_allclose(out, f(x[:, ::-1], x), rtol=1e-6)
+
+        for op, f in unary.items():
+            np.testing.assert_allclose(getattr(rust, op)(x), f(x), rtol=1e-6)
+            out = x.copy()
+            getattr(rust, op)(out[::-1], out)
+            np.testing.assert_allclose(out, f(x[::-1]), rtol=1e-6)
+
+    def test_invalid_out(self):
+        rust = backend.rust()
+        x, y = self.x, self.y
+        readonly = np.empty_like(x)
+        readonly.flags.writeable = False
+        for out in (readonly, np.empty((8, 4), dtype=np.float32).T,
+                    np.empty((2, 4, 8), dtype=np.float32)):
+            self.assertRaises(ValueError, rust.add, x, y, out)
+            self.assertRaises(ValueError, rust.exp, x, out)
+        self.assertRaises(TypeError, rust.add, x, y, np.empty(x.shape))
+
+        square = np.random.uniform(size=(8, 8)).astype(np.float32)
+        self.assertRaises(ValueError, rust.matmul, square, square, square)
+
+if __name__ == '__main__':
+    unittest.main()
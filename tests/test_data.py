@@ -0,0 +1,125 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import os
+import tempfile
+import numpy as np
+import unittest
+from leaf import Tensor
+from leaf.data import Dataset, ArrayDataset, MemmapDataset, DataLoader, collate
+
+class Squares(Dataset):
+    def __len__(self):
+        return 10
+
+    def __getitem__(self, index):
+        return np.full(3, index, dtype=np.float32), index * index
+
+def _arrays(n=50):
+    x = np.random.uniform(-1.0, 1.0, size=(n, 4)).astype(np.float32)
+    return x, np.arange(n)
+
+class TestData(unittest.TestCase):
+    def test_collate(self):
+        x, y = collate([Squares()[i] for i in range(4)])
+        np.testing.assert_array_equal(x[:, 0], np.arange(4))
+        np.testing.assert_array_equal(y, np.arange(4) ** 2)
+
+        x, y = Squares().batch(slice(2, 5))
+        np.testing.assert_array_equal(y, np.arange(2, 5) ** 2)
+
+    def test_batches(self):
+        x, y = _arrays()
+        loader = DataLoader(ArrayDataset(x, y), batch_size=16)
+        batches = list(loader)
+        assert len(loader) == len(batches) == 4
+        assert [b[1].shape[0] for b in batches] == [16, 16, 16, 2]
+        assert all(isinstance(t, Tensor) for b in batches for t in b)
+        assert batches[0][0].dtype == np.float32 and batches[0][1].dtype == y.dtype
+        np.testing.assert_array_equal(np.concatenate([b[1].data for b in batches]), y)
+
+        # Batches of consecutive rows are views of the arrays.
+        assert np.shares_memory(batches[0][0].data, x)
+
+        loader = DataLoader(ArrayDataset(x, y), batch_size=16, drop_last=True)
+        assert len(loader) == len(list(loader)) == 3
+
+    def test_shuffle(self):
+        x, y = _arrays()
+        loader = DataLoader(ArrayDataset(x, y), batch_size=16, shuffle=True, seed=0)
+        first = np.concatenate([b[1].data for b in loader])
+        second = np.concatenate([b[1].data for b in loader])
+        np.testing.assert_array_equal(np.sort(first), y)
+        np.testing.assert_array_equal(np.sort(second), y)
+        assert (first != second).any() and (first != y).any()
+
+        for bx, by in DataLoader(ArrayDataset(x, y), batch_size=16, shuffle=True):
+            np.testing.assert_array_equal(bx.data, x[by.data])
+
+    def test_workers(self):
+        x, y = _arrays()
+        expected = [b[1].data for b in DataLoader(ArrayDataset(x, y), batch_size=8,
+            shuffle=True, seed=1)]
+        for processes in (False, True):
+            loader = DataLoader(ArrayDataset(x, y), batch_size=8, shuffle=True, seed=1,
+                workers=2, processes=processes, prefetch=3)
+            batches = [b[1].data for b in loader]
+            assert len(batches) == len(expected)
+            for batch, reference in zip(batches, expected):
+                np.testing.assert_array_equal(batch, reference)
+
+        x, y = next(iter(DataLoader(Squares(), batch_size=4, workers=2)))
+        np.testing.assert_array_equal(y.data, np.arange(4) ** 2)
+
+    def test_early_exit(self):
+        x, y = _arrays(1000)
+        loader = DataLoader(ArrayDataset(x, y), batch_size=10, workers=2)
+        for i, _ in enumerate(loader):
+            if i == 2:
+                break
+        assert len(list(loader)) == 100
+
+    def test_memmap(self):
+        x, y = _arrays()
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ('x.npy', 'y.npy')]
+            np.save(paths[0], x)
+            np.save(paths[1], y)
+
+            dataset = MemmapDataset(*paths)
+            assert len(dataset) == len(x)
+            for shuffle in (False, True):
+                for bx, by in DataLoader(dataset, batch_size=16, shuffle=shuffle, workers=2):
+                    assert type(bx.data) is np.ndarray
+                    np.testing.assert_array_equal(bx.data, x[by.data])
+            del dataset
+
+    def test_invalid(self):
+        x, y = _arrays()
+        self.assertRaises(ValueError, ArrayDataset, x, y[:10])
+        self.assertRaises(ValueError, DataLoader, ArrayDataset(x), batch_size=0)
+        self.assertRaises(NotImplementedError, len, Dataset())
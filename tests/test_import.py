@@ -0,0 +1,84 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import os
+import sys
+import unittest
+import subprocess
+from leaf.functions import _generate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Budgets in microseconds, generous enough to not trip on slow machines while
+# still catching e.g. an eager import of a submodule or of NumPy.
+IMPORT_BUDGET = 50_000
+MODULES_BUDGET = 100_000
+
+def _importtime(code) -> dict:
+    """ Run ``code`` in a fresh interpreter and return the self and cumulative
+    import time, in microseconds, of every module it imported. """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+class TestImport(unittest.TestCase):
+    def test_lazy_import(self):
+        code = 'import sys, leaf; print(sorted(m for m in sys.modules if m.startswith(("leaf", "numpy"))))'
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+            capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "['leaf', 'leaf.lazy']"
+
+    def test_import_time(self):
+        times = _importtime('import leaf')
+        assert times['leaf'][1] < IMPORT_BUDGET, times['leaf']
+
+    def test_modules_import_time(self):
+        times = _importtime('import leaf; leaf.Tensor; leaf.nn; leaf.fuse')
+        total = sum(t[0] for name, t in times.items() if name.split('.')[0] == 'leaf')
+        assert total < MODULES_BUDGET, total
+
+    def test_registry_in_sync(self):
+        with open(_generate.REGISTRY_PATH) as f:
+            assert f.read() == _generate.render(), \
+                'The op registry is out of date, run ``python -m leaf.functions._generate``.'
+
+    def test_methods(self):
+        import leaf
+        for classes in _generate.collect_ops().values():
+            for cls in classes:
+                method = getattr(leaf.Tensor, cls.__name__.lower())
+                assert method.__module__ == 'leaf.functions._registry'
+                assert cls.__name__ in method.__code__.co_names
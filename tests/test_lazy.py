@@ -0,0 +1,116 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+import unittest
+import leaf
+from leaf import Tensor
+
+class TestLazy(unittest.TestCase):
+    def test_deferred(self):
+        x = Tensor(np.random.uniform(0.5, 1.0, size=(3, 4)))
+
+        with leaf.lazy() as graph:
+            y = x.exp().relu()
+            assert y._data is None
+            assert graph.executed == 0
+
+        np.testing.assert_allclose(y.data, np.exp(x.data), rtol=1e-6)
+        assert graph.executed == 2
+
+    def test_common_subexpression(self):
+        x = Tensor(np.random.uniform(0.5, 1.0, size=(3, 4)), requires_grad=True)
+
+        with leaf.lazy() as graph:
+            a = x.exp()
+            b = x.exp()
+            y = a.mul(b).sum()
+
+        assert a is b
+        assert graph.merged == 1
+
+        y.backward()
+        np.testing.assert_allclose(x.grad, 2.0 * np.exp(2.0 * x.data), rtol=1e-5)
+
+    def test_dead_nodes(self):
+        x = Tensor(np.random.uniform(0.5, 1.0, size=(3, 4)))
+
+        with leaf.lazy() as graph:
+            unused = x.log().exp()
+            y = x.exp().sum()
+
+        y.data
+        assert graph.recorded == 4
+        assert graph.executed == 2
+        assert unused._data is None
+
+    def test_constant_folding(self):
+        k = Tensor(np.random.uniform(0.5, 1.0, size=(3, 4)))
+        w = Tensor(np.random.uniform(0.5, 1.0, size=(3, 4)), requires_grad=True)
+        graph = leaf.LazyGraph()
+
+        for _ in range(3):
+            with leaf.lazy(graph):
+                constant = k.exp().mul(k)
+                loss = w.mul(constant).sum()
+            loss.backward()
+
+        # The constant subexpression is computed once, the rest every iteration.
+        assert graph.executed == 2 + 3 * 2
+        assert graph.folded == 2 * 2
+        np.testing.assert_allclose(w.grad, 3.0 * np.exp(k.data) * k.data, rtol=1e-5)
+
+        with leaf.no_grad():
+            k.mul_(Tensor(2.0))
+        with leaf.lazy(graph):
+            constant = k.exp()
+        np.testing.assert_allclose(constant.data, np.exp(k.data), rtol=1e-6)
+
+    def test_inplace(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)), requires_grad=True)
+
+        with leaf.lazy():
+            y = x.exp().relu_().sum()
+        y.backward()
+
+        np.testing.assert_allclose(x.grad, np.exp(x.data), rtol=1e-5)
+
+    def test_inplace_after_record(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)))
+        with leaf.lazy():
+            y = x.exp()
+            z = x.relu()
+        assert z.data is not None
+
+        with leaf.no_grad():
+            x.add_(Tensor(10.0))
+        with self.assertRaises(RuntimeError):
+            y.data
+
+        with leaf.lazy():
+            y = x.exp()
+        np.testing.assert_allclose(y.data, np.exp(x.data), rtol=1e-6)
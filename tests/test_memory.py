@@ -0,0 +1,128 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+import unittest
+from leaf import Tensor, memory
+from leaf.memory import BufferPool
+from leaf.functions._broadcast import unbroadcast
+
+class TestMemory(unittest.TestCase):
+    def test_recycle(self):
+        pool = BufferPool()
+        x = pool.empty((3, 4))
+        assert pool.release(x)
+
+        y = pool.empty((3, 4))
+        assert y is x
+        assert pool.stats()['hits'] == 1 and pool.stats()['misses'] == 1
+
+        assert pool.empty((3, 4), np.float64) is not x
+        assert pool.zeros((3, 4)).sum() == 0.0
+
+    def test_release_guards(self):
+        pool = BufferPool()
+        x = pool.empty((4, 4))
+
+        view = x.T
+        assert not pool.release(x)
+        assert not pool.release(view)
+        del view
+
+        alias = x
+        assert not pool.release(x)
+        del alias
+
+        assert not pool.release(np.empty((5, 5)))
+        assert pool.release(x)
+
+    def test_lru_eviction(self):
+        pool = BufferPool(max_bytes=2 * 4 * 16)
+        a, b, c = pool.empty((16,)), pool.empty((4, 4)), pool.empty((2, 8))
+        pool.release(a)
+        pool.release(b)
+        pool.release(c)
+
+        assert pool.evictions == 1
+        assert pool.nbytes == 2 * 4 * 16
+        assert pool.empty((16,)) is not a
+        assert pool.empty((4, 4)) is b
+
+    def test_training_reuses_buffers(self):
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(32, 8)))
+        weights = [Tensor.uniform(8, 8, requires_grad=True) for _ in range(4)]
+
+        misses = []
+        for _ in range(3):
+            before = memory.stats()['misses']
+            h = x
+            for w in weights:
+                w.grad = None
+                h = h.matmul(w).relu()
+            h.sum().backward()
+            misses.append(memory.stats()['misses'] - before)
+
+        assert misses[2] < misses[0]
+        assert misses[2] <= len(weights) + 1
+
+    def test_unbroadcast_reuses_buffers(self):
+        grad = np.ones((32, 8), dtype=np.float32)
+        reduced = unbroadcast(grad, (8, ))
+        np.testing.assert_allclose(reduced, 32.0)
+        assert memory.release(reduced)
+        assert unbroadcast(grad, (8, )) is reduced
+
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(32, 8)))
+        b = Tensor(np.zeros(8), requires_grad=True)
+        x.add(b).sum().backward()
+        for _ in range(3):
+            before = memory.stats()
+            x.add(b).sum().backward()
+            after = memory.stats()
+            assert after['misses'] == before['misses']
+            assert after['hits'] > before['hits']
+        np.testing.assert_allclose(b.grad, 4 * 32.0)
+
+    def test_flatten(self):
+        arrays = [np.random.uniform(size=s).astype(np.float32) for s in ((2, 3), (4, ), ())]
+        flat, views = memory.flatten(arrays)
+        assert flat.shape == (11, ) and flat.dtype == np.float32
+        for array, view in zip(arrays, views):
+            np.testing.assert_array_equal(view, array)
+        np.testing.assert_array_equal(flat, np.concatenate([a.reshape(-1) for a in arrays]))
+
+        assert memory.flat_base(views) is flat
+        assert memory.flat_base(views[:2]) is None
+        assert memory.flat_base(views[:1]).base is flat
+        assert memory.flat_base(views[:1]).shape == (6, )
+        assert memory.flat_base(arrays[:1]).base is arrays[0]
+        assert memory.flat_base([arrays[0][:, ::2]]) is None
+        assert memory.flat_base(views[::-1]) is None
+        assert memory.flat_base(arrays) is None
+
+if __name__ == '__main__':
+    unittest.main()
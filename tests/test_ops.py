@@ -22,7 +22,7 @@
 # SOFTWARE.
 #
 # File created: 2022-11-05
-# Last updated: 2023-01-13
+# Last updated: 2026-10-18
 #
 
 import unittest
@@ -36,6 +36,8 @@ import time
 import leaf
 from datetime import datetime
 from leaf import Tensor
+from leaf.functions._broadcast import reduction_plan, unbroadcast
+from leaf.functions import _einsum
 from functools import partial
 
 np.random.seed(1)
@@ -75,8 +77,8 @@ def _test_op(shapes, torch_func, leaf_func, name, timeits=10):
 
     for tt, lt in zip(torch_t, leaf_t):
         np.testing.assert_allclose(
-            tt.detach().numpy(),
-            lt.data,
+            tt.grad.numpy(),
+            lt.grad,
             atol=1e-6,
             rtol=1e-3,
         )
@@ -116,3 +118,215 @@ class TestOps(unittest.TestCase):
 
     def test_sub1(self):
         _test_op([(100, 100), (100, 100)], lambda x, y: x - y, Tensor.sub, 'sub')
+
+    def test_mul1(self):
+        _test_op([(100, 100), (100, 100)], lambda x, y: x * y, Tensor.mul, 'mul')
+
+    def test_div1(self):
+        _test_op([(100, 100), (100, 100)], lambda x, y: x / y, Tensor.div, 'div')
+
+    def test_pow1(self):
+        _test_op([(100, 100), (100, 100)], lambda x, y: x ** y, Tensor.pow, 'pow')
+
+    def test_broadcast_add(self):
+        _test_op([(64, 100), (100, )], lambda x, y: x + y, Tensor.add, 'add broadcast')
+
+    def test_broadcast_sub(self):
+        _test_op([(8, 64, 100), (64, 1)], lambda x, y: x - y, Tensor.sub, 'sub broadcast')
+
+    def test_broadcast_mul(self):
+        _test_op([(8, 1, 100), (64, 1)], lambda x, y: x * y, Tensor.mul, 'mul broadcast')
+
+    def test_fused1(self):
+        _test_op([(256, 300), (256, 300)], lambda x, y: torch.relu(torch.exp(x - y)),
+            leaf.fuse(lambda x, y: x.sub(y).exp().relu()), 'fused sub/exp/relu')
+
+    def test_fused2(self):
+        _test_op([(256, 300), (256, 300), (1, )], lambda x, y, z: (x * y + z) / (y + 1.0),
+            leaf.fuse(lambda x, y, z: x.mul(y).add(z).div(y.add(Tensor(1.0)))), 'fused mul/add/div')
+
+    def test_operators(self):
+        _test_op([(64, 100), (64, 100)], lambda x, y: (2.0 - x) * y / (y + 1.0) - x ** 2.0,
+            lambda x, y: (2.0 - x) * y / (y + 1.0) - x ** 2.0, 'operators')
+
+    def test_matmul_operator(self):
+        _test_op([(64, 100), (100, 32)], lambda x, y: -(x @ y), lambda x, y: -(x @ y), 'matmul operator')
+
+    def test_batched_matmul(self):
+        _test_op([(8, 64, 100), (100, 32)], torch.matmul, lambda x, y: x.matmul(y), 'batched matmul')
+        _test_op([(8, 1, 64, 100), (4, 100, 32)], torch.matmul, lambda x, y: x.matmul(y), 'broadcast matmul')
+        _test_op([(100, ), (8, 100, 32)], torch.matmul, lambda x, y: x.matmul(y), 'vector matmul')
+
+    def test_matmul_saved(self):
+        x = Tensor(np.random.random(size=(8, 4, 5)), requires_grad=True)
+        y = Tensor(np.random.random(size=(5, 3)))
+
+        _, _, xsaved, ysaved = (x @ y)._ctx.saved_tensors
+        assert xsaved is None and ysaved is y.data
+
+    def test_einsum(self):
+        _test_op([(4, 2, 16, 8), (4, 2, 24, 8)], lambda q, k: torch.einsum('bhqd,bhkd->bhqk', q, k),
+            lambda q, k: leaf.einsum('bhqd,bhkd->bhqk', q, k), 'einsum attention')
+        _test_op([(8, 16, 32), (32, 24), (24, )], lambda x, w, b: torch.einsum('...i,ij,j', x, w, b),
+            lambda x, w, b: leaf.einsum('...i,ij,j', x, w, b), 'einsum projection')
+        _test_op([(16, 32), (1, 32)], lambda x, y: torch.einsum('ij,ij->i', x, y),
+            lambda x, y: leaf.einsum('ij,ij->i', x, y), 'einsum broadcast')
+        _test_op([(6, 6)], lambda x: torch.einsum('ii->i', x),
+            lambda x: leaf.einsum('ii->i', x), 'einsum diagonal')
+        _test_op([(6, 6)], lambda x: torch.einsum('ii', x),
+            lambda x: leaf.einsum('ii', x), 'einsum trace')
+        _test_op([(5, 6), (6, 6, 4)], lambda x, y: torch.einsum('ij,jjk->ik', x, y),
+            lambda x, y: leaf.einsum('ij,jjk->ik', x, y), 'einsum repeated subscripts')
+
+    def test_conv2d(self):
+        _test_op([(8, 3, 16, 16), (8, 3, 3, 3), (8, )], lambda x, w, b: F.conv2d(x, w, b, padding=1),
+            lambda x, w, b: x.conv2d(w, b, padding=1), 'conv2d')
+        _test_op([(4, 4, 15, 13), (6, 4, 3, 2)],
+            lambda x, w: F.conv2d(x, w, stride=2, padding=(1, 0), dilation=(2, 1)),
+            lambda x, w: x.conv2d(w, stride=2, padding=(1, 0), dilation=(2, 1)), 'strided dilated conv2d')
+
+    def test_conv2d_module(self):
+        layer = leaf.nn.Conv2d(3, 8, 3, stride=2, padding=1)
+        x = Tensor(np.random.random(size=(2, 3, 16, 16)))
+
+        assert layer.forward(x).shape == (2, 8, 8, 8)
+        with self.assertRaises(ValueError):
+            layer.forward(Tensor(np.random.random(size=(2, 4, 16, 16))))
+
+    def test_pooling(self):
+        _test_op([(8, 3, 16, 16)], lambda x: F.max_pool2d(x, 2), lambda x: x.maxpool2d(kernel_size=2), 'maxpool2d')
+        _test_op([(8, 3, 15, 13)], lambda x: F.max_pool2d(x, 3, stride=2, padding=1),
+            lambda x: x.maxpool2d(kernel_size=3, stride=2, padding=1), 'overlapping maxpool2d')
+        _test_op([(8, 3, 16, 16)], lambda x: F.avg_pool2d(x, 2), lambda x: x.avgpool2d(kernel_size=2), 'avgpool2d')
+        _test_op([(8, 3, 15, 13)], lambda x: F.avg_pool2d(x, (3, 2), stride=1, padding=1),
+            lambda x: x.avgpool2d(kernel_size=(3, 2), stride=1, padding=1), 'overlapping avgpool2d')
+
+    def test_maxpool_saved(self):
+        x = Tensor(np.random.random(size=(2, 3, 16, 16)), requires_grad=True)
+        y = leaf.nn.MaxPool2d(4).forward(x)
+
+        indices = y._ctx.saved_tensors[-1]
+        assert y.shape == indices.shape == (2, 3, 4, 4)
+        assert indices.dtype == np.uint8
+        assert not any(isinstance(t, np.ndarray) and t.size == x.data.size for t in y._ctx.saved_tensors)
+
+    def test_operator_operands(self):
+        x = Tensor(np.random.random(size=(4, 5)), dtype=np.float16)
+        assert (x * 2).dtype == np.float16
+        assert (2 * x).dtype == np.float16
+        np.testing.assert_allclose((x + np.ones(5, dtype=np.float16)).data, x.data + 1)
+        with self.assertRaises(TypeError):
+            x + 'a'
+
+        # Numbers are promoted with the tensor instead of cast to its datatype.
+        t = Tensor(np.array([1, 2, 3]), dtype=np.int32)
+        np.testing.assert_allclose((t * 0.5).data, [0.5, 1.0, 1.5])
+        np.testing.assert_allclose((t / 2).data, [0.5, 1.0, 1.5])
+        assert (t + 1).dtype == np.int32
+
+class TestCriterion(unittest.TestCase):
+    def _compare(self, criterion, torch_func, x, *targets):
+        leaf_x, torch_x = Tensor(x, requires_grad=True), torch.tensor(x, requires_grad=True)
+        loss = criterion(leaf_x, *(Tensor(t, dtype=t.dtype) for t in targets))
+        torch_loss = torch_func(torch_x, *(torch.tensor(t) for t in targets))
+
+        loss.backward()
+        torch_loss.backward()
+        np.testing.assert_allclose(loss.data, torch_loss.item(), rtol=1e-5)
+        np.testing.assert_allclose(leaf_x.grad, torch_x.grad.numpy(), rtol=1e-5, atol=1e-7)
+
+    def test_cross_entropy(self):
+        x = np.random.normal(0.0, 50.0, size=(32, 100)).astype(np.float32)
+        targets = np.random.randint(0, 100, size=32)
+        self._compare(leaf.criterion.CrossEntropyLoss(), F.cross_entropy, x, targets)
+
+        # Besides the logits, only O(batch) arrays are kept for backward.
+        logits = Tensor(x, requires_grad=True)
+        loss = logits.crossentropy(Tensor(targets, dtype=targets.dtype))
+        saved = [t for t in loss._ctx.saved_tensors if isinstance(t, np.ndarray)]
+        assert saved[0] is logits.data
+        assert all(t.size == 32 for t in saved[1:])
+
+    def test_nll(self):
+        x = np.log(np.random.uniform(0.01, 1.0, size=(32, 100))).astype(np.float32)
+        self._compare(leaf.criterion.NLLLoss(), F.nll_loss, x, np.random.randint(0, 100, size=32))
+
+    def test_mse(self):
+        x = np.random.random(size=(32, 10)).astype(np.float32)
+        self._compare(leaf.criterion.MSELoss(), F.mse_loss, x, np.random.random(size=(32, 10)).astype(np.float32))
+
+    def test_stable(self):
+        x = Tensor(np.array([[1000.0, 0.0], [0.0, -1000.0]]), requires_grad=True)
+        loss = x.crossentropy(Tensor([1, 1]))
+        loss.backward()
+
+        np.testing.assert_allclose(loss.data, 1000.0)
+        np.testing.assert_allclose(x.grad, [[0.5, -0.5], [0.5, -0.5]])
+
+class TestFusion(unittest.TestCase):
+    def test_program(self):
+        def func(x, y):
+            x.log()
+            return x.sub(y).exp().mul(Tensor(2.0))
+
+        fused = leaf.fuse(func)
+        x = Tensor(np.random.random(size=(4, 5)), requires_grad=True)
+        y = Tensor(np.random.random(size=(4, 5)))
+
+        result = fused(x, y)
+        assert result._ctx.saved_tensors[0] == (('Sub', 0, 1), ('Exp', 3, 3), ('Mul', 4, 2))
+        np.testing.assert_allclose(result.data, func(x, y).data, rtol=1e-6)
+
+    def test_operators(self):
+        fused = leaf.fuse(lambda x, y: -(1.0 - x) * y)
+        x = Tensor(np.random.random(size=(4, 5)), requires_grad=True)
+        y = Tensor(np.random.random(size=(4, 5)))
+
+        result = fused(x, y)
+        assert result._ctx.saved_tensors[0] == (('Sub', 2, 0), ('Mul', 4, 3), ('Mul', 5, 1))
+        np.testing.assert_allclose(result.data, -(1.0 - x.data) * y.data, rtol=1e-6)
+
+    def test_fallback(self):
+        fused = leaf.fuse(lambda x, y: x.matmul(y).relu())
+        x = Tensor(np.random.random(size=(4, 5)), requires_grad=True)
+
+        assert type(fused(x, Tensor(x.data.T))._ctx).__name__ == 'ReLU'
+
+class TestEinsum(unittest.TestCase):
+    def test_normalize(self):
+        assert _einsum.normalize('ij,jk', ((2, 3), (3, 4))) == (('ij', 'jk'), 'ik')
+        assert _einsum.normalize('...ij,jk->...ik', ((5, 2, 3), (3, 4))) == (('aij', 'jk'), 'aik')
+        assert _einsum.normalize('...i,...i', ((2, 3, 4), (3, 4))) == (('abi', 'bi'), 'ab')
+        with self.assertRaises(ValueError):
+            _einsum.normalize('ij,jk', ((2, 3), ))
+
+    def test_gradient_subscripts(self):
+        assert _einsum.gradient_subscripts(('ij', 'jk'), 'ik', 0) == ('ik,jk->ij', 'ij')
+        assert _einsum.gradient_subscripts(('ij', ), 'i', 0) == ('i->i', 'i')
+        assert _einsum.gradient_subscripts(('ii', ), '', 0) == ('->', '')
+        assert _einsum.gradient_subscripts(('ij', 'jj'), 'i', 1) == ('i,ij->j', 'j')
+
+    def test_expand(self):
+        grad = np.ones((3, ))
+        assert _einsum.expand(grad, 'ij', 'i', (3, 4)).shape == (3, 4)
+        assert _einsum.expand(np.ones((3, 4)), 'ij', 'ij', (1, 4)).shape == (1, 4)
+
+class TestBroadcast(unittest.TestCase):
+    def test_reduction_plan(self):
+        assert reduction_plan((64, 100), (100, )) == (0, )
+        assert reduction_plan((8, 64, 100), (64, 1)) == (0, 2)
+        assert reduction_plan((8, 1, 100), (8, 1, 1)) == (2, )
+
+        hits = reduction_plan.cache_info().hits
+        reduction_plan((64, 100), (100, ))
+        assert reduction_plan.cache_info().hits == hits + 1
+
+    def test_unbroadcast(self):
+        grad = np.random.random(size=(8, 64, 100))
+
+        assert unbroadcast(grad, (8, 64, 100)) is grad
+        np.testing.assert_allclose(unbroadcast(grad, (100, )), grad.sum(axis=(0, 1)))
+        np.testing.assert_allclose(
+            unbroadcast(grad, (64, 1)),
+            grad.sum(axis=(0, 2))[:, None],
+        )
@@ -0,0 +1,215 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import numpy as np
+import torch
+import unittest
+from leaf import Tensor, nn, optim
+from leaf.amp import autocast, LossScaler
+
+SHAPES = ((8, 4), (4, ), (4, 3), (3, ))
+
+def _parameters():
+    arrays = [np.random.uniform(-1.0, 1.0, size=s).astype(np.float32) for s in SHAPES]
+    leaf_params = [Tensor(a, requires_grad=True) for a in arrays]
+    torch_params = [torch.tensor(a, requires_grad=True) for a in arrays]
+    return leaf_params, torch_params
+
+def _test_optimizer(leaf_cls, torch_cls, steps=5, multi_tensor=True, **kwargs):
+    leaf_params, torch_params = _parameters()
+    leaf_optim = leaf_cls(leaf_params, multi_tensor=multi_tensor, **kwargs)
+    torch_optim = torch_cls(torch_params, **kwargs)
+
+    for _ in range(steps):
+        grads = [np.random.uniform(-1.0, 1.0, size=s).astype(np.float32) for s in SHAPES]
+        for p, g in zip(leaf_params, grads):
+            p.grad = g.copy()
+        for p, g in zip(torch_params, grads):
+            p.grad = torch.tensor(g)
+
+        leaf_optim.step()
+        torch_optim.step()
+
+    for leaf_p, torch_p in zip(leaf_params, torch_params):
+        np.testing.assert_allclose(leaf_p.data, torch_p.detach().numpy(), rtol=1e-5, atol=1e-6)
+
+class TestOptim(unittest.TestCase):
+    def test_sgd(self):
+        for multi_tensor in (True, False):
+            _test_optimizer(optim.SGD, torch.optim.SGD, multi_tensor=multi_tensor, lr=0.1)
+            _test_optimizer(optim.SGD, torch.optim.SGD, multi_tensor=multi_tensor,
+                lr=0.1, weight_decay=0.01)
+
+    def test_momentum(self):
+        for multi_tensor in (True, False):
+            _test_optimizer(optim.SGD, torch.optim.SGD, multi_tensor=multi_tensor,
+                lr=0.1, momentum=0.9)
+            _test_optimizer(optim.SGD, torch.optim.SGD, multi_tensor=multi_tensor,
+                lr=0.1, momentum=0.9, nesterov=True, weight_decay=0.01)
+
+    def test_adam(self):
+        for multi_tensor in (True, False):
+            _test_optimizer(optim.Adam, torch.optim.Adam, multi_tensor=multi_tensor, lr=0.01)
+            _test_optimizer(optim.Adam, torch.optim.Adam, multi_tensor=multi_tensor,
+                lr=0.01, betas=(0.8, 0.99), weight_decay=0.01)
+
+    def test_flat_storage(self):
+        params, _ = _parameters()
+        values = [p.data.copy() for p in params]
+        optimizer = optim.Adam(params)
+
+        for p, value in zip(params, values):
+            np.testing.assert_array_equal(p.data, value)
+            assert np.shares_memory(p.data, optimizer._flat)
+        for flat, arrays in optimizer._states():
+            assert all(np.shares_memory(a, flat) for a in arrays)
+
+        optimizer = optim.Adam(params, multi_tensor=False)
+        assert optimizer._flat is None
+
+    def test_missing_grad(self):
+        params, _ = _parameters()
+        optimizer = optim.SGD(params, lr=0.1)
+        values = [p.data.copy() for p in params]
+        params[0].grad = np.ones(SHAPES[0], dtype=np.float32)
+        optimizer.step()
+
+        np.testing.assert_allclose(params[0].data, values[0] - 0.1)
+        for p, value in zip(params[1:], values[1:]):
+            np.testing.assert_array_equal(p.data, value)
+
+    def test_training(self):
+        model = nn.Sequential(nn.Linear(4, 16), nn.ReLU(), nn.Linear(16, 1))
+        optimizer = optim.Adam(model.parameters(), lr=0.01)
+        x = np.random.uniform(-1.0, 1.0, size=(64, 4)).astype(np.float32)
+        y = x.sum(axis=1, keepdims=True)
+
+        losses = []
+        for _ in range(100):
+            optimizer.zero_grad()
+            loss = model(Tensor(x)).sub(Tensor(y)).pow(Tensor(2.0)).mean()
+            loss.backward()
+            optimizer.step()
+            losses.append(loss.data.item())
+
+        assert losses[-1] < 0.1 * losses[0]
+        assert all(p.grad is not None for p in model.parameters())
+        optimizer.zero_grad()
+        assert all(p.grad is None for p in model.parameters())
+
+    def test_loss_scaler(self):
+        layer = nn.Linear(8, 4)
+        optimizer = optim.SGD(layer.parameters(), lr=0.1)
+        scaler = LossScaler()
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(16, 8)))
+        w = layer._weights.data.copy()
+
+        with autocast():
+            loss = layer(x).relu().mean()
+        scaler.scale(loss).backward()
+
+        grad = layer._weights.grad / scaler.scale_factor
+        assert scaler.unscale(optimizer.parameters)
+        optimizer.step()
+        np.testing.assert_allclose(layer._weights.data, w - 0.1 * grad, rtol=1e-4, atol=1e-6)
+
+    def test_invalid(self):
+        params, _ = _parameters()
+        self.assertRaises(ValueError, optim.SGD, [])
+        self.assertRaises(ValueError, optim.SGD, params, lr=-1.0)
+        self.assertRaises(ValueError, optim.SGD, params, nesterov=True)
+        self.assertRaises(ValueError, optim.Adam, params, betas=(1.0, 0.999))
+        self.assertRaises(ValueError, optim.SGD, [Tensor(np.ones(3))])
+
+class TestModule(unittest.TestCase):
+    def test_parameters(self):
+        model = nn.Sequential(nn.Conv2d(3, 4, 3), nn.MaxPool2d(2), nn.ReLU(), nn.Linear(4, 2, bias=False))
+        conv, _, _, linear = model._modules
+        assert model.parameters() == [conv._weights, conv._bias, linear._weights]
+        assert nn.Sequential(model, nn.Linear(2, 2)).parameters()[:3] == model.parameters()
+
+    def test_call(self):
+        layer = nn.Linear(4, 2)
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 4)))
+        np.testing.assert_array_equal(layer(x).data, layer.forward(x).data)
+        np.testing.assert_array_equal(nn.ReLU()(x).data, np.maximum(x.data, 0.0))
+
+    def test_flat_parameters(self):
+        model = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2))
+        values = [p.data.copy() for p in model.parameters()]
+        flat = nn.Sequential(*model._modules, flat=True)
+        params = flat.parameters()
+
+        for p, value in zip(params, values):
+            np.testing.assert_array_equal(p.data, value)
+            np.testing.assert_array_equal(p.grad, np.zeros_like(value))
+        assert flat._flat_parameters.size == sum(v.size for v in values)
+
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(5, 4)))
+        flat(x).sum().backward()
+        flat(x).sum().backward()
+        np.testing.assert_array_equal(flat._flat_grads,
+            np.concatenate([p.grad.reshape(-1) for p in params]))
+        assert flat._flat_grad_buffer() is flat._flat_grads
+
+        flat.zero_grad()
+        assert not flat._flat_grads.any()
+        assert all(p.grad.base is flat._flat_grads for p in params)
+
+    def test_flat_optimizer(self):
+        model = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2), flat=True)
+        optimizer = optim.SGD(model.parameters(), lr=0.1, momentum=0.9)
+        assert optimizer._flat is model._flat_parameters
+        assert optimizer._flat_grad is model._flat_grads
+
+        reference = [p.data.copy() for p in model.parameters()]
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(5, 4)))
+        model(x).sum().backward()
+        grads = [p.grad.copy() for p in model.parameters()]
+        optimizer.step()
+        for p, value, grad in zip(model.parameters(), reference, grads):
+            np.testing.assert_allclose(p.data, value - 0.1 * grad, rtol=1e-6)
+
+        optimizer.zero_grad()
+        assert not model._flat_grads.any()
+        assert model._flat_grad_buffer() is model._flat_grads
+
+    def test_clip_grad_norm(self):
+        for flat in (False, True):
+            model = nn.Sequential(nn.Linear(4, 8), nn.Linear(8, 2), flat=flat)
+            x = Tensor(np.random.uniform(-1.0, 1.0, size=(5, 4)))
+            model(x).sum().backward()
+
+            grads = [p.grad.copy() for p in model.parameters()]
+            total = np.sqrt(sum((g.astype(np.float64) ** 2).sum() for g in grads))
+            norm = model.clip_grad_norm(0.5)
+            np.testing.assert_allclose(norm, total, rtol=1e-5)
+
+            clipped = np.sqrt(sum((p.grad.astype(np.float64) ** 2).sum() for p in model.parameters()))
+            np.testing.assert_allclose(clipped, 0.5, rtol=1e-4)
+            for p, grad in zip(model.parameters(), grads):
+                np.testing.assert_allclose(p.grad, grad * 0.5 / total, rtol=1e-4)
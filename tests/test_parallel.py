@@ -0,0 +1,129 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import copy
+import functools
+import os
+import time
+import numpy as np
+import unittest
+from multiprocessing import shared_memory
+from leaf import Tensor, nn, optim
+from leaf.criterion import CrossEntropyLoss
+from leaf.parallel import DataParallel
+
+def _model():
+    return nn.Sequential(nn.Linear(8, 16), nn.ReLU(), nn.Linear(16, 4))
+
+def _crash(out, y):
+    if y.shape == (1, ):
+        os._exit(3)
+    return CrossEntropyLoss()(out, y)
+
+def _batch(n):
+    x = np.random.uniform(-1.0, 1.0, size=(n, 8)).astype(np.float32)
+    return x, np.random.randint(0, 4, size=n)
+
+class TestDataParallel(unittest.TestCase):
+    def _test_matches_single_process(self, workers, n):
+        model = _model()
+        reference = copy.deepcopy(model)
+        criterion = CrossEntropyLoss()
+        optimizer = optim.SGD(reference.parameters(), lr=0.1, momentum=0.9)
+
+        with DataParallel(model, criterion, functools.partial(optim.SGD, lr=0.1,
+                momentum=0.9), workers=workers) as parallel:
+            for _ in range(3):
+                x, y = _batch(n)
+                loss = parallel.step(x, y)
+
+                optimizer.zero_grad()
+                expected = criterion(reference(Tensor(x)), y)
+                expected.backward()
+                gradient = np.concatenate([p.grad.reshape(-1) for p in reference.parameters()])
+                optimizer.step()
+
+                np.testing.assert_allclose(loss, expected.data.item(), rtol=1e-5)
+                np.testing.assert_allclose(parallel.gradient, gradient, rtol=1e-4, atol=1e-6)
+                for p, q in zip(model.parameters(), reference.parameters()):
+                    np.testing.assert_allclose(p.data, q.data, rtol=1e-4, atol=1e-6)
+
+        for p, q in zip(model.parameters(), reference.parameters()):
+            np.testing.assert_allclose(p.data, q.data, rtol=1e-4, atol=1e-6)
+
+    def test_matches_single_process(self):
+        self._test_matches_single_process(workers=1, n=16)
+        self._test_matches_single_process(workers=3, n=17)
+
+    def test_small_batch(self):
+        self._test_matches_single_process(workers=3, n=2)
+
+    def test_close(self):
+        model = _model()
+        parallel = DataParallel(model, CrossEntropyLoss(), optim.SGD, workers=2)
+        assert model._flat_parameters.base is not None
+        parallel.close()
+        parallel.close()
+
+        assert model._flat_parameters.base is None
+        self.assertRaises(RuntimeError, parallel.step, *_batch(4))
+        model.forward(Tensor(_batch(4)[0]))
+
+    def test_worker_error(self):
+        parallel = DataParallel(_model(), CrossEntropyLoss(), optim.SGD, workers=2)
+        x, y = _batch(4)
+        self.assertRaises(ValueError, parallel.step, x, y[:2])
+        processes = parallel._processes
+        self.assertRaises(RuntimeError, parallel.step, x[:, :3], y)
+        assert parallel._processes is None
+        assert not any(p.is_alive() for p in processes)
+
+    def test_worker_died(self):
+        parallel = DataParallel(_model(), _crash, optim.SGD, workers=2)
+        blocks = [parallel._params_block.name, parallel._grads_block.name]
+        start = time.monotonic()
+        with self.assertRaisesRegex(RuntimeError, 'exit code 3'):
+            parallel.step(*_batch(3))
+
+        assert time.monotonic() - start < 10.0
+        assert parallel._processes is None
+        for name in blocks:
+            self.assertRaises(FileNotFoundError, shared_memory.SharedMemory, name)
+
+    def test_worker_dead(self):
+        parallel = DataParallel(_model(), CrossEntropyLoss(), optim.SGD, workers=2)
+        parallel._processes[1].terminate()
+        parallel._processes[1].join()
+        self.assertRaises(RuntimeError, parallel.step, *_batch(4))
+        assert parallel._processes is None
+
+    def test_version(self):
+        model = _model()
+        with DataParallel(model, CrossEntropyLoss(), optim.SGD, workers=2) as parallel:
+            versions = [p._version for p in model.parameters()]
+            parallel.step(*_batch(4))
+            assert all(p._version > v for p, v in zip(model.parameters(), versions))
@@ -0,0 +1,153 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Neurocode
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# File created: 2026-10-18
+# Last updated: 2026-10-18
+#
+
+import os
+import json
+import struct
+import tempfile
+import numpy as np
+import unittest
+import leaf
+from leaf import Tensor, nn
+from leaf.serialization import MAGIC, ALIGNMENT
+
+def _model():
+    return nn.Sequential(nn.Linear(8, 16), nn.ReLU(), nn.Linear(16, 4, bias=False))
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._directory.name, 'model.leaf')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_named_parameters(self):
+        model = nn.Sequential(_model(), nn.Conv2d(1, 2, 3))
+        names = [name for name, _ in model.named_parameters()]
+        assert names == ['0.0.weights', '0.0.bias', '0.2.weights', '1.weights', '1.bias']
+        assert [p for _, p in model.named_parameters()] == model.parameters()
+        assert list(model.state_dict()) == names
+
+    def test_roundtrip(self):
+        model = _model()
+        leaf.save(model, self.path)
+        for mmap in (True, False):
+            state = leaf.load(self.path, mmap=mmap)
+            assert list(state) == list(model.state_dict())
+            for name, array in model.state_dict().items():
+                assert isinstance(state[name], Tensor) and not state[name].requires_grad
+                np.testing.assert_array_equal(state[name].data, array)
+
+        arrays = {
+            'half': np.random.uniform(size=(3, 5)).astype(np.float16),
+            'long': np.arange(7, dtype=np.int64),
+            'scalar': np.array(2.5),
+            'empty': np.zeros((0, 3), dtype=np.float32),
+            'strided': np.random.uniform(size=(4, 6)).astype(np.float32)[:, ::2],
+        }
+        leaf.save(arrays, self.path)
+        state = leaf.load(self.path)
+        for name, array in arrays.items():
+            assert state[name].dtype == array.dtype and state[name].shape == array.shape
+            np.testing.assert_array_equal(state[name].data, array)
+
+    def test_format(self):
+        leaf.save({'a': np.ones(3, dtype=np.float32), 'b': np.ones(5, dtype=np.int8)}, self.path)
+        with open(self.path, 'rb') as f:
+            assert f.read(len(MAGIC)) == MAGIC
+            length, = struct.unpack('<Q', f.read(8))
+            header = json.loads(f.read(length))
+
+        assert header['a'] == {'dtype': '<f4', 'shape': [3], 'offset': header['a']['offset'], 'nbytes': 12}
+        assert all(entry['offset'] % ALIGNMENT == 0 for entry in header.values())
+        assert header['b']['offset'] + 5 == os.path.getsize(self.path)
+
+        with open(self.path, 'r+b') as f:
+            f.write(b'NOPE')
+        self.assertRaises(ValueError, leaf.load, self.path)
+
+    def test_mmap(self):
+        leaf.save(_model(), self.path)
+        state = leaf.load(self.path)
+        weights = state['0.weights'].data
+        assert not weights.flags.owndata
+        assert weights.ctypes.data % ALIGNMENT == 0
+
+        # Writes are copy on write, the file is left untouched.
+        expected = weights.copy()
+        weights[0, 0] += 1.0
+        np.testing.assert_array_equal(leaf.load(self.path)['0.weights'].data, expected)
+
+        # Saving over a checkpoint does not change one that is still mapped.
+        leaf.save({'0.weights': np.zeros((8, 16))}, self.path)
+        np.testing.assert_array_equal(state['0.bias'].data.shape, (16, ))
+        np.testing.assert_array_equal(state['0.weights'].data[1:], expected[1:])
+        del state, weights
+
+    def test_load_state_dict(self):
+        model, other = _model(), _model()
+        leaf.save(model, self.path)
+        other.load_state_dict(leaf.load(self.path))
+        x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 8)))
+        np.testing.assert_array_equal(model(x).data, other(x).data)
+        assert not other._modules[0]._weights.data.flags.owndata
+
+        flat = nn.Sequential(*_model()._modules, flat=True)
+        buffer = flat._flat_parameters
+        flat.load_state_dict(leaf.load(self.path))
+        assert all(np.shares_memory(p.data, buffer) for p in flat.parameters())
+        np.testing.assert_array_equal(model(x).data, flat(x).data)
+
+        state = model.state_dict()
+        del state['2.weights']
+        self.assertRaises(ValueError, other.load_state_dict, state)
+        other.load_state_dict(state, strict=False)
+        state['0.weights'] = np.zeros((2, 2))
+        self.assertRaises(ValueError, other.load_state_dict, state, strict=False)
+
+    def test_resume(self):
+        model, trained = _model(), _model()
+        for multi_tensor in (True, False):
+            optimizer = leaf.optim.SGD(model.parameters(), lr=0.1, multi_tensor=multi_tensor)
+            leaf.save(trained, self.path)
+            model.load_state_dict(leaf.load(self.path))
+            for p, q in zip(model.parameters(), trained.parameters()):
+                np.testing.assert_array_equal(p.data, q.data)
+
+            x = Tensor(np.random.uniform(-1.0, 1.0, size=(3, 8)))
+            optimizer.zero_grad()
+            model(x).sum().backward()
+            expected = [p.data - 0.1 * p.grad for p in model.parameters()]
+            optimizer.step()
+            for p, value in zip(model.parameters(), expected):
+                np.testing.assert_allclose(p.data, value, rtol=1e-6)
+
+            # The optimizer is stepping the parameters the module holds.
+            if multi_tensor:
+                assert all(np.shares_memory(p.data, optimizer._flat) for p in model.parameters())
+            trained = _model()
@@ -25,6 +25,8 @@
 # Last updated: 2023-01-13
 #
 
+import os
+import tempfile
 import numpy as np
 import unittest
 from leaf import Tensor
@@ -50,3 +52,35 @@ class TestTensor(unittest.TestCase):
         assert t1.dtype == np.int16
         assert t2.dtype == np.float32
 
+    def test_copy(self):
+        data = np.ones((3, 4), dtype=np.float32)
+
+        assert not np.shares_memory(Tensor(data).data, data)
+        assert Tensor(data, copy=False).data is data
+        assert not np.shares_memory(Tensor(data.astype(np.float64), copy=False).data, data)
+
+        t = Tensor.from_numpy(data.astype(np.int16))
+        assert t.dtype == np.int16
+
+        detached = Tensor(data, copy=False).detach()
+        assert detached.data is data
+
+    def test_array_interop(self):
+        data = np.random.uniform(size=(3, 4)).astype(np.float32)
+        t = Tensor(data, copy=False)
+
+        assert np.asarray(t) is data
+        assert np.asarray(t, dtype=np.float64).dtype == np.float64
+        assert np.shares_memory(Tensor(memoryview(data), copy=False).data, data)
+        np.testing.assert_array_equal(memoryview(t.__buffer__(0)), data)
+
+    def test_memmap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'batch.npy')
+            np.save(path, np.arange(12, dtype=np.float32).reshape(3, 4))
+
+            batch = np.load(path, mmap_mode='r')
+            t = Tensor.from_numpy(batch)
+            assert np.shares_memory(t.data, batch)
+            np.testing.assert_array_equal(t.data, batch)
+            del t, batch